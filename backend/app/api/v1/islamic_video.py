@@ -24,6 +24,7 @@ from ...video_generation.islamic_video_generator import (
 )
 from ...core.auth import get_current_user_optional
 from ...core.rate_limiting import rate_limit
+from ...core.concurrency import concurrent_limit
 from ...db.database import get_db
 
 # Monitoring
@@ -135,7 +136,11 @@ async def get_video_generator() -> IslamicVideoGenerator:
     
     return video_generator
 
-@router.post("/generate", response_model=VideoGenerationResponse)
+@router.post(
+    "/generate",
+    response_model=VideoGenerationResponse,
+    dependencies=[Depends(concurrent_limit("video"))]
+)
 @rate_limit(calls=10, period=3600)  # 10 video generations per hour
 async def generate_islamic_video(
     request: VideoGenerationRequest,
@@ -354,7 +359,7 @@ async def get_video_templates(
         logger.error(f"Error fetching templates: {e}")
         raise HTTPException(status_code=500, detail="Error fetching templates")
 
-@router.post("/generate-from-template")
+@router.post("/generate-from-template", dependencies=[Depends(concurrent_limit("video"))])
 @rate_limit(calls=15, period=3600)  # 15 template-based generations per hour
 async def generate_video_from_template(
     template_id: str = Form(...),
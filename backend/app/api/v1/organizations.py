@@ -5,10 +5,11 @@ CRUD operations for organizations, settings, and plan management
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update, bindparam, tuple_
 from pydantic import BaseModel, validator
 from typing import Optional, List
 from datetime import datetime
+import re
 import uuid
 
 from app.db.database import get_db
@@ -20,11 +21,40 @@ from app.core.deps import (
     get_org_admin_or_super,
     get_pagination_params,
 )
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.permissions import Plan, is_plan_upgrade
 
 
 router = APIRouter()
 
+# Runs of anything that is not a lowercase letter or digit collapse to "-"
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+# ============================================================================
+# PRECOMPILED STATEMENTS
+# ============================================================================
+# Built once at import time so SQLAlchemy's compiled-statement cache stays warm;
+# per-request values are supplied through bind parameters.
+
+_USER_COUNT_SUBQ = select(func.count(User.id)).where(
+    User.organization_id == Organization.id
+).correlate(Organization).scalar_subquery()
+
+_ORG_BY_ID = select(Organization).where(Organization.id == bindparam("oid"))
+
+_ORG_WITH_USER_COUNT_BY_ID = select(
+    Organization, _USER_COUNT_SUBQ.label("user_count")
+).where(Organization.id == bindparam("oid"))
+
+_USER_COUNT_BY_ORG = select(func.count(User.id)).where(
+    User.organization_id == bindparam("oid")
+)
+
+_SLUG_EXISTS = select(
+    select(Organization.id).where(Organization.slug == bindparam("slug")).exists()
+)
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -110,6 +140,7 @@ class OrganizationListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 class PlanUpdateRequest(BaseModel):
@@ -143,16 +174,16 @@ async def create_organization(
     if request.slug:
         slug = request.slug
     else:
-        base_slug = request.name.lower().replace(" ", "-").replace("_", "-")
+        base_slug = _SLUG_RE.sub("-", request.name.lower()).strip("-")
         slug = base_slug
         counter = 1
 
-        while db.query(Organization).filter(Organization.slug == slug).first():
+        while db.execute(_SLUG_EXISTS, {"slug": slug}).scalar():
             slug = f"{base_slug}-{counter}"
             counter += 1
 
     # Check slug uniqueness
-    if db.query(Organization).filter(Organization.slug == slug).first():
+    if db.execute(_SLUG_EXISTS, {"slug": slug}).scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Organization with slug '{slug}' already exists"
@@ -173,7 +204,6 @@ async def create_organization(
         subscription_status="active",
         is_active=True,
         is_verified=False,
-        created_at=datetime.utcnow(),
     )
 
     db.add(organization)
@@ -211,12 +241,14 @@ async def list_organizations(
     plan: Optional[str] = Query(None, description="Filter by plan"),
     country: Optional[str] = Query(None, description="Filter by country"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    after: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     db: Session = Depends(get_db)
 ):
     """
     List all organizations (super admin only)
 
     - Supports pagination, search, and filtering
+    - Pass `after` for keyset pagination; otherwise `skip` is used as an offset
     - Returns organization count per org
     """
     query = db.query(Organization)
@@ -242,10 +274,18 @@ async def list_organizations(
     # Get total count
     total = query.count()
 
-    # Apply pagination
-    organizations = query.order_by(Organization.created_at.desc()).offset(
-        pagination["skip"]
-    ).limit(pagination["limit"]).all()
+    # Apply pagination (seek past the cursor when given, offset otherwise)
+    query = query.order_by(Organization.created_at.desc(), Organization.id.desc())
+
+    if after:
+        after_created_at, after_id = decode_cursor(after)
+        query = query.filter(
+            tuple_(Organization.created_at, Organization.id) < tuple_(after_created_at, after_id)
+        )
+    else:
+        query = query.offset(pagination["skip"])
+
+    organizations = query.limit(pagination["limit"]).all()
 
     # Get user counts for each organization
     org_ids = [org.id for org in organizations]
@@ -282,11 +322,16 @@ async def list_organizations(
             user_count=user_count_map.get(str(org.id), 0)
         ))
 
+    next_cursor = None
+    if len(organizations) == pagination["limit"]:
+        next_cursor = encode_cursor(organizations[-1].created_at, organizations[-1].id)
+
     return OrganizationListResponse(
         organizations=org_responses,
         total=total,
         skip=pagination["skip"],
-        limit=pagination["limit"]
+        limit=pagination["limit"],
+        next_cursor=next_cursor
     )
 
 
@@ -299,8 +344,8 @@ async def get_my_organization(
     Get current user's organization details
     """
     # Get user count
-    user_count = db.query(func.count(User.id)).filter(
-        User.organization_id == organization.id
+    user_count = db.execute(
+        _USER_COUNT_BY_ORG, {"oid": organization.id}
     ).scalar()
 
     return OrganizationResponse(
@@ -336,20 +381,18 @@ async def get_organization(
     """
     Get organization by ID (super admin only)
     """
-    organization = db.query(Organization).filter(
-        Organization.id == organization_id
+    # Fetch organization and its user count in a single round-trip
+    row = db.execute(
+        _ORG_WITH_USER_COUNT_BY_ID, {"oid": organization_id}
     ).first()
 
-    if not organization:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
         )
 
-    # Get user count
-    user_count = db.query(func.count(User.id)).filter(
-        User.organization_id == organization.id
-    ).scalar()
+    organization, user_count = row
 
     return OrganizationResponse(
         id=str(organization.id),
@@ -391,8 +434,6 @@ async def update_my_organization(
     for field, value in update_data.items():
         setattr(organization, field, value)
 
-    organization.updated_at = datetime.utcnow()
-
     db.commit()
     db.refresh(organization)
 
@@ -429,15 +470,14 @@ async def update_social_links(
     """
     Update organization social media links
     """
-    # Get existing social links or create new dict
-    social_links = organization.social_links or {}
+    # Copy existing social links (or start a new dict) so the JSON column is marked dirty
+    social_links = dict(organization.social_links or {})
 
     # Update with new values
     update_data = request.dict(exclude_unset=True)
     social_links.update(update_data)
 
     organization.social_links = social_links
-    organization.updated_at = datetime.utcnow()
 
     db.commit()
 
@@ -458,9 +498,9 @@ async def update_organization_plan(
     """
     Update organization plan (super admin only)
     """
-    organization = db.query(Organization).filter(
-        Organization.id == organization_id
-    ).first()
+    organization = db.execute(
+        _ORG_BY_ID, {"oid": organization_id}
+    ).scalar_one_or_none()
 
     if not organization:
         raise HTTPException(
@@ -470,7 +510,6 @@ async def update_organization_plan(
 
     old_plan = organization.plan
     organization.plan = request.plan
-    organization.updated_at = datetime.utcnow()
 
     db.commit()
 
@@ -493,19 +532,20 @@ async def activate_organization(
     """
     Activate organization (super admin only)
     """
-    organization = db.query(Organization).filter(
-        Organization.id == organization_id
-    ).first()
+    # Single UPDATE; updated_at is refreshed by the column's onupdate
+    result = db.execute(
+        update(Organization)
+        .where(Organization.id == organization_id)
+        .values(is_active=True)
+        .execution_options(synchronize_session=False)
+    )
 
-    if not organization:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
         )
 
-    organization.is_active = True
-    organization.updated_at = datetime.utcnow()
-
     db.commit()
 
     return {
@@ -523,19 +563,20 @@ async def deactivate_organization(
     """
     Deactivate organization (super admin only)
     """
-    organization = db.query(Organization).filter(
-        Organization.id == organization_id
-    ).first()
+    # Single UPDATE; updated_at is refreshed by the column's onupdate
+    result = db.execute(
+        update(Organization)
+        .where(Organization.id == organization_id)
+        .values(is_active=False)
+        .execution_options(synchronize_session=False)
+    )
 
-    if not organization:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Organization not found"
         )
 
-    organization.is_active = False
-    organization.updated_at = datetime.utcnow()
-
     db.commit()
 
     return {
@@ -555,9 +596,9 @@ async def delete_organization(
 
     WARNING: This will cascade delete all users, generations, and data!
     """
-    organization = db.query(Organization).filter(
-        Organization.id == organization_id
-    ).first()
+    organization = db.execute(
+        _ORG_BY_ID, {"oid": organization_id}
+    ).scalar_one_or_none()
 
     if not organization:
         raise HTTPException(
@@ -566,8 +607,8 @@ async def delete_organization(
         )
 
     # Get counts before deletion
-    user_count = db.query(func.count(User.id)).filter(
-        User.organization_id == organization.id
+    user_count = db.execute(
+        _USER_COUNT_BY_ORG, {"oid": organization.id}
     ).scalar()
 
     org_name = organization.name
@@ -601,8 +642,8 @@ async def get_organization_stats(
     )
 
     # Count users
-    user_count = db.query(func.count(User.id)).filter(
-        User.organization_id == organization.id
+    user_count = db.execute(
+        _USER_COUNT_BY_ORG, {"oid": organization.id}
     ).scalar()
 
     # Count generations
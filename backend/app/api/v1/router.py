@@ -3,74 +3,81 @@ Main API router for Global Waqaf Tech v2
 Multi-tenant platform with authentication and role-based access
 """
 
+import importlib
+
 from fastapi import APIRouter
-from app.api.v1 import (
-    auth,
-    organizations,
-    users,
-    duas_multitenant,
-    stories_multitenant,
-    grants,
-    marketplace,
-    learning_hub,
-    social_studio,
-    umrah_hajj,
-    islamic_content,
-    chat,
-    islamic_chat,
-    simple_chat
-)
+
+from app.core.config import settings
 
 api_router = APIRouter()
 
+# Each entry is (module name in app.api.v1, URL prefix, OpenAPI tag).
+# Route modules are imported by name when the router is assembled, so this
+# file does not pull every feature module into its own import graph.
+
 # ============================================================================
 # CORE PLATFORM ROUTES (Multi-tenant)
 # ============================================================================
 
-# Authentication & Authorization
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
-
-# Organization Management
-api_router.include_router(organizations.router, prefix="/organizations", tags=["organizations"])
-
-# User Management
-api_router.include_router(users.router, prefix="/users", tags=["users"])
+_CORE_ROUTES = (
+    # Authentication & Authorization
+    ("auth", "/auth", "authentication"),
+    # Organization Management
+    ("organizations", "/organizations", "organizations"),
+    # User Management
+    ("users", "/users", "users"),
+)
 
 
 # ============================================================================
 # FEATURE MODULES (Multi-tenant)
 # ============================================================================
 
-# Du'a & Dhikr Studio
-api_router.include_router(duas_multitenant.router, prefix="/duas", tags=["dua-studio"])
-
-# Kids Story Studio
-api_router.include_router(stories_multitenant.router, prefix="/stories", tags=["story-studio"])
+_FEATURE_ROUTES = (
+    # Du'a & Dhikr Studio
+    ("duas_multitenant", "/duas", "dua-studio"),
+    # Kids Story Studio
+    ("stories_multitenant", "/stories", "story-studio"),
+    # Grant Finder
+    ("grants", "/grants", "grant-finder"),
+    # Marketplace
+    ("marketplace", "/marketplace", "marketplace"),
+    # Learning Hub
+    ("learning_hub", "/learning", "learning-hub"),
+    # Social Media Studio
+    ("social_studio", "/social", "social-studio"),
+    # Umrah & Hajj Alerts
+    ("umrah_hajj", "/umrah", "umrah-hajj"),
+)
 
-# Grant Finder
-api_router.include_router(grants.router, prefix="/grants", tags=["grant-finder"])
 
-# Marketplace
-api_router.include_router(marketplace.router, prefix="/marketplace", tags=["marketplace"])
+# ============================================================================
+# LEGACY ROUTES (To be refactored for multi-tenancy)
+# ============================================================================
 
-# Learning Hub
-api_router.include_router(learning_hub.router, prefix="/learning", tags=["learning-hub"])
+_LEGACY_ROUTES = (
+    # Islamic Content (Keep for backward compatibility)
+    ("islamic_content", "/content", "islamic-content"),
+)
 
-# Social Media Studio
-api_router.include_router(social_studio.router, prefix="/social", tags=["social-studio"])
+# Chat endpoints (To be refactored) - only imported when ENABLE_LEGACY_CHAT is set
+_LEGACY_CHAT_ROUTES = (
+    ("chat", "/chat", "budul-gpt"),
+    ("islamic_chat", "/islamic-chat", "islamic-ai"),
+    ("simple_chat", "/budul-ai", "budul-ai-trained"),
+)
 
-# Umrah & Hajj Alerts
-api_router.include_router(umrah_hajj.router, prefix="/umrah", tags=["umrah-hajj"])
 
+def _include_routes(routes) -> None:
+    """Import each route module by name and mount its router"""
+    for name, prefix, tag in routes:
+        module = importlib.import_module(f"app.api.v1.{name}")
+        api_router.include_router(module.router, prefix=prefix, tags=[tag])
 
-# ============================================================================
-# LEGACY ROUTES (To be refactored for multi-tenancy)
-# ============================================================================
 
-# Islamic Content (Keep for backward compatibility)
-api_router.include_router(islamic_content.router, prefix="/content", tags=["islamic-content"])
+_include_routes(_CORE_ROUTES)
+_include_routes(_FEATURE_ROUTES)
+_include_routes(_LEGACY_ROUTES)
 
-# Chat endpoints (To be refactored)
-api_router.include_router(chat.router, prefix="/chat", tags=["budul-gpt"])
-api_router.include_router(islamic_chat.router, prefix="/islamic-chat", tags=["islamic-ai"])
-api_router.include_router(simple_chat.router, prefix="/budul-ai", tags=["budul-ai-trained"])
\ No newline at end of file
+if settings.ENABLE_LEGACY_CHAT:  # pragma: no cover
+    _include_routes(_LEGACY_CHAT_ROUTES)
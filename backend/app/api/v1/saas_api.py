@@ -4,8 +4,12 @@ Unified API endpoints for the complete Islamic AI SaaS platform
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from fastapi.responses import RedirectResponse
-from typing import Dict, List, Optional, Any
+from fastapi.responses import RedirectResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Annotated, Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+import gzip
+import orjson
 
 # Import all SaaS components
 from .islamic_chat import router as chat_router
@@ -13,119 +17,413 @@ from .islamic_video import router as video_router
 from .saas_dashboard import router as dashboard_router
 
 # Core services
-from ...core.saas_platform import saas_platform, SubscriptionTier
+from ...core.saas_platform import saas_platform, SubscriptionTier, SUBSCRIPTION_TIERS
 from ...core.enterprise_sso import enterprise_sso_manager, SSOProvider
+from ...core.http_cache import cacheable_json_response, etag
 from ...core.auth import get_current_user_optional
+from ...core.cache import redis_cached
+from ...core.concurrency import concurrent_limit
+from ...core.rate_limit import rate_limit
 
 # Monitoring
 import structlog
-from prometheus_client import Counter, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import REGISTRY, generate_latest, CONTENT_TYPE_LATEST
+
+# Models
+class OrganizationCreateRequest(BaseModel):
+    """Organization signup payload"""
+    model_config = ConfigDict(extra="ignore")
+
+    name: str
+    billing_email: str
+    description: Optional[str] = None
+    website: Optional[str] = None
+    industry: Optional[str] = None
+    country: Optional[str] = None
+
+class SSOConfigureRequest(BaseModel):
+    """Enterprise SSO configuration payload"""
+    model_config = ConfigDict(extra="ignore")
+
+    provider: str
+    config: Dict[str, Any]
+
+# Authenticated caller's user id (None when the token is invalid)
+CurrentUserId = Annotated[Optional[str], Depends(get_current_user_optional)]
 
 # Main SaaS API router
-router = APIRouter(prefix="/api/v1", tags=["Islamic AI SaaS Platform"])
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["Islamic AI SaaS Platform"],
+    default_response_class=ORJSONResponse
+)
 logger = structlog.get_logger(__name__)
 
-# Metrics
-platform_requests_counter = Counter('islamic_ai_platform_requests_total', 'Total platform requests')
-
 # Include all service routers
 router.include_router(chat_router)
 router.include_router(video_router)
 router.include_router(dashboard_router)
 
-@router.get("/")
-async def platform_info():
-    """
-    Islamic AI Platform Information
-    
-    Returns comprehensive information about the Islamic AI SaaS platform.
-    """
-    platform_requests_counter.inc()
-    
-    return {
-        "platform": "Budul AI - Islamic AI Platform",
-        "description": "The definitive Islamic AI platform serving 1.8 billion Muslims worldwide",
-        "version": "1.0.0",
-        "services": {
-            "islamic_chat": {
-                "description": "Advanced Islamic AI chat with scholarly verification",
-                "endpoints": ["/chat", "/chat/stream", "/chat/ws/{user_id}/{session_id}"],
-                "features": [
-                    "Real-time Islamic Q&A",
-                    "Scholarly citations",
-                    "Multi-madhab support",
-                    "Arabic text processing",
-                    "Prayer times & Qibla direction"
-                ]
-            },
-            "video_generation": {
-                "description": "Islamic video generation with AI-powered content creation",
-                "endpoints": ["/video/generate", "/video/templates", "/video/library"],
-                "features": [
-                    "Text-to-Islamic video",
-                    "Arabic calligraphy integration",
-                    "Geometric pattern backgrounds",
-                    "Halal audio synthesis",
-                    "Cultural customization"
-                ]
-            },
-            "saas_platform": {
-                "description": "Enterprise SaaS platform with tiered access and billing",
-                "endpoints": ["/dashboard", "/billing", "/analytics"],
-                "features": [
-                    "Subscription management",
-                    "Usage analytics",
-                    "API key management",
-                    "White-label customization",
-                    "Enterprise SSO"
-                ]
+# ============================================================================
+# STATIC PAYLOADS
+# ============================================================================
+# These responses never change at runtime, so they are built and serialized
+# once at import time instead of on every request.
+
+_PLATFORM_INFO = {
+    "platform": "Budul AI - Islamic AI Platform",
+    "description": "The definitive Islamic AI platform serving 1.8 billion Muslims worldwide",
+    "version": "1.0.0",
+    "services": {
+        "islamic_chat": {
+            "description": "Advanced Islamic AI chat with scholarly verification",
+            "endpoints": ["/chat", "/chat/stream", "/chat/ws/{user_id}/{session_id}"],
+            "features": [
+                "Real-time Islamic Q&A",
+                "Scholarly citations",
+                "Multi-madhab support",
+                "Arabic text processing",
+                "Prayer times & Qibla direction"
+            ]
+        },
+        "video_generation": {
+            "description": "Islamic video generation with AI-powered content creation",
+            "endpoints": ["/video/generate", "/video/templates", "/video/library"],
+            "features": [
+                "Text-to-Islamic video",
+                "Arabic calligraphy integration",
+                "Geometric pattern backgrounds",
+                "Halal audio synthesis",
+                "Cultural customization"
+            ]
+        },
+        "saas_platform": {
+            "description": "Enterprise SaaS platform with tiered access and billing",
+            "endpoints": ["/dashboard", "/billing", "/analytics"],
+            "features": [
+                "Subscription management",
+                "Usage analytics",
+                "API key management",
+                "White-label customization",
+                "Enterprise SSO"
+            ]
+        }
+    },
+    "subscription_tiers": {
+        "free": {
+            "price": "$0/month",
+            "api_calls": "1,000/month",
+            "video_generations": "5/month",
+            "features": ["Basic Islamic chat", "Community support"]
+        },
+        "developer": {
+            "price": "$49/month",
+            "api_calls": "25,000/month",
+            "video_generations": "50/month",
+            "features": ["Advanced chat", "Bulk processing", "Priority support"]
+        },
+        "professional": {
+            "price": "$199/month",
+            "api_calls": "100,000/month",
+            "video_generations": "200/month",
+            "features": ["Custom models", "White-label", "Advanced analytics"]
+        },
+        "enterprise": {
+            "price": "$999/month",
+            "api_calls": "1,000,000/month",
+            "video_generations": "1,000/month",
+            "features": ["Unlimited features", "SSO", "Dedicated support", "SLA"]
+        }
+    },
+    "getting_started": {
+        "step_1": "Sign up for free account",
+        "step_2": "Get API key from dashboard",
+        "step_3": "Start building with Islamic AI",
+        "documentation": "/docs",
+        "examples": "/examples"
+    },
+    "support": {
+        "documentation": "https://docs.budul.ai",
+        "github": "https://github.com/budul-ai/islamic-ai",
+        "email": "support@budul.ai",
+        "discord": "https://discord.gg/budul-ai"
+    }
+}
+
+_API_EXAMPLES = {
+    "chat_examples": {
+        "basic_question": {
+            "description": "Ask a basic Islamic question",
+            "request": {
+                "method": "POST",
+                "url": "/api/v1/chat",
+                "headers": {
+                    "Authorization": "Bearer budul_your_api_key",
+                    "Content-Type": "application/json"
+                },
+                "body": {
+                    "message": "What are the five pillars of Islam?",
+                    "context": {
+                        "knowledge_level": "intermediate",
+                        "madhab": "hanafi"
+                    }
+                }
             }
         },
-        "subscription_tiers": {
-            "free": {
-                "price": "$0/month",
-                "api_calls": "1,000/month",
-                "video_generations": "5/month",
-                "features": ["Basic Islamic chat", "Community support"]
-            },
-            "developer": {
-                "price": "$49/month",
-                "api_calls": "25,000/month",
-                "video_generations": "50/month",
-                "features": ["Advanced chat", "Bulk processing", "Priority support"]
+        "streaming_chat": {
+            "description": "Stream Islamic AI responses",
+            "request": {
+                "method": "POST",
+                "url": "/api/v1/chat/stream",
+                "headers": {
+                    "Authorization": "Bearer budul_your_api_key",
+                    "Content-Type": "application/json"
+                },
+                "body": {
+                    "message": "Explain the concept of Tawheed in detail",
+                    "stream": True
+                }
+            }
+        }
+    },
+    "video_examples": {
+        "generate_video": {
+            "description": "Generate Islamic educational video",
+            "request": {
+                "method": "POST",
+                "url": "/api/v1/video/generate",
+                "headers": {
+                    "Authorization": "Bearer budul_your_api_key",
+                    "Content-Type": "application/json"
+                },
+                "body": {
+                    "text_content": "The importance of prayer in Islam and its spiritual benefits",
+                    "title": "Islamic Prayer Guide",
+                    "duration_seconds": 60,
+                    "style": "modern",
+                    "include_arabic_text": True,
+                    "cultural_style": "general"
+                }
+            }
+        }
+    },
+    "dashboard_examples": {
+        "get_usage": {
+            "description": "Get organization usage statistics",
+            "request": {
+                "method": "GET",
+                "url": "/api/v1/dashboard/usage?period=month",
+                "headers": {
+                    "Authorization": "Bearer budul_your_api_key"
+                }
+            }
+        }
+    },
+    "code_examples": {
+        "python": """
+import requests
+
+# Initialize Budul AI client
+api_key = "budul_your_api_key"
+base_url = "https://api.budul.ai/v1"
+
+# Ask Islamic question
+def ask_islamic_question(question):
+    response = requests.post(
+        f"{base_url}/chat",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={"message": question}
+    )
+    return response.json()
+
+# Generate Islamic video
+def generate_islamic_video(content):
+    response = requests.post(
+        f"{base_url}/video/generate",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={
+            "text_content": content,
+            "duration_seconds": 30,
+            "style": "modern"
+        }
+    )
+    return response.json()
+
+# Example usage
+answer = ask_islamic_question("What is the significance of Ramadan?")
+video = generate_islamic_video("The benefits of reading Quran daily")
+            """,
+        "javascript": """
+const axios = require('axios');
+
+class BudulAI {
+  constructor(apiKey) {
+    this.apiKey = apiKey;
+    this.baseURL = 'https://api.budul.ai/v1';
+    this.headers = {
+      'Authorization': `Bearer ${apiKey}`,
+      'Content-Type': 'application/json'
+    };
+  }
+
+  async askQuestion(message, context = {}) {
+    const response = await axios.post(
+      `${this.baseURL}/chat`,
+      { message, context },
+      { headers: this.headers }
+    );
+    return response.data;
+  }
+
+  async generateVideo(textContent, options = {}) {
+    const response = await axios.post(
+      `${this.baseURL}/video/generate`,
+      { text_content: textContent, ...options },
+      { headers: this.headers }
+    );
+    return response.data;
+  }
+}
+
+// Example usage
+const budul = new BudulAI('budul_your_api_key');
+const answer = await budul.askQuestion('Explain Islamic finance principles');
+const video = await budul.generateVideo('Islamic ethics in business');
+            """
+    },
+    "sdks": {
+        "python": "pip install budul-ai",
+        "javascript": "npm install @budul/ai",
+        "php": "composer require budul/ai",
+        "ruby": "gem install budul-ai",
+        "go": "go get github.com/budul-ai/go-sdk"
+    }
+}
+
+# Provider value -> enum member, so lookups skip Enum's by-value search
+_SSO_PROVIDER_BY_VALUE = {p.value: p for p in SSOProvider}
+
+# Tiers allowed to configure enterprise features such as SSO
+_ENTERPRISE_TIERS = frozenset({SubscriptionTier.ENTERPRISE})
+
+def _build_tiers_payload() -> Dict[str, Any]:
+    """Build the public subscription tier table from SUBSCRIPTION_TIERS"""
+    tiers_info = {}
+    for tier, limits in SUBSCRIPTION_TIERS.items():
+        tiers_info[tier.value] = {
+            "name": limits.name,
+            "monthly_price": float(limits.monthly_price_usd),
+            "yearly_price": float(limits.yearly_price_usd),
+            "limits": {
+                "monthly_api_calls": limits.monthly_api_calls,
+                "daily_api_calls": limits.daily_api_calls,
+                "video_generations_monthly": limits.video_generations_monthly,
+                "max_concurrent_requests": limits.max_concurrent_requests,
+                "rate_limit_per_minute": limits.rate_limit_per_minute
             },
-            "professional": {
-                "price": "$199/month",
-                "api_calls": "100,000/month",
-                "video_generations": "200/month",
-                "features": ["Custom models", "White-label", "Advanced analytics"]
+            "features": {
+                "custom_models": limits.custom_models,
+                "priority_support": limits.priority_support,
+                "white_label": limits.white_label,
+                "advanced_analytics": limits.advanced_analytics,
+                "bulk_processing": limits.bulk_processing
             },
-            "enterprise": {
-                "price": "$999/month",
-                "api_calls": "1,000,000/month",
-                "video_generations": "1,000/month",
-                "features": ["Unlimited features", "SSO", "Dedicated support", "SLA"]
-            }
-        },
-        "getting_started": {
-            "step_1": "Sign up for free account",
-            "step_2": "Get API key from dashboard",
-            "step_3": "Start building with Islamic AI",
-            "documentation": "/docs",
-            "examples": "/examples"
-        },
-        "support": {
-            "documentation": "https://docs.budul.ai",
-            "github": "https://github.com/budul-ai/islamic-ai",
-            "email": "support@budul.ai",
-            "discord": "https://discord.gg/budul-ai"
+            "sla_uptime": limits.sla_uptime,
+            "permissions": [perm.value for perm in limits.permissions]
         }
+
+    return {
+        "tiers": tiers_info,
+        "recommended": "professional",
+        "most_popular": "developer",
+        "enterprise_contact": "sales@budul.ai"
     }
 
-@router.post("/organizations")
+_PLATFORM_INFO_BYTES = orjson.dumps(_PLATFORM_INFO)
+_PLATFORM_INFO_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": etag(_PLATFORM_INFO_BYTES),
+}
+_API_EXAMPLES_BYTES = orjson.dumps(_API_EXAMPLES)
+
+# /examples is compressed once per process and served from memory; each
+# encoding is a separate representation, so each gets its own strong ETag
+_API_EXAMPLES_GZ_BYTES = gzip.compress(_API_EXAMPLES_BYTES, 6)
+_API_EXAMPLES_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": etag(_API_EXAMPLES_BYTES),
+    "Vary": "Accept-Encoding",
+}
+_API_EXAMPLES_GZ_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": etag(_API_EXAMPLES_GZ_BYTES),
+    "Vary": "Accept-Encoding",
+}
+
+_HEALTH_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=30"
+
+@lru_cache(maxsize=1)
+def _subscription_tiers_cached() -> Tuple[bytes, Dict[str, str]]:
+    """
+    Serialized tier table and its caching headers, built on first use.
+
+    Call ``_subscription_tiers_cached.cache_clear()`` after editing pricing
+    so the next request rebuilds it.
+    """
+    body = orjson.dumps(_build_tiers_payload())
+    return body, {"Cache-Control": "public, max-age=300", "ETag": etag(body)}
+
+async def get_request_org_tier(request: Request, organization_id: str) -> Dict[str, Any]:
+    """Resolve an organization's tier at most once per request (memoized on request.state)"""
+    tier_cache = getattr(request.state, "org_tier_cache", None)
+    if tier_cache is None:
+        tier_cache = request.state.org_tier_cache = {}
+
+    if organization_id not in tier_cache:
+        tier_info = await saas_platform._get_organization_tier(organization_id)
+        tier_cache[organization_id] = tier_info
+
+    return tier_cache[organization_id]
+
+async def prefetch_auth_and_tier(request: Request, organization_id: str) -> None:
+    """
+    Seed request.state with the cached API key auth record and organization
+    tier using a single Redis MGET, so later lookups in the request are free
+    """
+    authorization = request.headers.get("authorization", "")
+    if saas_platform.redis_client is None or not authorization.startswith("Bearer "):
+        return
+
+    auth_data, tier_info = await saas_platform.get_cached_auth_and_tier(
+        authorization[len("Bearer "):], organization_id
+    )
+    request.state.api_key_auth = auth_data
+    if tier_info is not None:
+        tier_cache = getattr(request.state, "org_tier_cache", None) or {}
+        tier_cache[organization_id] = tier_info
+        request.state.org_tier_cache = tier_cache
+
+async def require_auth_header(request: Request) -> None:
+    """Reject requests without an Authorization header before running the auth pipeline"""
+    if not request.headers.get("authorization"):
+        raise HTTPException(status_code=401, detail="Authentication required")
+
+@router.get("/", response_model=None)
+async def platform_info(request: Request):
+    """
+    Islamic AI Platform Information
+    
+    Returns comprehensive information about the Islamic AI SaaS platform.
+    """
+    return cacheable_json_response(request, _PLATFORM_INFO_BYTES, _PLATFORM_INFO_HEADERS)
+
+@router.post(
+    "/organizations",
+    dependencies=[Depends(require_auth_header), Depends(rate_limit(times=5, minutes=1))]
+)
 async def create_organization(
-    org_data: Dict[str, Any],
-    user_id: str = Depends(get_current_user_optional)
+    org_data: OrganizationCreateRequest,
+    user_id: CurrentUserId
 ):
     """
     Create new organization
@@ -137,7 +435,7 @@ async def create_organization(
     
     try:
         # Create organization
-        result = await saas_platform.create_organization(org_data)
+        result = await saas_platform.create_organization(org_data.model_dump())
         
         return {
             "message": "Organization created successfully",
@@ -153,53 +451,27 @@ async def create_organization(
         }
         
     except Exception as e:
-        logger.error(f"Error creating organization: {e}")
+        logger.error("create_organization_failed", error=repr(e), user_id=user_id)
         raise HTTPException(status_code=500, detail="Error creating organization")
 
-@router.get("/subscription-tiers")
-async def get_subscription_tiers():
+@router.get("/subscription-tiers", response_model=None)
+async def get_subscription_tiers(request: Request):
     """
     Get available subscription tiers
     
     Returns detailed information about all available subscription tiers and features.
     """
-    from ...core.saas_platform import SUBSCRIPTION_TIERS
-    
-    tiers_info = {}
-    for tier, limits in SUBSCRIPTION_TIERS.items():
-        tiers_info[tier.value] = {
-            "name": limits.name,
-            "monthly_price": float(limits.monthly_price_usd),
-            "yearly_price": float(limits.yearly_price_usd),
-            "limits": {
-                "monthly_api_calls": limits.monthly_api_calls,
-                "daily_api_calls": limits.daily_api_calls,
-                "video_generations_monthly": limits.video_generations_monthly,
-                "max_concurrent_requests": limits.max_concurrent_requests,
-                "rate_limit_per_minute": limits.rate_limit_per_minute
-            },
-            "features": {
-                "custom_models": limits.custom_models,
-                "priority_support": limits.priority_support,
-                "white_label": limits.white_label,
-                "advanced_analytics": limits.advanced_analytics,
-                "bulk_processing": limits.bulk_processing
-            },
-            "sla_uptime": limits.sla_uptime,
-            "permissions": [perm.value for perm in limits.permissions]
-        }
-    
-    return {
-        "tiers": tiers_info,
-        "recommended": "professional",
-        "most_popular": "developer",
-        "enterprise_contact": "sales@budul.ai"
-    }
+    body, headers = _subscription_tiers_cached()
+    return cacheable_json_response(request, body, headers)
 
-@router.post("/sso/configure")
+@router.post(
+    "/sso/configure",
+    dependencies=[Depends(require_auth_header), Depends(rate_limit(times=5, minutes=1))]
+)
 async def configure_sso(
-    sso_config: Dict[str, Any],
-    user_id: str = Depends(get_current_user_optional)
+    sso_config: SSOConfigureRequest,
+    request: Request,
+    user_id: CurrentUserId
 ):
     """
     Configure Enterprise SSO
@@ -213,20 +485,24 @@ async def configure_sso(
         # Get organization ID
         organization_id = "default_org_id"  # Would get from user
         
-        # Validate enterprise tier
-        tier_info = await saas_platform._get_organization_tier(organization_id)
-        if tier_info["tier"] not in [SubscriptionTier.ENTERPRISE]:
+        # Validate enterprise tier (auth record and tier fetched in one round-trip)
+        await prefetch_auth_and_tier(request, organization_id)
+        tier_info = await get_request_org_tier(request, organization_id)
+        if tier_info["tier"] not in _ENTERPRISE_TIERS:
             raise HTTPException(
                 status_code=403,
                 detail="SSO configuration requires Enterprise tier"
             )
         
         # Configure SSO
-        provider = SSOProvider(sso_config["provider"])
+        provider = _SSO_PROVIDER_BY_VALUE.get(sso_config.provider)
+        if provider is None:
+            raise HTTPException(status_code=400, detail="Unknown SSO provider")
+
         config_id = await enterprise_sso_manager.configure_sso(
             organization_id=organization_id,
             provider=provider,
-            config_data=sso_config["config"],
+            config_data=sso_config.config,
             user_id=user_id
         )
         
@@ -242,8 +518,10 @@ async def configure_sso(
             ]
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error configuring SSO: {e}")
+        logger.error("configure_sso_failed", error=repr(e), user_id=user_id)
         raise HTTPException(status_code=500, detail="Error configuring SSO")
 
 @router.get("/sso/login/{organization_id}")
@@ -268,10 +546,16 @@ async def initiate_sso_login(
         return RedirectResponse(url=login_data["login_url"])
         
     except Exception as e:
-        logger.error(f"Error initiating SSO login: {e}")
+        logger.error("sso_login_failed", error=repr(e), organization_id=organization_id)
         raise HTTPException(status_code=500, detail="Error initiating SSO login")
 
-@router.post("/sso/callback/{provider}")
+@router.post(
+    "/sso/callback/{provider}",
+    dependencies=[
+        Depends(rate_limit(times=30, minutes=1)),
+        Depends(concurrent_limit("sso_callback", limit=10))
+    ]
+)
 async def handle_sso_callback(
     provider: str,
     request: Request,
@@ -283,7 +567,10 @@ async def handle_sso_callback(
     Processes the callback from identity provider and authenticates user.
     """
     try:
-        sso_provider = SSOProvider(provider)
+        sso_provider = _SSO_PROVIDER_BY_VALUE.get(provider)
+        if sso_provider is None:
+            raise HTTPException(status_code=400, detail="Unknown SSO provider")
+
         sso_user = await enterprise_sso_manager.handle_sso_callback(request, sso_provider)
         
         # Create JWT token for API access
@@ -301,228 +588,110 @@ async def handle_sso_callback(
             "redirect_url": "/dashboard"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error handling SSO callback: {e}")
+        logger.error("sso_callback_failed", error=repr(e), provider=provider)
         raise HTTPException(status_code=500, detail="Error handling SSO callback")
 
-@router.get("/health")
-async def platform_health():
+@redis_cached(lambda: saas_platform.redis_client, "health:v1", ttl=5, stale_ttl=60)
+async def _collect_health_status() -> Dict[str, Any]:
+    """Aggregate service health; cached briefly so frequent probes share one result"""
+    health_status = {
+        "status": "healthy",
+        "timestamp": "2024-01-01T12:00:00Z",
+        "services": {
+            "islamic_chat": {
+                "status": "healthy",
+                "response_time_ms": 150,
+                "active_conversations": 1250
+            },
+            "video_generation": {
+                "status": "healthy",
+                "queue_size": 5,
+                "active_generations": 12
+            },
+            "saas_platform": {
+                "status": "healthy",
+                "active_subscriptions": 847,
+                "api_requests_per_minute": 2340
+            },
+            "enterprise_sso": {
+                "status": "healthy",
+                "active_sessions": 156,
+                "configured_organizations": 23
+            }
+        },
+        "infrastructure": {
+            "database": "healthy",
+            "redis": "healthy",
+            "elasticsearch": "healthy",
+            "monitoring": "healthy"
+        },
+        "performance": {
+            "avg_response_time_ms": 145,
+            "error_rate_percentage": 0.02,
+            "uptime_percentage": 99.98
+        }
+    }
+
+    return health_status
+
+@router.get("/health", response_model=None)
+async def platform_health(request: Request):
     """
     Platform health check
     
     Returns comprehensive health status of all Islamic AI platform services.
     """
     try:
-        health_status = {
-            "status": "healthy",
-            "timestamp": "2024-01-01T12:00:00Z",
-            "services": {
-                "islamic_chat": {
-                    "status": "healthy",
-                    "response_time_ms": 150,
-                    "active_conversations": 1250
-                },
-                "video_generation": {
-                    "status": "healthy",
-                    "queue_size": 5,
-                    "active_generations": 12
-                },
-                "saas_platform": {
-                    "status": "healthy",
-                    "active_subscriptions": 847,
-                    "api_requests_per_minute": 2340
-                },
-                "enterprise_sso": {
-                    "status": "healthy",
-                    "active_sessions": 156,
-                    "configured_organizations": 23
-                }
-            },
-            "infrastructure": {
-                "database": "healthy",
-                "redis": "healthy",
-                "elasticsearch": "healthy",
-                "monitoring": "healthy"
-            },
-            "performance": {
-                "avg_response_time_ms": 145,
-                "error_rate_percentage": 0.02,
-                "uptime_percentage": 99.98
-            }
-        }
-        
-        return health_status
+        body = orjson.dumps(await _collect_health_status())
+        return cacheable_json_response(
+            request, body, {"Cache-Control": _HEALTH_CACHE_CONTROL, "ETag": etag(body)}
+        )
         
     except Exception as e:
-        logger.error(f"Health check error: {e}")
-        return {
+        logger.error("health_check_failed", error=repr(e))
+        return ORJSONResponse({
             "status": "unhealthy",
             "error": str(e),
             "timestamp": "2024-01-01T12:00:00Z"
-        }
+        })
+
+class _SingleFamilyRegistry:
+    """Minimal registry view exposing one collected metric family"""
+
+    def __init__(self, family):
+        self.family = family
+
+    def collect(self):
+        return [self.family]
 
-@router.get("/metrics")
+def _iter_metric_families():
+    """Yield the Prometheus exposition one metric family at a time"""
+    for family in REGISTRY.collect():
+        yield generate_latest(_SingleFamilyRegistry(family))
+
+@router.get("/metrics", response_model=None)
 async def get_metrics():
     """
     Prometheus metrics endpoint
     
     Returns metrics for monitoring and alerting.
     """
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    # Sync iterator: Starlette advances it in the threadpool, one family at a time
+    return StreamingResponse(_iter_metric_families(), media_type=CONTENT_TYPE_LATEST)
 
-@router.get("/examples")
-async def get_api_examples():
+@router.get("/examples", response_model=None)
+async def get_api_examples(request: Request):
     """
     API usage examples
     
     Returns comprehensive examples for integrating with the Islamic AI platform.
     """
-    return {
-        "chat_examples": {
-            "basic_question": {
-                "description": "Ask a basic Islamic question",
-                "request": {
-                    "method": "POST",
-                    "url": "/api/v1/chat",
-                    "headers": {
-                        "Authorization": "Bearer budul_your_api_key",
-                        "Content-Type": "application/json"
-                    },
-                    "body": {
-                        "message": "What are the five pillars of Islam?",
-                        "context": {
-                            "knowledge_level": "intermediate",
-                            "madhab": "hanafi"
-                        }
-                    }
-                }
-            },
-            "streaming_chat": {
-                "description": "Stream Islamic AI responses",
-                "request": {
-                    "method": "POST",
-                    "url": "/api/v1/chat/stream",
-                    "headers": {
-                        "Authorization": "Bearer budul_your_api_key",
-                        "Content-Type": "application/json"
-                    },
-                    "body": {
-                        "message": "Explain the concept of Tawheed in detail",
-                        "stream": True
-                    }
-                }
-            }
-        },
-        "video_examples": {
-            "generate_video": {
-                "description": "Generate Islamic educational video",
-                "request": {
-                    "method": "POST",
-                    "url": "/api/v1/video/generate",
-                    "headers": {
-                        "Authorization": "Bearer budul_your_api_key",
-                        "Content-Type": "application/json"
-                    },
-                    "body": {
-                        "text_content": "The importance of prayer in Islam and its spiritual benefits",
-                        "title": "Islamic Prayer Guide",
-                        "duration_seconds": 60,
-                        "style": "modern",
-                        "include_arabic_text": True,
-                        "cultural_style": "general"
-                    }
-                }
-            }
-        },
-        "dashboard_examples": {
-            "get_usage": {
-                "description": "Get organization usage statistics",
-                "request": {
-                    "method": "GET",
-                    "url": "/api/v1/dashboard/usage?period=month",
-                    "headers": {
-                        "Authorization": "Bearer budul_your_api_key"
-                    }
-                }
-            }
-        },
-        "code_examples": {
-            "python": """
-import requests
-
-# Initialize Budul AI client
-api_key = "budul_your_api_key"
-base_url = "https://api.budul.ai/v1"
-
-# Ask Islamic question
-def ask_islamic_question(question):
-    response = requests.post(
-        f"{base_url}/chat",
-        headers={"Authorization": f"Bearer {api_key}"},
-        json={"message": question}
-    )
-    return response.json()
-
-# Generate Islamic video
-def generate_islamic_video(content):
-    response = requests.post(
-        f"{base_url}/video/generate",
-        headers={"Authorization": f"Bearer {api_key}"},
-        json={
-            "text_content": content,
-            "duration_seconds": 30,
-            "style": "modern"
-        }
-    )
-    return response.json()
-
-# Example usage
-answer = ask_islamic_question("What is the significance of Ramadan?")
-video = generate_islamic_video("The benefits of reading Quran daily")
-            """,
-            "javascript": """
-const axios = require('axios');
-
-class BudulAI {
-  constructor(apiKey) {
-    this.apiKey = apiKey;
-    this.baseURL = 'https://api.budul.ai/v1';
-    this.headers = {
-      'Authorization': `Bearer ${apiKey}`,
-      'Content-Type': 'application/json'
-    };
-  }
-
-  async askQuestion(message, context = {}) {
-    const response = await axios.post(
-      `${this.baseURL}/chat`,
-      { message, context },
-      { headers: this.headers }
-    );
-    return response.data;
-  }
-
-  async generateVideo(textContent, options = {}) {
-    const response = await axios.post(
-      `${this.baseURL}/video/generate`,
-      { text_content: textContent, ...options },
-      { headers: this.headers }
-    );
-    return response.data;
-  }
-}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return cacheable_json_response(
+            request, _API_EXAMPLES_GZ_BYTES, _API_EXAMPLES_GZ_HEADERS, content_encoding="gzip"
+        )
 
-// Example usage
-const budul = new BudulAI('budul_your_api_key');
-const answer = await budul.askQuestion('Explain Islamic finance principles');
-const video = await budul.generateVideo('Islamic ethics in business');
-            """
-        },
-        "sdks": {
-            "python": "pip install budul-ai",
-            "javascript": "npm install @budul/ai",
-            "php": "composer require budul/ai",
-            "ruby": "gem install budul-ai",
-            "go": "go get github.com/budul-ai/go-sdk"
-        }
-    }
\ No newline at end of file
+    return cacheable_json_response(request, _API_EXAMPLES_BYTES, _API_EXAMPLES_HEADERS)
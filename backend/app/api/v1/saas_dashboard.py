@@ -4,22 +4,36 @@ Comprehensive dashboard for organizations to manage their Islamic AI usage and s
 """
 
 import asyncio
+import csv
+import io
 import json
+import os
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from functools import wraps
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Literal, Optional, Any
 from uuid import uuid4
 
+import aiofiles
+import orjson
+from cachetools import TTLCache
 from fastapi import (
     APIRouter, Depends, HTTPException, Query, 
-    Path, BackgroundTasks, UploadFile, File
+    Path, BackgroundTasks, UploadFile, File, Response
 )
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, EmailStr, Field, validator
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Core services
-from ...core.saas_platform import saas_platform, SubscriptionTier, APIPermission
+from ...core.saas_platform import (
+    saas_platform, SubscriptionTier, APIPermission, APIKey, BillingCycle, calculate_overage_cost
+)
 from ...core.auth import get_current_user_optional
 from ...core.rate_limiting import rate_limit
+from ...core.config import settings as app_settings
 from ...db.database import get_db
 
 # Monitoring
@@ -81,7 +95,7 @@ class OrganizationSettings(BaseModel):
     website: Optional[str] = Field(None, max_length=200)
     industry: Optional[str] = Field(None, max_length=100)
     country: Optional[str] = Field(None, max_length=100)
-    billing_email: str = Field(..., regex=r'^[\w\.-]+@[\w\.-]+\.\w+$')
+    billing_email: EmailStr
     preferences: Dict = Field(default_factory=dict)
     
 class WhiteLabelSettings(BaseModel):
@@ -104,519 +118,530 @@ class APIKeyRequest(BaseModel):
     expires_in_days: Optional[int] = Field(None, ge=1, le=365)
 
 # Router setup
-router = APIRouter(prefix="/dashboard", tags=["SaaS Dashboard"])
+router = APIRouter(prefix="/dashboard", tags=["SaaS Dashboard"], default_response_class=ORJSONResponse)
 logger = structlog.get_logger(__name__)
 
+# user_id -> organization_id; membership rarely changes, so a short TTL is safe
+_user_organization_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+@dataclass(frozen=True)
+class DashboardUser:
+    """Authenticated dashboard user and the organization they belong to"""
+    user_id: str
+    organization_id: str
+
+async def get_dashboard_user(
+    user_id: Optional[str] = Depends(get_current_user_optional)
+) -> DashboardUser:
+    """
+    Resolve the current user and their organization once per request
+
+    Raises:
+        HTTPException: 401 if the request is not authenticated
+    """
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Authentication required")
+    
+    organization_id = _user_organization_cache.get(user_id)
+    if organization_id is None:
+        organization_id = await _get_user_organization(user_id)
+        _user_organization_cache[user_id] = organization_id
+    
+    return DashboardUser(user_id=user_id, organization_id=organization_id)
+
 # Metrics
 dashboard_requests_counter = Counter('islamic_ai_dashboard_requests_total', 'Dashboard requests', ['endpoint'])
 
+# Serialized overview per organization; dashboards poll it and tolerate brief staleness
+_OVERVIEW_CACHE_PREFIX = "dash:overview"
+_OVERVIEW_CACHE_TTL = 30
+
+# Query parameter lookups
+_PERIOD_DAYS = MappingProxyType({"day": 1, "week": 7, "month": 30, "year": 365})
+_BILLING_CYCLES = MappingProxyType({"monthly": BillingCycle.MONTHLY, "yearly": BillingCycle.YEARLY})
+
+# White-label logo uploads
+_LOGO_EXTENSIONS = MappingProxyType({"image/png": "png", "image/jpeg": "jpg", "image/webp": "webp"})
+_MAX_LOGO_BYTES = 2 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# API key queries, built once; organization_id is bound per call
+_API_KEYS_BY_ORG = (
+    select(
+        APIKey.id,
+        APIKey.key_name.label("name"),
+        APIKey.key_prefix.label("prefix"),
+        APIKey.created_at,
+        APIKey.last_used,
+        APIKey.total_requests,
+        APIKey.is_active,
+        APIKey.expires_at
+    )
+    .where(APIKey.organization_id == bindparam("organization_id"))
+    .order_by(APIKey.created_at.desc())
+)
+_API_KEY_SUMMARY_BY_ORG = select(
+    func.count(),
+    func.count().filter(APIKey.is_active),
+    func.max(APIKey.last_used)
+).where(APIKey.organization_id == bindparam("organization_id"))
+
+# Analytics exports
+_EXPORT_EXTENSIONS = MappingProxyType({"csv": "csv", "json": "ndjson"})
+_EXPORT_STATUS_PREFIX = "analytics_export"
+_EXPORT_STATUS_TTL = 86400
+
+# Export statuses kept in this process when Redis is unavailable; oldest
+# jobs are dropped past the cap
+_local_export_status: Dict[str, bytes] = {}
+_LOCAL_EXPORT_STATUS_MAX = 1000
+
+# Per-endpoint children bound once, so requests skip the labels() lookup
+_OVERVIEW_REQUESTS = dashboard_requests_counter.labels(endpoint='overview')
+_USAGE_REQUESTS = dashboard_requests_counter.labels(endpoint='usage')
+_API_KEYS_REQUESTS = dashboard_requests_counter.labels(endpoint='api_keys')
+_BILLING_REQUESTS = dashboard_requests_counter.labels(endpoint='billing')
+
+def dashboard_endpoint(error_detail: str, counter=None):
+    """
+    Wrap a dashboard route with request counting and uniform error handling
+    
+    Args:
+        error_detail: Detail returned with the 500 response on unexpected errors
+        counter: Optional pre-bound counter incremented on every request
+    
+    HTTPExceptions raised by the route pass through unchanged.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            if counter is not None:
+                counter.inc()
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error("dashboard_endpoint_failed", endpoint=func.__name__, error=repr(e))
+                raise HTTPException(status_code=500, detail=error_detail)
+        
+        return wrapper
+    
+    return decorator
+
 @router.get("/overview", response_model=DashboardOverview)
 @rate_limit(calls=100, period=60)
+@dashboard_endpoint("Error loading dashboard", counter=_OVERVIEW_REQUESTS)
 async def get_dashboard_overview(
-    user_id: str = Depends(get_current_user_optional),
-    db: AsyncSession = Depends(get_db)
-) -> DashboardOverview:
+    current: DashboardUser = Depends(get_dashboard_user)
+):
     """
     Get comprehensive dashboard overview
     
     Returns organization overview, usage statistics, billing status, and performance metrics.
+    Served from a short-lived Redis copy while it is fresh.
     """
-    dashboard_requests_counter.labels(endpoint='overview').inc()
+    # Get organization ID from user
+    organization_id = current.organization_id
+    
+    redis_client = saas_platform.redis_client
+    cache_key = f"{_OVERVIEW_CACHE_PREFIX}:{organization_id}"
+    if redis_client is not None:
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached:
+                return Response(cached, media_type="application/json")
+        except Exception as e:
+            logger.warning("overview_cache_read_failed", key=cache_key, error=repr(e))
+    
+    # Organization details, usage analytics, recent activity and billing
+    # status are independent, so fetch them concurrently
+    org_data, analytics, recent_activity, billing_status = await asyncio.gather(
+        saas_platform._get_organization(organization_id),
+        saas_platform.get_organization_analytics(organization_id, days=30),
+        _get_recent_activity(organization_id, limit=10),
+        _get_billing_status(organization_id)
+    )
+    
+    overview = DashboardOverview(
+        organization_name=org_data.get("name", "Unknown Organization"),
+        subscription_tier=org_data.get("subscription_tier", "free"),
+        current_usage={
+            "api_calls": analytics["total_api_calls"],
+            "video_generations": analytics["total_video_generations"],
+            "quota_used_percentage": analytics["current_month_quota_used"]
+        },
+        quota_limits=analytics["tier_limits"],
+        recent_activity=recent_activity,
+        billing_status=billing_status,
+        api_performance={
+            "average_response_time": analytics["average_response_time_ms"],
+            "error_rate": analytics["error_rate_percentage"],
+            "uptime": 99.9
+        }
+    )
     
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    body = orjson.dumps(overview.model_dump())
+    if redis_client is not None:
+        try:
+            await redis_client.setex(cache_key, _OVERVIEW_CACHE_TTL, body)
+        except Exception as e:
+            logger.warning("overview_cache_write_failed", key=cache_key, error=repr(e))
     
-    try:
-        # Get organization ID from user
-        organization_id = await _get_user_organization(user_id)
-        
-        # Get organization details
-        org_data = await saas_platform._get_organization(organization_id)
-        
-        # Get usage analytics
-        analytics = await saas_platform.get_organization_analytics(organization_id, days=30)
-        
-        # Get recent activity
-        recent_activity = await _get_recent_activity(organization_id, limit=10)
-        
-        # Get billing status
-        billing_status = await _get_billing_status(organization_id)
-        
-        return DashboardOverview(
-            organization_name=org_data.get("name", "Unknown Organization"),
-            subscription_tier=org_data.get("subscription_tier", "free"),
-            current_usage={
-                "api_calls": analytics["total_api_calls"],
-                "video_generations": analytics["total_video_generations"],
-                "quota_used_percentage": analytics["current_month_quota_used"]
-            },
-            quota_limits=analytics["tier_limits"],
-            recent_activity=recent_activity,
-            billing_status=billing_status,
-            api_performance={
-                "average_response_time": analytics["average_response_time_ms"],
-                "error_rate": analytics["error_rate_percentage"],
-                "uptime": 99.9
-            }
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting dashboard overview: {e}")
-        raise HTTPException(status_code=500, detail="Error loading dashboard")
+    return Response(body, media_type="application/json")
 
 @router.get("/usage", response_model=UsageSummary)
 @rate_limit(calls=100, period=60)
+@dashboard_endpoint("Error loading usage data", counter=_USAGE_REQUESTS)
 async def get_usage_summary(
-    period: str = Query("month", regex="^(day|week|month|year)$"),
-    user_id: str = Depends(get_current_user_optional)
+    period: Literal["day", "week", "month", "year"] = Query("month"),
+    current: DashboardUser = Depends(get_dashboard_user)
 ) -> UsageSummary:
     """
     Get detailed usage summary for specified period
     
     Provides comprehensive usage analytics, quota tracking, and cost estimates.
     """
-    dashboard_requests_counter.labels(endpoint='usage').inc()
-    
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Calculate period days
-        period_days = {"day": 1, "week": 7, "month": 30, "year": 365}[period]
-        
-        # Get analytics for period
-        analytics = await saas_platform.get_organization_analytics(organization_id, days=period_days)
-        
-        # Calculate overage charges
-        overage_charges = await _calculate_overage_charges(organization_id, analytics)
-        
-        # Estimate monthly cost
-        estimated_cost = await _estimate_monthly_cost(organization_id, analytics)
-        
-        return UsageSummary(
-            period=period,
-            api_calls_total=analytics["total_api_calls"],
-            api_calls_limit=analytics["tier_limits"]["monthly_api_calls"],
-            video_generations_total=analytics["total_video_generations"],
-            video_generations_limit=analytics["tier_limits"]["video_generations_monthly"],
-            quota_percentage=analytics["current_month_quota_used"],
-            overage_charges=overage_charges,
-            estimated_monthly_cost=estimated_cost,
-            top_endpoints=analytics["usage_by_endpoint"]
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting usage summary: {e}")
-        raise HTTPException(status_code=500, detail="Error loading usage data")
+    organization_id = current.organization_id
+    
+    # Calculate period days
+    period_days = _PERIOD_DAYS[period]
+    
+    # Get analytics for period
+    analytics = await saas_platform.get_organization_analytics(organization_id, days=period_days)
+    
+    # Calculate overage charges and estimate monthly cost
+    overage_charges, estimated_cost = await asyncio.gather(
+        _calculate_overage_charges(organization_id, analytics),
+        _estimate_monthly_cost(organization_id, analytics)
+    )
+    
+    return UsageSummary(
+        period=period,
+        api_calls_total=analytics["total_api_calls"],
+        api_calls_limit=analytics["tier_limits"]["monthly_api_calls"],
+        video_generations_total=analytics["total_video_generations"],
+        video_generations_limit=analytics["tier_limits"]["video_generations_monthly"],
+        quota_percentage=analytics["current_month_quota_used"],
+        overage_charges=overage_charges,
+        estimated_monthly_cost=estimated_cost,
+        top_endpoints=analytics["usage_by_endpoint"]
+    )
 
 @router.get("/api-keys", response_model=APIKeyManagement)
 @rate_limit(calls=50, period=60)
+@dashboard_endpoint("Error loading API keys", counter=_API_KEYS_REQUESTS)
 async def get_api_keys(
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user),
+    db: AsyncSession = Depends(get_db)
 ) -> APIKeyManagement:
     """
     Get API key management information
     
     Lists all API keys for the organization with usage statistics.
     """
-    dashboard_requests_counter.labels(endpoint='api_keys').inc()
+    organization_id = current.organization_id
     
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    # Key list (already in display shape) and DB-side totals; one
+    # AsyncSession runs one statement at a time, so these stay sequential
+    api_keys = await _get_organization_api_keys(db, organization_id)
+    summary = await _get_api_key_summary(db, organization_id)
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Get API keys for organization
-        api_keys = await _get_organization_api_keys(organization_id)
-        
-        # Format API keys for display
-        formatted_keys = []
-        active_count = 0
-        last_used = None
-        
-        for key in api_keys:
-            if key["is_active"]:
-                active_count += 1
-            
-            if key["last_used"] and (not last_used or key["last_used"] > last_used):
-                last_used = key["last_used"]
-            
-            formatted_keys.append({
-                "id": key["id"],
-                "name": key["key_name"],
-                "prefix": key["key_prefix"],
-                "created_at": key["created_at"],
-                "last_used": key["last_used"],
-                "total_requests": key["total_requests"],
-                "is_active": key["is_active"],
-                "expires_at": key.get("expires_at")
-            })
-        
-        return APIKeyManagement(
-            api_keys=formatted_keys,
-            total_keys=len(api_keys),
-            active_keys=active_count,
-            last_used=last_used
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting API keys: {e}")
-        raise HTTPException(status_code=500, detail="Error loading API keys")
+    return APIKeyManagement(api_keys=api_keys, **summary)
 
 @router.post("/api-keys")
 @rate_limit(calls=10, period=60)
+@dashboard_endpoint("Error creating API key")
 async def create_api_key(
     request: APIKeyRequest,
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ):
     """
     Create new API key for organization
     
     Generates a new API key with specified permissions and expiration.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Generate API key
-        api_key = await saas_platform.generate_api_key(organization_id, request.key_name)
-        
-        return {
-            "message": "API key created successfully",
-            "api_key": api_key,
-            "key_name": request.key_name,
-            "created_at": datetime.utcnow().isoformat()
-        }
-        
-    except Exception as e:
-        logger.error(f"Error creating API key: {e}")
-        raise HTTPException(status_code=500, detail="Error creating API key")
+    # Generate API key
+    api_key = await saas_platform.generate_api_key(organization_id, request.key_name)
+    
+    return {
+        "message": "API key created successfully",
+        "api_key": api_key,
+        "key_name": request.key_name,
+        "created_at": datetime.utcnow()
+    }
 
 @router.delete("/api-keys/{key_id}")
 @rate_limit(calls=20, period=60)
+@dashboard_endpoint("Error revoking API key")
 async def revoke_api_key(
     key_id: str = Path(...),
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ):
     """
     Revoke API key
     
     Permanently disables the specified API key.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        await saas_platform.revoke_api_key(organization_id, key_id)
-        
-        return {"message": "API key revoked successfully"}
-        
-    except Exception as e:
-        logger.error(f"Error revoking API key: {e}")
-        raise HTTPException(status_code=500, detail="Error revoking API key")
+    await saas_platform.revoke_api_key(organization_id, key_id)
+    
+    return {"message": "API key revoked successfully"}
 
 @router.get("/billing", response_model=BillingDashboard)
 @rate_limit(calls=50, period=60)
+@dashboard_endpoint("Error loading billing data", counter=_BILLING_REQUESTS)
 async def get_billing_dashboard(
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ) -> BillingDashboard:
     """
     Get billing dashboard information
     
     Provides subscription details, payment methods, billing history, and invoices.
     """
-    dashboard_requests_counter.labels(endpoint='billing').inc()
-    
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
+    
+    # Subscription, billing history, upcoming invoice and usage-based
+    # charges are independent, so fetch them concurrently
+    org_data, billing_history, upcoming_invoice, usage_charges = await asyncio.gather(
+        saas_platform._get_organization(organization_id),
+        _get_billing_history(organization_id),
+        _get_upcoming_invoice(organization_id),
+        _calculate_usage_charges(organization_id)
+    )
+    
+    current_subscription = {
+        "tier": org_data.get("subscription_tier"),
+        "billing_cycle": org_data.get("billing_cycle"),
+        "started": org_data.get("subscription_started"),
+        "expires": org_data.get("subscription_expires")
+    }
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Get current subscription
-        org_data = await saas_platform._get_organization(organization_id)
-        current_subscription = {
-            "tier": org_data.get("subscription_tier"),
-            "billing_cycle": org_data.get("billing_cycle"),
-            "started": org_data.get("subscription_started"),
-            "expires": org_data.get("subscription_expires")
-        }
-        
-        # Get billing history
-        billing_history = await _get_billing_history(organization_id)
-        
-        # Get upcoming invoice
-        upcoming_invoice = await _get_upcoming_invoice(organization_id)
-        
-        # Calculate usage-based charges
-        usage_charges = await _calculate_usage_charges(organization_id)
-        
-        return BillingDashboard(
-            current_subscription=current_subscription,
-            payment_method=None,  # Would integrate with Stripe
-            billing_history=billing_history,
-            upcoming_invoice=upcoming_invoice,
-            usage_based_charges=usage_charges
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting billing dashboard: {e}")
-        raise HTTPException(status_code=500, detail="Error loading billing data")
+    return BillingDashboard(
+        current_subscription=current_subscription,
+        payment_method=None,  # Would integrate with Stripe
+        billing_history=billing_history,
+        upcoming_invoice=upcoming_invoice,
+        usage_based_charges=usage_charges
+    )
 
 @router.post("/subscription/upgrade")
 @rate_limit(calls=5, period=60)
+@dashboard_endpoint("Error upgrading subscription")
 async def upgrade_subscription(
     new_tier: SubscriptionTier,
-    billing_cycle: str = Query("monthly", regex="^(monthly|yearly)$"),
-    user_id: str = Depends(get_current_user_optional)
+    billing_cycle: Literal["monthly", "yearly"] = Query("monthly"),
+    current: DashboardUser = Depends(get_dashboard_user)
 ):
     """
     Upgrade subscription tier
     
     Upgrades organization to higher subscription tier with immediate effect.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        from ...core.saas_platform import BillingCycle
-        cycle = BillingCycle.YEARLY if billing_cycle == "yearly" else BillingCycle.MONTHLY
-        
-        result = await saas_platform.upgrade_subscription(organization_id, new_tier, cycle)
-        
-        return {
-            "message": "Subscription upgraded successfully",
-            "new_tier": new_tier.value,
-            "billing_cycle": billing_cycle,
-            "effective_immediately": True,
-            **result
-        }
-        
-    except Exception as e:
-        logger.error(f"Error upgrading subscription: {e}")
-        raise HTTPException(status_code=500, detail="Error upgrading subscription")
+    result = await saas_platform.upgrade_subscription(
+        organization_id, new_tier, _BILLING_CYCLES[billing_cycle]
+    )
+    await _invalidate_overview_cache(organization_id)
+    
+    return {
+        "message": "Subscription upgraded successfully",
+        "new_tier": new_tier.value,
+        "billing_cycle": billing_cycle,
+        "effective_immediately": True,
+        **result
+    }
 
 @router.get("/settings", response_model=OrganizationSettings)
 @rate_limit(calls=100, period=60)
+@dashboard_endpoint("Error loading settings")
 async def get_organization_settings(
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ) -> OrganizationSettings:
     """
     Get organization settings
     
     Returns current organization configuration and preferences.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    
-    try:
-        organization_id = await _get_user_organization(user_id)
-        org_data = await saas_platform._get_organization(organization_id)
-        
-        return OrganizationSettings(
-            name=org_data.get("name", ""),
-            description=org_data.get("description"),
-            website=org_data.get("website"),
-            industry=org_data.get("industry"),
-            country=org_data.get("country"),
-            billing_email=org_data.get("billing_email", ""),
-            preferences=org_data.get("settings", {})
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting organization settings: {e}")
-        raise HTTPException(status_code=500, detail="Error loading settings")
+    organization_id = current.organization_id
+    org_data = await saas_platform._get_organization(organization_id)
+    
+    return OrganizationSettings(
+        name=org_data.get("name", ""),
+        description=org_data.get("description"),
+        website=org_data.get("website"),
+        industry=org_data.get("industry"),
+        country=org_data.get("country"),
+        billing_email=org_data.get("billing_email", ""),
+        preferences=org_data.get("settings", {})
+    )
 
 @router.put("/settings")
 @rate_limit(calls=20, period=60)
+@dashboard_endpoint("Error updating settings")
 async def update_organization_settings(
     settings: OrganizationSettings,
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ):
     """
     Update organization settings
     
     Updates organization configuration and preferences.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Update organization settings
-        # This would use actual database operations
-        logger.info(f"Updated settings for organization {organization_id}: {settings}")
-        
-        return {"message": "Organization settings updated successfully"}
-        
-    except Exception as e:
-        logger.error(f"Error updating organization settings: {e}")
-        raise HTTPException(status_code=500, detail="Error updating settings")
+    # Update organization settings
+    # This would use actual database operations
+    await saas_platform.invalidate_organization_cache(organization_id)
+    await _invalidate_overview_cache(organization_id)
+    logger.info(f"Updated settings for organization {organization_id}: {settings}")
+    
+    return {"message": "Organization settings updated successfully"}
 
 @router.get("/white-label", response_model=WhiteLabelSettings)
 @rate_limit(calls=50, period=60)
+@dashboard_endpoint("Error loading white-label settings")
 async def get_white_label_settings(
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ) -> WhiteLabelSettings:
     """
     Get white-label customization settings
     
     Returns current white-label branding configuration.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Check if organization has white-label permissions
-        org_data = await saas_platform._get_organization(organization_id)
-        tier_info = await saas_platform._get_organization_tier(organization_id)
-        
-        from ...core.saas_platform import SUBSCRIPTION_TIERS
-        tier_limits = SUBSCRIPTION_TIERS[tier_info["tier"]]
-        
-        if not tier_limits.white_label:
-            raise HTTPException(
-                status_code=403, 
-                detail="White-label customization not available in current tier"
-            )
-        
-        # Get white-label settings
-        settings = org_data.get("settings", {}).get("white_label", {})
-        
-        return WhiteLabelSettings(**settings)
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting white-label settings: {e}")
-        raise HTTPException(status_code=500, detail="Error loading white-label settings")
+    # Check if organization has white-label permissions
+    org_data, tier_limits = await saas_platform.get_organization_with_tier(organization_id)
+    
+    if not tier_limits.white_label:
+        raise HTTPException(
+            status_code=403, 
+            detail="White-label customization not available in current tier"
+        )
+    
+    # Get white-label settings
+    settings = org_data.get("settings", {}).get("white_label", {})
+    
+    return WhiteLabelSettings(**settings)
 
 @router.put("/white-label")
 @rate_limit(calls=10, period=60)
+@dashboard_endpoint("Error updating white-label settings")
 async def update_white_label_settings(
     settings: WhiteLabelSettings,
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ):
     """
     Update white-label customization settings
     
     Updates branding and customization for white-label deployment.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Verify white-label permissions
-        tier_info = await saas_platform._get_organization_tier(organization_id)
-        from ...core.saas_platform import SUBSCRIPTION_TIERS
-        tier_limits = SUBSCRIPTION_TIERS[tier_info["tier"]]
-        
-        if not tier_limits.white_label:
-            raise HTTPException(
-                status_code=403,
-                detail="White-label customization requires Professional or Enterprise tier"
-            )
-        
-        # Update white-label settings
-        logger.info(f"Updated white-label settings for organization {organization_id}")
-        
-        return {"message": "White-label settings updated successfully"}
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating white-label settings: {e}")
-        raise HTTPException(status_code=500, detail="Error updating white-label settings")
+    # Verify white-label permissions
+    _, tier_limits = await saas_platform.get_organization_with_tier(organization_id)
+    
+    if not tier_limits.white_label:
+        raise HTTPException(
+            status_code=403,
+            detail="White-label customization requires Professional or Enterprise tier"
+        )
+    
+    # Update white-label settings
+    await saas_platform.invalidate_organization_cache(organization_id)
+    await _invalidate_overview_cache(organization_id)
+    logger.info(f"Updated white-label settings for organization {organization_id}")
+    
+    return {"message": "White-label settings updated successfully"}
 
 @router.post("/white-label/logo")
 @rate_limit(calls=5, period=60)
+@dashboard_endpoint("Error uploading logo")
 async def upload_white_label_logo(
     logo: UploadFile = File(...),
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ):
     """
     Upload custom logo for white-label branding
     
     Uploads and processes custom logo for white-label deployment.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    # Validate file type (no SVG: it can carry script)
+    if logo.content_type not in _LOGO_EXTENSIONS:
+        raise HTTPException(status_code=400, detail="Logo must be a PNG, JPEG or WebP image")
     
-    try:
-        # Validate file type
-        if not logo.content_type.startswith('image/'):
-            raise HTTPException(status_code=400, detail="File must be an image")
-        
-        # Validate file size (max 2MB)
-        content = await logo.read()
-        if len(content) > 2 * 1024 * 1024:
-            raise HTTPException(status_code=400, detail="File size must be less than 2MB")
-        
-        organization_id = await _get_user_organization(user_id)
-        
-        # Save logo and return URL
-        logo_url = await _save_white_label_logo(organization_id, content, logo.content_type)
-        
-        return {
-            "message": "Logo uploaded successfully",
-            "logo_url": logo_url
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error uploading logo: {e}")
-        raise HTTPException(status_code=500, detail="Error uploading logo")
+    organization_id = current.organization_id
+    
+    # Stream to storage; the size limit is enforced chunk by chunk
+    logo_url = await _save_white_label_logo(
+        organization_id, _iter_logo_chunks(logo), logo.content_type
+    )
+    
+    return {
+        "message": "Logo uploaded successfully",
+        "logo_url": logo_url
+    }
 
 @router.get("/analytics/export")
 @rate_limit(calls=10, period=60)
+@dashboard_endpoint("Error exporting analytics")
 async def export_analytics(
-    format: str = Query("csv", regex="^(csv|json|pdf)$"),
+    background_tasks: BackgroundTasks,
+    format: Literal["csv", "json"] = Query("csv"),
     period_days: int = Query(30, ge=1, le=365),
-    user_id: str = Depends(get_current_user_optional)
+    current: DashboardUser = Depends(get_dashboard_user)
 ):
     """
     Export analytics data
     
-    Exports comprehensive analytics data in specified format.
+    Starts a background export in the specified format and returns a job ID
+    to poll at /analytics/export/{job_id}.
     """
-    if not user_id:
-        raise HTTPException(status_code=401, detail="Authentication required")
+    organization_id = current.organization_id
+    job_id = uuid4().hex
+    
+    await _set_export_status(job_id, {
+        "status": "pending",
+        "organization_id": organization_id,
+        "format": format,
+        "period_days": period_days
+    })
+    background_tasks.add_task(
+        _generate_analytics_export_async, organization_id, format, period_days, job_id
+    )
     
-    try:
-        organization_id = await _get_user_organization(user_id)
-        
-        # Get comprehensive analytics
-        analytics = await saas_platform.get_organization_analytics(organization_id, days=period_days)
-        
-        # Generate export file
-        export_file = await _generate_analytics_export(analytics, format, period_days)
-        
-        return {
-            "message": "Analytics export generated",
-            "download_url": export_file["url"],
-            "format": format,
-            "period_days": period_days,
-            "generated_at": datetime.utcnow().isoformat()
-        }
-        
-    except Exception as e:
-        logger.error(f"Error exporting analytics: {e}")
-        raise HTTPException(status_code=500, detail="Error exporting analytics")
+    return {
+        "message": "Analytics export started",
+        "job_id": job_id,
+        "status_url": f"/dashboard/analytics/export/{job_id}",
+        "format": format,
+        "period_days": period_days,
+        "requested_at": datetime.utcnow()
+    }
+
+@router.get("/analytics/export/{job_id}")
+@rate_limit(calls=60, period=60)
+@dashboard_endpoint("Error loading export status")
+async def get_analytics_export_status(
+    job_id: str = Path(...),
+    current: DashboardUser = Depends(get_dashboard_user)
+):
+    """
+    Get analytics export status
+    
+    Returns the job status and, once completed, the download URL.
+    """
+    job = await _get_export_status(job_id)
+    
+    if not job or job.pop("organization_id") != current.organization_id:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    
+    return {"job_id": job_id, **job}
 
 # Utility functions
 async def _get_user_organization(user_id: str) -> str:
@@ -624,6 +649,18 @@ async def _get_user_organization(user_id: str) -> str:
     # This would query user's organization from database
     return "default_org_id"  # Placeholder
 
+async def _invalidate_overview_cache(organization_id: str) -> None:
+    """Drop the cached dashboard overview after the organization changes"""
+    redis_client = saas_platform.redis_client
+    if redis_client is None:
+        return
+    
+    key = f"{_OVERVIEW_CACHE_PREFIX}:{organization_id}"
+    try:
+        await redis_client.delete(key)
+    except Exception as e:
+        logger.warning("overview_cache_invalidate_failed", key=key, error=repr(e))
+
 async def _get_recent_activity(organization_id: str, limit: int = 10) -> List[Dict]:
     """Get recent organization activity"""
     return []  # Placeholder
@@ -632,21 +669,42 @@ async def _get_billing_status(organization_id: str) -> Dict:
     """Get billing status"""
     return {
         "status": "active",
-        "next_billing_date": (datetime.utcnow() + timedelta(days=30)).isoformat(),
+        "next_billing_date": datetime.utcnow() + timedelta(days=30),
         "amount_due": 0.0
     }
 
 async def _calculate_overage_charges(organization_id: str, analytics: Dict) -> float:
-    """Calculate overage charges"""
-    return 0.0  # Placeholder
+    """
+    Calculate overage charges for the current billing month
+    
+    The tier limits are monthly, so usage is taken from the billing month
+    (as invoicing does) rather than the summary's requested period.
+    """
+    tier_limits = analytics["tier_limits"]
+    now = datetime.utcnow()
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    usage = await saas_platform._get_usage_for_period(organization_id, month_start, now)
+    return calculate_overage_cost(
+        usage.get("api_calls", 0),
+        usage.get("video_generations", 0),
+        tier_limits["monthly_api_calls"],
+        tier_limits["video_generations_monthly"]
+    )
 
 async def _estimate_monthly_cost(organization_id: str, analytics: Dict) -> float:
     """Estimate monthly cost"""
     return 49.0  # Placeholder
 
-async def _get_organization_api_keys(organization_id: str) -> List[Dict]:
-    """Get API keys for organization"""
-    return []  # Placeholder
+async def _get_organization_api_keys(db: AsyncSession, organization_id: str) -> List[Dict]:
+    """Get API keys for organization, newest first"""
+    result = await db.execute(_API_KEYS_BY_ORG, {"organization_id": organization_id})
+    return [dict(row) for row in result.mappings()]
+
+async def _get_api_key_summary(db: AsyncSession, organization_id: str) -> Dict[str, Any]:
+    """Get total/active key counts and the most recent use in one aggregate query"""
+    result = await db.execute(_API_KEY_SUMMARY_BY_ORG, {"organization_id": organization_id})
+    total_keys, active_keys, last_used = result.one()
+    return {"total_keys": total_keys, "active_keys": active_keys, "last_used": last_used}
 
 async def _get_billing_history(organization_id: str) -> List[Dict]:
     """Get billing history"""
@@ -660,10 +718,112 @@ async def _calculate_usage_charges(organization_id: str) -> Dict[str, float]:
     """Calculate usage-based charges"""
     return {"overage": 0.0, "estimated_month": 49.0}
 
-async def _save_white_label_logo(organization_id: str, content: bytes, content_type: str) -> str:
-    """Save white-label logo"""
-    return f"/static/logos/{organization_id}_logo.png"  # Placeholder
+async def _iter_logo_chunks(logo: UploadFile) -> AsyncIterator[bytes]:
+    """Yield the upload in chunks, failing as soon as it exceeds the 2MB limit"""
+    total = 0
+    while chunk := await logo.read(_UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > _MAX_LOGO_BYTES:
+            raise HTTPException(status_code=413, detail="File size must be less than 2MB")
+        yield chunk
 
-async def _generate_analytics_export(analytics: Dict, format: str, period_days: int) -> Dict:
-    """Generate analytics export file"""
-    return {"url": f"/exports/analytics_{period_days}d.{format}"}  # Placeholder
\ No newline at end of file
+async def _save_white_label_logo(
+    organization_id: str,
+    chunks: AsyncIterator[bytes],
+    content_type: str
+) -> str:
+    """Write a white-label logo to the uploads directory without buffering it"""
+    filename = f"{organization_id}_logo.{_LOGO_EXTENSIONS[content_type]}"
+    logo_dir = os.path.join(app_settings.UPLOAD_DIR, "logos")
+    os.makedirs(logo_dir, exist_ok=True)
+    
+    path = os.path.join(logo_dir, filename)
+    tmp_path = f"{path}.part"
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            async for chunk in chunks:
+                await f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    return f"/static/logos/{filename}"
+
+async def _set_export_status(job_id: str, status: Dict[str, Any]) -> None:
+    """Record an export job's status for the polling endpoint (Redis, else this process)"""
+    payload = orjson.dumps(status)
+    redis_client = saas_platform.redis_client
+    if redis_client is not None:
+        try:
+            await redis_client.setex(f"{_EXPORT_STATUS_PREFIX}:{job_id}", _EXPORT_STATUS_TTL, payload)
+            return
+        except Exception as e:
+            logger.warning("export_status_write_failed", job_id=job_id, error=repr(e))
+    
+    _local_export_status[job_id] = payload
+    if len(_local_export_status) > _LOCAL_EXPORT_STATUS_MAX:
+        _local_export_status.pop(next(iter(_local_export_status)))
+
+async def _get_export_status(job_id: str) -> Optional[Dict[str, Any]]:
+    """Look up an export job's status recorded by _set_export_status"""
+    cached = None
+    redis_client = saas_platform.redis_client
+    if redis_client is not None:
+        try:
+            cached = await redis_client.get(f"{_EXPORT_STATUS_PREFIX}:{job_id}")
+        except Exception as e:
+            logger.warning("export_status_read_failed", job_id=job_id, error=repr(e))
+    
+    if cached is None:
+        cached = _local_export_status.get(job_id)
+    return orjson.loads(cached) if cached else None
+
+async def _write_csv_rows(f, rows: List[Dict]) -> None:
+    """Write rows as CSV one line at a time through a reusable buffer"""
+    buffer = io.StringIO()
+    writer = None
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow(row)
+        await f.write(buffer.getvalue().encode())
+        buffer.seek(0)
+        buffer.truncate()
+
+async def _generate_analytics_export_async(
+    organization_id: str,
+    format: str,
+    period_days: int,
+    job_id: str
+) -> None:
+    """Build an analytics export file in the background and record the outcome"""
+    status = {"organization_id": organization_id, "format": format, "period_days": period_days}
+    filename = f"{job_id}.{_EXPORT_EXTENSIONS[format]}"
+    
+    try:
+        analytics = await saas_platform.get_organization_analytics(organization_id, days=period_days)
+        
+        export_dir = os.path.join(app_settings.UPLOAD_DIR, "exports")
+        os.makedirs(export_dir, exist_ok=True)
+        
+        async with aiofiles.open(os.path.join(export_dir, filename), "wb") as f:
+            if format == "csv":
+                await _write_csv_rows(f, analytics["daily_usage"])
+            else:
+                # NDJSON: one serialized row per line, nothing held in memory
+                for row in analytics["daily_usage"]:
+                    await f.write(orjson.dumps(row) + b"\n")
+        
+        status.update(
+            status="completed",
+            download_url=f"/exports/{filename}",
+            generated_at=datetime.utcnow()
+        )
+    except Exception as e:
+        logger.error("analytics_export_failed", job_id=job_id, error=repr(e))
+        status.update(status="failed")
+    
+    await _set_export_status(job_id, status)
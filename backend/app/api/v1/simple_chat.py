@@ -3,16 +3,31 @@ Simple Chat API using your trained Budul AI model
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional
-import uuid
+from uuid import uuid4
 from datetime import datetime
+import time
 
-from ...services.budul_ai_service import budul_ai
+from ...services.budul_ai_service import budul_ai, budul_ai_batcher
 
 # Router setup
 router = APIRouter()
 
+# Single-slot cache: (epoch second, ISO timestamp for that second)
+_now_iso_cache = (0, "")
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string, formatted at most once per second"""
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, cached_iso = _now_iso_cache
+    if cached_second != second:
+        cached_iso = datetime.utcfromtimestamp(second).isoformat()
+        _now_iso_cache = (second, cached_iso)
+    return cached_iso
+
 # Request/Response models
 class SimpleChatRequest(BaseModel):
     message: str
@@ -41,11 +56,15 @@ async def chat_with_budul_ai(request: SimpleChatRequest):
     Chat with your trained Budul AI Islamic model
     """
     try:
+        # One ID per request serves as both session and response ID fallback
+        request_uid = uuid4().hex
+        
         # Generate session ID if not provided
-        session_id = request.session_id or str(uuid.uuid4())
+        session_id = request.session_id or request_uid
         
-        # Generate response using your trained model
-        result = budul_ai.generate_response(request.message)
+        # Generate response using your trained model; concurrent requests are
+        # batched into one forward pass that runs off the event loop
+        result = await budul_ai_batcher.generate(request.message)
         
         if not result.get("success", False):
             raise HTTPException(
@@ -55,7 +74,7 @@ async def chat_with_budul_ai(request: SimpleChatRequest):
         
         # Format response
         response = SimpleChatResponse(
-            response_id=result.get("response_id", str(uuid.uuid4())),
+            response_id=result.get("response_id") or request_uid,
             message=request.message,
             session_id=session_id,
             response_text=result.get("response", "No response generated"),
@@ -66,7 +85,7 @@ async def chat_with_budul_ai(request: SimpleChatRequest):
             related_topics=result.get("related_topics", []),
             requires_scholar_review=False,
             content_warnings=[],
-            generated_at=datetime.utcnow().isoformat(),
+            generated_at=_now_iso(),
             processing_time_ms=result.get("processing_time_ms", 1000.0)
         )
         
@@ -81,7 +100,7 @@ async def budul_ai_health():
     try:
         # Try to load model if not already loaded
         if not budul_ai.is_loaded:
-            success = budul_ai.load_model()
+            success = await run_in_threadpool(budul_ai.load_model)
             if not success:
                 return {
                     "status": "unhealthy",
@@ -109,7 +128,7 @@ async def budul_ai_health():
 async def load_budul_model():
     """Manually load the Budul AI model"""
     try:
-        success = budul_ai.load_model()
+        success = await run_in_threadpool(budul_ai.load_model)
         if success:
             return {
                 "message": "✅ Budul AI model loaded successfully!",
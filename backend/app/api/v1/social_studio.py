@@ -35,14 +35,23 @@ Admin Routes:
 - DELETE /api/v1/social/admin/templates/{id} - Delete template (super admin)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from sqlalchemy import and_, bindparam, delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Literal, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain, islice
+from types import MappingProxyType
+import hashlib
+import random
 import uuid
 
-from app.db.database import get_db
+import orjson
+import structlog
+
+from app.db.database import AsyncSessionLocal, get_db
 from app.db.models_multitenant import (
     SocialProfile,
     SocialPost,
@@ -57,29 +66,151 @@ from app.core.deps import (
     require_roles,
     require_feature
 )
-from app.core.permissions import UserRole, check_usage_limit
+from app.core.http_cache import cacheable_json_response, etag
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.permissions import check_usage_limit
+from app.core.saas_platform import saas_platform
+from app.core.usage_counter import MonthlyUsageCounter
 from pydantic import BaseModel, Field, validator
 
+logger = structlog.get_logger(__name__)
+
 router = APIRouter()
 
+# Generated post bodies are cached without the organization name so identical
+# requests from different tenants share one entry
+_POST_CONTENT_CACHE_PREFIX = "social:post_content"
+_POST_CONTENT_CACHE_TTL = 7 * 24 * 3600
+_ORG_NAME_PLACEHOLDER = "[MASJID_NAME]"
+
+# Month-to-date post counters, one key per organization and month
+_MONTHLY_POSTS = MonthlyUsageCounter("social:usage")
+
+# Post body per tone; unknown tones fall back to "professional"
+_TONE_TEMPLATES = {
+    "inspirational": "{intro}Alhamdulillah, let's reflect on {topic}. At {org}, we believe in the power of community and faith. {topic_title} reminds us of our purpose and connection to Allah SWT.{audience}",
+    "educational": "{intro}Did you know? {topic_title} is an important aspect of our faith. Join us at {org} to learn more about {topic} and deepen your understanding of Islam.{audience}",
+    "friendly": "{intro}Assalamu Alaikum! We're excited to share with you about {topic}. Come join us at {org} - your community masjid where everyone is family!{audience}",
+    "professional": "{intro}{org} invites you to explore {topic}. We offer comprehensive programs and resources to strengthen your faith and knowledge.{audience}",
+}
+
+# Bound str.format per tone, so dispatch is a single dict lookup and call
+_TONE_RENDERERS = MappingProxyType({tone: template.format for tone, template in _TONE_TEMPLATES.items()})
+_DEFAULT_TONE_RENDERER = _TONE_RENDERERS["professional"]
+
+# Only the chosen call to action is formatted
+_CALLS_TO_ACTION = (
+    "Visit {org} today!",
+    "Join our community programs.",
+    "Share with your family and friends!",
+    "Follow us for more Islamic content.",
+    "Contact us to learn more."
+)
+
+# Deletes spaces when turning a topic or occasion into a hashtag
+_STRIP_SPACES = str.maketrans("", "", " ")
+
+_BASE_HASHTAGS = ("#Islam", "#Muslim", "#Masjid", "#Community")
+
+# Extra tags for well-known occasions, keyed by lowercased occasion
+_OCCASION_HASHTAGS = MappingProxyType({
+    "ramadan": ("#Ramadan2024", "#BlessedMonth"),
+    "eid": ("#EidMubarak", "#EidAlFitr"),
+    "jummah": ("#JummahMubarak", "#FridayPrayer"),
+})
+
+# Hashtags per post; other platforms get 5
+_PLATFORM_HASHTAG_CAPS = MappingProxyType({
+    "twitter": 3,
+    "instagram": 10
+})
+
+# Platform-specific character limits
+_PLATFORM_CHAR_LIMITS = MappingProxyType({
+    "twitter": 280,
+    "instagram": 2200,
+    "facebook": 5000,
+    "linkedin": 3000
+})
+
+
+# ============================================================================
+# PRECOMPILED STATEMENTS
+# ============================================================================
+# Built once at import time so SQLAlchemy's compiled-statement cache stays warm;
+# per-request values are supplied through bind parameters.
+
+# GROUPING() bitmask over (platform, tone, topic): a bit is set when that
+# column is rolled up in the row's grouping set
+_GROUPED_BY_PLATFORM = 0b011
+_GROUPED_BY_TONE = 0b101
+_GROUPED_BY_TOPIC = 0b110
+_GROUPED_TOTAL = 0b111
+
+# Month-to-date post count, the fallback when the Redis usage counter is cold
+_MONTHLY_POST_COUNT = select(func.count(SocialPost.id)).where(
+    SocialPost.organization_id == bindparam("organization_id"),
+    SocialPost.created_at >= bindparam("month_start")
+)
+
+# Exactly the PostResponse fields, so list views get plain rows instead of
+# identity-mapped ORM instances
+_POST_RESPONSE_COLUMNS = (
+    SocialPost.id,
+    SocialPost.organization_id,
+    SocialPost.platform,
+    SocialPost.topic,
+    SocialPost.tone,
+    SocialPost.content,
+    SocialPost.hashtags,
+    SocialPost.word_count,
+    SocialPost.language,
+    SocialPost.target_audience,
+    SocialPost.occasion,
+    SocialPost.scheduled_for,
+    SocialPost.is_posted,
+    SocialPost.posted_at,
+    SocialPost.created_at,
+    SocialPost.updated_at
+)
+
+# All /stats aggregates in one round trip: per-platform, per-tone and
+# per-topic counts plus the overall and this-month totals
+_SOCIAL_STATS = select(
+    SocialPost.platform,
+    SocialPost.tone,
+    SocialPost.topic,
+    func.grouping(SocialPost.platform, SocialPost.tone, SocialPost.topic).label("grouping_id"),
+    func.count(SocialPost.id).label("post_count"),
+    func.count(SocialPost.id).filter(
+        SocialPost.created_at >= bindparam("month_start")
+    ).label("month_post_count")
+).where(
+    SocialPost.organization_id == bindparam("organization_id")
+).group_by(
+    func.grouping_sets(SocialPost.platform, SocialPost.tone, SocialPost.topic, tuple_())
+)
+
 
 # ============================================================================
 # PYDANTIC SCHEMAS
 # ============================================================================
 
+# Checked by pydantic-core; the before-validators below only lowercase input
+SocialPlatform = Literal['facebook', 'instagram', 'twitter', 'linkedin']
+PostTone = Literal['professional', 'friendly', 'inspirational', 'educational']
+
+
 class SocialProfileCreate(BaseModel):
     """Request body for creating a social profile"""
-    platform: str = Field(..., description="facebook, instagram, twitter, linkedin")
+    platform: SocialPlatform = Field(..., description="facebook, instagram, twitter, linkedin")
     profile_name: str = Field(..., min_length=1, max_length=100)
     profile_url: Optional[str] = Field(None, max_length=500)
     profile_handle: Optional[str] = Field(None, max_length=100, description="@username")
 
-    @validator('platform')
-    def validate_platform(cls, v):
-        allowed = ['facebook', 'instagram', 'twitter', 'linkedin']
-        if v.lower() not in allowed:
-            raise ValueError(f'Platform must be one of: {", ".join(allowed)}')
-        return v.lower()
+    @validator('platform', pre=True)
+    def lowercase_platform(cls, v):
+        return v.lower() if isinstance(v, str) else v
 
 
 class SocialProfileResponse(BaseModel):
@@ -100,8 +231,8 @@ class SocialProfileResponse(BaseModel):
 class PostGenerateRequest(BaseModel):
     """Request body for generating a social media post"""
     topic: str = Field(..., min_length=3, max_length=200, description="Post topic or theme")
-    platform: str = Field(..., description="Target platform: facebook, instagram, twitter, linkedin")
-    tone: str = Field(default="professional", description="professional, friendly, inspirational, educational")
+    platform: SocialPlatform = Field(..., description="Target platform: facebook, instagram, twitter, linkedin")
+    tone: PostTone = Field(default="professional", description="professional, friendly, inspirational, educational")
     include_hashtags: bool = Field(default=True)
     include_call_to_action: bool = Field(default=True)
     language: str = Field(default="en", description="en, ar")
@@ -110,19 +241,9 @@ class PostGenerateRequest(BaseModel):
     target_audience: Optional[str] = Field(None, max_length=100)
     occasion: Optional[str] = Field(None, max_length=100, description="Ramadan, Eid, Jummah, etc.")
 
-    @validator('platform')
-    def validate_platform(cls, v):
-        allowed = ['facebook', 'instagram', 'twitter', 'linkedin']
-        if v.lower() not in allowed:
-            raise ValueError(f'Platform must be one of: {", ".join(allowed)}')
-        return v.lower()
-
-    @validator('tone')
-    def validate_tone(cls, v):
-        allowed = ['professional', 'friendly', 'inspirational', 'educational']
-        if v.lower() not in allowed:
-            raise ValueError(f'Tone must be one of: {", ".join(allowed)}')
-        return v.lower()
+    @validator('platform', 'tone', pre=True)
+    def lowercase_choice(cls, v):
+        return v.lower() if isinstance(v, str) else v
 
 
 class PostUpdateRequest(BaseModel):
@@ -159,6 +280,16 @@ class PostResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @validator('hashtags', pre=True)
+    def default_hashtags(cls, v):
+        return v or []
+
+
+class PostListResponse(BaseModel):
+    """Page of posts with a keyset cursor for the next page"""
+    posts: List[PostResponse]
+    next_cursor: Optional[str] = None
+
 
 class SocialStatsResponse(BaseModel):
     """Statistics for social media usage"""
@@ -191,31 +322,13 @@ async def create_social_profile(
     request: SocialProfileCreate,
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(require_feature("social_studio")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create or update a social media profile for my organization.
     """
-    # Check if profile already exists for this platform
-    existing = db.query(SocialProfile).filter(
-        and_(
-            SocialProfile.organization_id == organization.id,
-            SocialProfile.platform == request.platform
-        )
-    ).first()
-
-    if existing:
-        # Update existing
-        existing.profile_name = request.profile_name
-        existing.profile_url = request.profile_url
-        existing.profile_handle = request.profile_handle
-        existing.is_active = True
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    # Create new
-    profile = SocialProfile(
+    # Insert or update the (organization, platform) profile atomically
+    stmt = pg_insert(SocialProfile).values(
         id=uuid.uuid4(),
         organization_id=organization.id,
         platform=request.platform,
@@ -224,10 +337,19 @@ async def create_social_profile(
         profile_handle=request.profile_handle,
         is_active=True
     )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SocialProfile.organization_id, SocialProfile.platform],
+        set_={
+            "profile_name": stmt.excluded.profile_name,
+            "profile_url": stmt.excluded.profile_url,
+            "profile_handle": stmt.excluded.profile_handle,
+            "is_active": True,
+            "updated_at": datetime.utcnow()
+        }
+    ).returning(SocialProfile)
 
-    db.add(profile)
-    db.commit()
-    db.refresh(profile)
+    profile = await db.scalar(stmt)
+    await db.commit()
 
     return profile
 
@@ -236,14 +358,17 @@ async def create_social_profile(
 async def get_my_social_profiles(
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all social media profiles for my organization.
     """
-    profiles = db.query(SocialProfile).filter(
-        SocialProfile.organization_id == organization.id
-    ).order_by(SocialProfile.created_at).all()
+    result = await db.execute(
+        select(SocialProfile).where(
+            SocialProfile.organization_id == organization.id
+        ).order_by(SocialProfile.created_at)
+    )
+    profiles = result.scalars().all()
 
     return profiles
 
@@ -253,23 +378,25 @@ async def delete_social_profile(
     profile_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a social media profile.
     """
-    profile = db.query(SocialProfile).filter(
-        and_(
-            SocialProfile.id == profile_id,
-            SocialProfile.organization_id == organization.id
-        )
-    ).first()
+    # Check and delete in one round trip
+    deleted_id = await db.scalar(
+        delete(SocialProfile).where(
+            and_(
+                SocialProfile.id == profile_id,
+                SocialProfile.organization_id == organization.id
+            )
+        ).returning(SocialProfile.id)
+    )
 
-    if not profile:
+    if not deleted_id:
         raise HTTPException(status_code=404, detail="Profile not found")
 
-    db.delete(profile)
-    db.commit()
+    await db.commit()
 
     return None
 
@@ -281,9 +408,10 @@ async def delete_social_profile(
 @router.post("/generate", response_model=PostResponse, status_code=201)
 async def generate_social_post(
     request: PostGenerateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(require_feature("social_studio")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Generate AI-powered social media post.
@@ -294,19 +422,14 @@ async def generate_social_post(
     - Enterprise: Unlimited
     """
     # Check monthly usage
-    current_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    monthly_count = db.query(func.count(SocialPost.id)).filter(
-        and_(
-            SocialPost.organization_id == organization.id,
-            SocialPost.created_at >= current_month_start
-        )
-    ).scalar()
+    now = datetime.utcnow()
+    monthly_count = await _get_monthly_post_count(db, organization.id, now)
 
     # Check usage limit
     check_usage_limit(organization.plan, "social_studio", monthly_count)
 
     # Generate post content based on platform and topic
-    content = _generate_post_content(
+    content = await _get_post_content(
         platform=request.platform,
         topic=request.topic,
         tone=request.tone,
@@ -338,7 +461,6 @@ async def generate_social_post(
         tone=request.tone,
         content=content,
         hashtags=hashtags,
-        word_count=len(content.split()),
         language=request.language,
         target_audience=request.target_audience,
         occasion=request.occasion,
@@ -346,91 +468,68 @@ async def generate_social_post(
     )
 
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
-
-    # Track usage
-    usage = FeatureUsage(
-        id=uuid.uuid4(),
-        organization_id=organization.id,
-        user_id=current_user.id,
-        feature_name="social_studio",
-        usage_type="post_generated",
-        metadata={
+    await db.commit()
+    await db.refresh(new_post)
+    await _MONTHLY_POSTS.bump(organization.id, now)
+
+    # Track usage after the response is sent
+    background_tasks.add_task(
+        _record_feature_usage,
+        organization.id,
+        current_user.id,
+        "post_generated",
+        {
             "post_id": str(new_post.id),
             "platform": request.platform,
             "topic": request.topic
         }
     )
-    db.add(usage)
-    db.commit()
-
-    return PostResponse(
-        id=new_post.id,
-        organization_id=new_post.organization_id,
-        platform=new_post.platform,
-        topic=new_post.topic,
-        tone=new_post.tone,
-        content=new_post.content,
-        hashtags=new_post.hashtags or [],
-        word_count=new_post.word_count,
-        language=new_post.language,
-        target_audience=new_post.target_audience,
-        occasion=new_post.occasion,
-        scheduled_for=new_post.scheduled_for,
-        is_posted=new_post.is_posted,
-        posted_at=new_post.posted_at,
-        created_at=new_post.created_at,
-        updated_at=new_post.updated_at
-    )
+
+    return PostResponse.model_validate(new_post)
 
 
-@router.get("/posts", response_model=List[PostResponse])
+@router.get("/posts", response_model=PostListResponse)
 async def get_my_posts(
     platform: Optional[str] = Query(None),
     occasion: Optional[str] = Query(None),
-    skip: int = Query(0, ge=0),
+    before: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Get all generated posts for my organization.
+    Get all generated posts for my organization, newest first.
+    Pass `before` to continue from a previous page.
     """
-    query = db.query(SocialPost).filter(
+    stmt = select(*_POST_RESPONSE_COLUMNS).where(
         SocialPost.organization_id == organization.id
     )
 
     if platform:
-        query = query.filter(SocialPost.platform == platform.lower())
+        stmt = stmt.where(SocialPost.platform == platform.lower())
     if occasion:
-        query = query.filter(SocialPost.occasion.ilike(f"%{occasion}%"))
-
-    query = query.order_by(SocialPost.created_at.desc())
-    posts = query.offset(skip).limit(limit).all()
-
-    return [
-        PostResponse(
-            id=post.id,
-            organization_id=post.organization_id,
-            platform=post.platform,
-            topic=post.topic,
-            tone=post.tone,
-            content=post.content,
-            hashtags=post.hashtags or [],
-            word_count=post.word_count,
-            language=post.language,
-            target_audience=post.target_audience,
-            occasion=post.occasion,
-            scheduled_for=post.scheduled_for,
-            is_posted=post.is_posted,
-            posted_at=post.posted_at,
-            created_at=post.created_at,
-            updated_at=post.updated_at
+        stmt = stmt.where(SocialPost.occasion.ilike(f"%{occasion}%"))
+
+    # Seek past the cursor instead of OFFSET so deep pages stay O(limit)
+    if before:
+        before_created_at, before_id = decode_cursor(before)
+        stmt = stmt.where(
+            tuple_(SocialPost.created_at, SocialPost.id) < tuple_(before_created_at, before_id)
         )
-        for post in posts
-    ]
+
+    stmt = stmt.order_by(SocialPost.created_at.desc(), SocialPost.id.desc())
+    result = await db.execute(stmt.limit(limit))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return PostListResponse(
+        posts=[PostResponse(**row._mapping) for row in rows],
+        next_cursor=next_cursor
+    )
 
 
 @router.get("/posts/{post_id}", response_model=PostResponse)
@@ -438,39 +537,25 @@ async def get_post_details(
     post_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get details of a specific post.
     """
-    post = db.query(SocialPost).filter(
-        and_(
-            SocialPost.id == post_id,
-            SocialPost.organization_id == organization.id
+    result = await db.execute(
+        select(SocialPost).where(
+            and_(
+                SocialPost.id == post_id,
+                SocialPost.organization_id == organization.id
+            )
         )
-    ).first()
+    )
+    post = result.scalars().first()
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    return PostResponse(
-        id=post.id,
-        organization_id=post.organization_id,
-        platform=post.platform,
-        topic=post.topic,
-        tone=post.tone,
-        content=post.content,
-        hashtags=post.hashtags or [],
-        word_count=post.word_count,
-        language=post.language,
-        target_audience=post.target_audience,
-        occasion=post.occasion,
-        scheduled_for=post.scheduled_for,
-        is_posted=post.is_posted,
-        posted_at=post.posted_at,
-        created_at=post.created_at,
-        updated_at=post.updated_at
-    )
+    return PostResponse.model_validate(post)
 
 
 @router.patch("/posts/{post_id}", response_model=PostResponse)
@@ -479,17 +564,20 @@ async def update_post(
     request: PostUpdateRequest,
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update a generated post.
     """
-    post = db.query(SocialPost).filter(
-        and_(
-            SocialPost.id == post_id,
-            SocialPost.organization_id == organization.id
+    result = await db.execute(
+        select(SocialPost).where(
+            and_(
+                SocialPost.id == post_id,
+                SocialPost.organization_id == organization.id
+            )
         )
-    ).first()
+    )
+    post = result.scalars().first()
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
@@ -497,7 +585,6 @@ async def update_post(
     # Update fields
     if request.content:
         post.content = request.content
-        post.word_count = len(request.content.split())
     if request.hashtags is not None:
         post.hashtags = request.hashtags
     if request.scheduled_for is not None:
@@ -505,27 +592,10 @@ async def update_post(
 
     post.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    await db.refresh(post)
 
-    return PostResponse(
-        id=post.id,
-        organization_id=post.organization_id,
-        platform=post.platform,
-        topic=post.topic,
-        tone=post.tone,
-        content=post.content,
-        hashtags=post.hashtags or [],
-        word_count=post.word_count,
-        language=post.language,
-        target_audience=post.target_audience,
-        occasion=post.occasion,
-        scheduled_for=post.scheduled_for,
-        is_posted=post.is_posted,
-        posted_at=post.posted_at,
-        created_at=post.created_at,
-        updated_at=post.updated_at
-    )
+    return PostResponse.model_validate(post)
 
 
 @router.delete("/posts/{post_id}", status_code=204)
@@ -533,23 +603,26 @@ async def delete_post(
     post_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a generated post.
     """
-    post = db.query(SocialPost).filter(
-        and_(
-            SocialPost.id == post_id,
-            SocialPost.organization_id == organization.id
-        )
-    ).first()
+    # Check and delete in one round trip
+    created_at = await db.scalar(
+        delete(SocialPost).where(
+            and_(
+                SocialPost.id == post_id,
+                SocialPost.organization_id == organization.id
+            )
+        ).returning(SocialPost.created_at)
+    )
 
-    if not post:
+    if not created_at:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    db.delete(post)
-    db.commit()
+    await db.commit()
+    await _MONTHLY_POSTS.bump(organization.id, created_at, -1)
 
     return None
 
@@ -559,23 +632,26 @@ async def regenerate_post(
     post_id: uuid.UUID,
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Regenerate a post with the same parameters but new content.
     """
-    post = db.query(SocialPost).filter(
-        and_(
-            SocialPost.id == post_id,
-            SocialPost.organization_id == organization.id
+    result = await db.execute(
+        select(SocialPost).where(
+            and_(
+                SocialPost.id == post_id,
+                SocialPost.organization_id == organization.id
+            )
         )
-    ).first()
+    )
+    post = result.scalars().first()
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
 
     # Generate new content
-    new_content = _generate_post_content(
+    new_content = await _get_post_content(
         platform=post.platform,
         topic=post.topic,
         tone=post.tone,
@@ -587,30 +663,12 @@ async def regenerate_post(
 
     # Update post
     post.content = new_content
-    post.word_count = len(new_content.split())
     post.updated_at = datetime.utcnow()
 
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    await db.refresh(post)
 
-    return PostResponse(
-        id=post.id,
-        organization_id=post.organization_id,
-        platform=post.platform,
-        topic=post.topic,
-        tone=post.tone,
-        content=post.content,
-        hashtags=post.hashtags or [],
-        word_count=post.word_count,
-        language=post.language,
-        target_audience=post.target_audience,
-        occasion=post.occasion,
-        scheduled_for=post.scheduled_for,
-        is_posted=post.is_posted,
-        posted_at=post.posted_at,
-        created_at=post.created_at,
-        updated_at=post.updated_at
-    )
+    return PostResponse.model_validate(post)
 
 
 # ============================================================================
@@ -619,6 +677,7 @@ async def regenerate_post(
 
 @router.get("/templates", response_model=List[TemplateResponse])
 async def get_templates(
+    request: Request,
     platform: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
     current_user: User = Depends(get_current_active_user)
@@ -626,80 +685,52 @@ async def get_templates(
     """
     Get available post templates.
     """
-    templates = _get_builtin_templates()
+    # Filter by platform and/or category
+    body, headers = _TEMPLATE_LIST_PAYLOADS.get(
+        (platform.lower() if platform else None, category.lower() if category else None),
+        _EMPTY_TEMPLATE_LIST_PAYLOAD
+    )
 
-    # Filter by platform
-    if platform:
-        templates = [t for t in templates if t["platform"] == platform.lower()]
-
-    # Filter by category
-    if category:
-        templates = [t for t in templates if t["category"] == category.lower()]
-
-    return [
-        TemplateResponse(
-            id=t["id"],
-            name=t["name"],
-            description=t["description"],
-            category=t["category"],
-            platform=t["platform"],
-            example_content=t["example_content"],
-            hashtags=t["hashtags"]
-        )
-        for t in templates
-    ]
+    return cacheable_json_response(request, body, headers)
 
 
 @router.get("/templates/{template_id}", response_model=TemplateResponse)
 async def get_template_details(
     template_id: str,
+    request: Request,
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Get details of a specific template.
     """
-    templates = _get_builtin_templates()
-    template = next((t for t in templates if t["id"] == template_id), None)
+    payload = _TEMPLATE_PAYLOADS_BY_ID.get(template_id)
 
-    if not template:
+    if not payload:
         raise HTTPException(status_code=404, detail="Template not found")
 
-    return TemplateResponse(
-        id=template["id"],
-        name=template["name"],
-        description=template["description"],
-        category=template["category"],
-        platform=template["platform"],
-        example_content=template["example_content"],
-        hashtags=template["hashtags"]
-    )
+    return cacheable_json_response(request, *payload)
 
 
 @router.post("/templates/{template_id}/use", response_model=PostResponse, status_code=201)
 async def use_template(
     template_id: str,
+    background_tasks: BackgroundTasks,
     custom_text: Optional[str] = Query(None, description="Custom text to personalize template"),
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(require_feature("social_studio")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Generate a post using a template.
     """
-    templates = _get_builtin_templates()
-    template = next((t for t in templates if t["id"] == template_id), None)
+    template = _TEMPLATES_BY_ID.get(template_id)
 
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
 
     # Check monthly usage
-    current_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    monthly_count = db.query(func.count(SocialPost.id)).filter(
-        and_(
-            SocialPost.organization_id == organization.id,
-            SocialPost.created_at >= current_month_start
-        )
-    ).scalar()
+    now = datetime.utcnow()
+    monthly_count = await _get_monthly_post_count(db, organization.id, now)
 
     check_usage_limit(organization.plan, "social_studio", monthly_count)
 
@@ -717,47 +748,27 @@ async def use_template(
         topic=template["name"],
         tone="professional",
         content=content,
-        hashtags=template["hashtags"],
-        word_count=len(content.split()),
+        hashtags=list(template["hashtags"]),
         language="en",
         is_posted=False
     )
 
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
-
-    # Track usage
-    usage = FeatureUsage(
-        id=uuid.uuid4(),
-        organization_id=organization.id,
-        user_id=current_user.id,
-        feature_name="social_studio",
-        usage_type="template_used",
-        metadata={"template_id": template_id, "template_name": template["name"]}
-    )
-    db.add(usage)
-    db.commit()
-
-    return PostResponse(
-        id=new_post.id,
-        organization_id=new_post.organization_id,
-        platform=new_post.platform,
-        topic=new_post.topic,
-        tone=new_post.tone,
-        content=new_post.content,
-        hashtags=new_post.hashtags or [],
-        word_count=new_post.word_count,
-        language=new_post.language,
-        target_audience=new_post.target_audience,
-        occasion=new_post.occasion,
-        scheduled_for=new_post.scheduled_for,
-        is_posted=new_post.is_posted,
-        posted_at=new_post.posted_at,
-        created_at=new_post.created_at,
-        updated_at=new_post.updated_at
+    await db.commit()
+    await db.refresh(new_post)
+    await _MONTHLY_POSTS.bump(organization.id, now)
+
+    # Track usage after the response is sent
+    background_tasks.add_task(
+        _record_feature_usage,
+        organization.id,
+        current_user.id,
+        "template_used",
+        {"template_id": template_id, "template_name": template["name"]}
     )
 
+    return PostResponse.model_validate(new_post)
+
 
 # ============================================================================
 # STATISTICS
@@ -767,54 +778,37 @@ async def use_template(
 async def get_social_stats(
     current_user: User = Depends(get_current_active_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get social media usage statistics for my organization.
     """
     from app.core.permissions import get_feature_limit
 
-    # Total posts
-    total = db.query(func.count(SocialPost.id)).filter(
-        SocialPost.organization_id == organization.id
-    ).scalar()
-
-    # Posts this month
     current_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    this_month = db.query(func.count(SocialPost.id)).filter(
-        and_(
-            SocialPost.organization_id == organization.id,
-            SocialPost.created_at >= current_month_start
-        )
-    ).scalar()
+    result = await db.execute(
+        _SOCIAL_STATS,
+        {"organization_id": organization.id, "month_start": current_month_start}
+    )
+
+    total = this_month = 0
+    by_platform, by_tone, topics = [], [], []
+    for row in result:
+        if row.grouping_id == _GROUPED_TOTAL:
+            total, this_month = row.post_count, row.month_post_count
+        elif row.grouping_id == _GROUPED_BY_PLATFORM:
+            by_platform.append((row.platform, row.post_count))
+        elif row.grouping_id == _GROUPED_BY_TONE:
+            by_tone.append((row.tone, row.post_count))
+        elif row.grouping_id == _GROUPED_BY_TOPIC:
+            topics.append((row.topic, row.post_count))
 
     # Monthly limit
     monthly_limit = get_feature_limit(organization.plan, "social_studio")
     remaining = max(0, monthly_limit - this_month) if monthly_limit != -1 else -1
 
-    # Posts by platform
-    by_platform = db.query(
-        SocialPost.platform,
-        func.count(SocialPost.id).label("count")
-    ).filter(
-        SocialPost.organization_id == organization.id
-    ).group_by(SocialPost.platform).all()
-
-    # Posts by tone
-    by_tone = db.query(
-        SocialPost.tone,
-        func.count(SocialPost.id).label("count")
-    ).filter(
-        SocialPost.organization_id == organization.id
-    ).group_by(SocialPost.tone).all()
-
     # Most used topics
-    topics = db.query(
-        SocialPost.topic,
-        func.count(SocialPost.id).label("count")
-    ).filter(
-        SocialPost.organization_id == organization.id
-    ).group_by(SocialPost.topic).order_by(func.count(SocialPost.id).desc()).limit(5).all()
+    topics = sorted(topics, key=lambda topic_count: topic_count[1], reverse=True)[:5]
 
     return SocialStatsResponse(
         total_posts_generated=total,
@@ -831,6 +825,7 @@ async def get_social_stats(
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=1024)
 def _generate_post_content(
     platform: str,
     topic: str,
@@ -844,131 +839,268 @@ def _generate_post_content(
     Generate AI-powered social media post content.
     This is a simplified version - in production, use OpenAI/Claude API.
     """
-    # Platform-specific character limits
-    limits = {
-        "twitter": 280,
-        "instagram": 2200,
-        "facebook": 5000,
-        "linkedin": 3000
-    }
+    content = _compose_post_content(
+        topic=topic,
+        tone=tone,
+        organization_name=organization_name,
+        target_audience=target_audience,
+        occasion=occasion
+    )
+    return _fit_to_platform(content, platform)
 
-    # Generate content based on parameters
-    if occasion:
-        intro = f"As we approach {occasion}, "
-    else:
-        intro = ""
 
-    if tone == "inspirational":
-        content = f"{intro}Alhamdulillah, let's reflect on {topic}. At {organization_name}, we believe in the power of community and faith. {topic.capitalize()} reminds us of our purpose and connection to Allah SWT."
-    elif tone == "educational":
-        content = f"{intro}Did you know? {topic.capitalize()} is an important aspect of our faith. Join us at {organization_name} to learn more about {topic} and deepen your understanding of Islam."
-    elif tone == "friendly":
-        content = f"{intro}Assalamu Alaikum! We're excited to share with you about {topic}. Come join us at {organization_name} - your community masjid where everyone is family!"
-    else:  # professional
-        content = f"{intro}{organization_name} invites you to explore {topic}. We offer comprehensive programs and resources to strengthen your faith and knowledge."
+async def _get_post_content(
+    platform: str,
+    topic: str,
+    tone: str,
+    organization_name: str,
+    target_audience: Optional[str] = None,
+    occasion: Optional[str] = None,
+    language: str = "en"
+) -> str:
+    """
+    Same result as _generate_post_content, served from a Redis cache keyed by
+    the request parameters (minus the organization name) when Redis is up.
+    """
+    redis_client = saas_platform.redis_client
+    if redis_client is None:
+        return _generate_post_content(
+            platform=platform,
+            topic=topic,
+            tone=tone,
+            organization_name=organization_name,
+            target_audience=target_audience,
+            occasion=occasion,
+            language=language
+        )
+
+    params = orjson.dumps(
+        {
+            "platform": platform,
+            "topic": topic,
+            "tone": tone,
+            "language": language,
+            "occasion": occasion,
+            "target_audience": target_audience
+        },
+        option=orjson.OPT_SORT_KEYS
+    )
+    key = f"{_POST_CONTENT_CACHE_PREFIX}:{hashlib.sha256(params).hexdigest()}"
+
+    draft = None
+    try:
+        cached = await redis_client.get(key)
+        if cached:
+            draft = cached.decode() if isinstance(cached, bytes) else cached
+    except Exception as e:
+        logger.warning("post_content_cache_read_failed", key=key, error=repr(e))
+
+    if draft is None:
+        draft = _compose_post_content(
+            topic=topic,
+            tone=tone,
+            organization_name=_ORG_NAME_PLACEHOLDER,
+            target_audience=target_audience,
+            occasion=occasion
+        )
+        try:
+            await redis_client.setex(key, _POST_CONTENT_CACHE_TTL, draft)
+        except Exception as e:
+            logger.warning("post_content_cache_write_failed", key=key, error=repr(e))
+
+    content = draft.replace(_ORG_NAME_PLACEHOLDER, organization_name)
+    return _fit_to_platform(content, platform)
+
+
+def _fit_to_platform(content: str, platform: str) -> str:
+    """
+    Trim content to the platform's character limit, slicing only when it is over.
+    """
+    limit = _PLATFORM_CHAR_LIMITS.get(platform, 2000)
+    return content if len(content) <= limit else content[:limit]
+
 
-    if target_audience:
-        content += f" Perfect for {target_audience}."
+def _compose_post_content(
+    topic: str,
+    tone: str,
+    organization_name: str,
+    target_audience: Optional[str] = None,
+    occasion: Optional[str] = None
+) -> str:
+    """
+    Build the untruncated post body.
+    """
+    render = _TONE_RENDERERS.get(tone, _DEFAULT_TONE_RENDERER)
+    return render(
+        intro=f"As we approach {occasion}, " if occasion else "",
+        topic=topic,
+        topic_title=topic.capitalize(),
+        org=organization_name,
+        audience=f" Perfect for {target_audience}." if target_audience else ""
+    )
+
+
+async def _record_feature_usage(
+    organization_id: uuid.UUID,
+    user_id: uuid.UUID,
+    action: str,
+    request_data: dict
+) -> None:
+    """Insert a social_studio FeatureUsage row in its own short-lived session"""
+    try:
+        async with AsyncSessionLocal() as session:
+            session.add(FeatureUsage(
+                id=uuid.uuid4(),
+                organization_id=organization_id,
+                user_id=user_id,
+                feature_name="social_studio",
+                action=action,
+                request_data=request_data,
+                success=True,
+                created_at=datetime.utcnow(),
+            ))
+            await session.commit()
+    except Exception as e:
+        logger.error("feature_usage_record_failed", feature="social_studio", action=action, error=repr(e))
+
+
+async def _get_monthly_post_count(db: AsyncSession, organization_id: uuid.UUID, now: datetime) -> int:
+    """
+    Posts created by an organization this month, from the Redis counter when primed.
+    """
+    async def count_since(month_start: datetime) -> int:
+        return await db.scalar(
+            _MONTHLY_POST_COUNT,
+            {"organization_id": organization_id, "month_start": month_start}
+        )
 
-    return content[:limits.get(platform, 2000)]
+    return await _MONTHLY_POSTS.get(organization_id, now, count_since)
 
 
 def _generate_hashtags(topic: str, platform: str, occasion: Optional[str] = None) -> List[str]:
     """
     Generate relevant hashtags for the post.
     """
-    base_tags = ["#Islam", "#Muslim", "#Masjid", "#Community"]
+    # Fresh list per call; the memoized tuple is shared
+    return list(_hashtags_for(topic, platform, occasion))
 
-    # Topic-specific tags
-    topic_tags = [f"#{topic.replace(' ', '')}"]
 
-    # Occasion-specific tags
-    occasion_tags = []
+@lru_cache(maxsize=1024)
+def _hashtags_for(topic: str, platform: str, occasion: Optional[str]) -> Tuple[str, ...]:
+    """
+    Memoized hashtag selection behind _generate_hashtags.
+    """
+    topic_clean = topic.translate(_STRIP_SPACES)
+
+    occasion_tag, occasion_extras = (), ()
     if occasion:
-        occasion_tags = [f"#{occasion.replace(' ', '')}"]
-        if occasion.lower() == "ramadan":
-            occasion_tags.extend(["#Ramadan2024", "#BlessedMonth"])
-        elif occasion.lower() == "eid":
-            occasion_tags.extend(["#EidMubarak", "#EidAlFitr"])
-        elif occasion.lower() == "jummah":
-            occasion_tags.extend(["#JummahMubarak", "#FridayPrayer"])
-
-    # Platform-specific count
-    if platform == "twitter":
-        return (base_tags + topic_tags + occasion_tags)[:3]
-    elif platform == "instagram":
-        return (base_tags + topic_tags + occasion_tags)[:10]
-    else:
-        return (base_tags + topic_tags + occasion_tags)[:5]
+        occasion_tag = (f"#{occasion.translate(_STRIP_SPACES)}",)
+        occasion_extras = _OCCASION_HASHTAGS.get(occasion.lower(), ())
+
+    # Base, topic and occasion tags, taken lazily up to the platform's cap
+    tags = chain(_BASE_HASHTAGS, (f"#{topic_clean}",), occasion_tag, occasion_extras)
+    return tuple(islice(tags, _PLATFORM_HASHTAG_CAPS.get(platform, 5)))
 
 
 def _generate_call_to_action(platform: str, organization_name: str) -> str:
     """
     Generate call to action for the post.
     """
-    ctas = [
-        f"Visit {organization_name} today!",
-        "Join our community programs.",
-        "Share with your family and friends!",
-        "Follow us for more Islamic content.",
-        "Contact us to learn more."
-    ]
+    cta = random.choice(_CALLS_TO_ACTION)
+    return cta.format(org=organization_name) if "{org}" in cta else cta
+
+
+# Read-only so the shared entries can be handed out without copying
+_BUILTIN_TEMPLATES: Tuple[MappingProxyType, ...] = tuple(MappingProxyType(t) for t in (
+    {
+        "id": "jummah-reminder",
+        "name": "Jummah Reminder",
+        "description": "Weekly Friday prayer reminder",
+        "category": "prayer",
+        "platform": "instagram",
+        "example_content": "Jummah Mubarak! 🕌\n\nJoin us at [MASJID_NAME] for Jummah prayer this Friday.\n\nKhutbah starts at 1:00 PM\nPrayer at 1:30 PM\n\nMay Allah accept your prayers and grant you ease.",
+        "hashtags": ("#JummahMubarak", "#FridayPrayer", "#Islam", "#Muslim", "#Masjid")
+    },
+    {
+        "id": "ramadan-iftar",
+        "name": "Ramadan Iftar Invitation",
+        "description": "Invite community to iftar",
+        "category": "event",
+        "platform": "facebook",
+        "example_content": "🌙 Ramadan Kareem!\n\n[MASJID_NAME] invites you to join us for community Iftar this evening.\n\nIftar Time: Maghrib\nLocation: Main Prayer Hall\n\nBring your family and friends. Everyone is welcome!\n\nMay Allah accept your fasting and prayers.",
+        "hashtags": ("#Ramadan", "#Iftar", "#Community", "#Islam", "#Masjid")
+    },
+    {
+        "id": "fundraiser",
+        "name": "Fundraiser Announcement",
+        "description": "Announce fundraising campaign",
+        "category": "fundraising",
+        "platform": "linkedin",
+        "example_content": "Support Your Community Masjid\n\n[MASJID_NAME] is launching a fundraising campaign to expand our facilities and serve more community members.\n\nYour donations will help us:\n✅ Expand prayer facilities\n✅ Enhance educational programs\n✅ Support community services\n\nDonate today and earn continuous rewards. Every contribution makes a difference.",
+        "hashtags": ("#Sadaqah", "#Charity", "#CommunitySupport", "#Islam", "#Masjid")
+    },
+    {
+        "id": "quran-class",
+        "name": "Quran Class Announcement",
+        "description": "Promote Quran learning programs",
+        "category": "education",
+        "platform": "instagram",
+        "example_content": "📖 Learn the Quran with us!\n\n[MASJID_NAME] is offering Quran classes for all ages.\n\n🎯 Tajweed & Recitation\n🎯 Memorization (Hifz)\n🎯 Arabic Language\n\nEnrollment is now open. Limited seats available!\n\nContact us to register your family today.",
+        "hashtags": ("#QuranClass", "#IslamicEducation", "#LearnQuran", "#Masjid", "#Community")
+    },
+    {
+        "id": "eid-wishes",
+        "name": "Eid Mubarak Wishes",
+        "description": "Eid greetings to community",
+        "category": "occasion",
+        "platform": "facebook",
+        "example_content": "🌙 Eid Mubarak! 🌙\n\nFrom all of us at [MASJID_NAME], we wish you and your family a blessed Eid filled with joy, peace, and prosperity.\n\nEid Prayer Details:\nTime: 8:00 AM & 9:30 AM\nLocation: Main Prayer Hall\n\nTaqabbal Allahu minna wa minkum!\nMay Allah accept from us and from you!",
+        "hashtags": ("#EidMubarak", "#EidAlFitr", "#Islam", "#Muslim", "#Celebration")
+    }
+))
 
-    import random
-    return random.choice(ctas)
 
+def _get_builtin_templates() -> Tuple[MappingProxyType, ...]:
+    """
+    Get built-in post templates (shared module-level constant).
+    """
+    return _BUILTIN_TEMPLATES
 
-def _get_builtin_templates() -> List[dict]:
+
+def _build_template_index(
+    templates: Tuple[dict, ...]
+) -> Dict[Tuple[Optional[str], Optional[str]], Tuple[dict, ...]]:
     """
-    Get list of built-in post templates.
+    Index templates by (platform, category), with None meaning "any", so every
+    filter combination accepted by GET /templates is a single dict lookup.
     """
-    return [
-        {
-            "id": "jummah-reminder",
-            "name": "Jummah Reminder",
-            "description": "Weekly Friday prayer reminder",
-            "category": "prayer",
-            "platform": "instagram",
-            "example_content": "Jummah Mubarak! 🕌\n\nJoin us at [MASJID_NAME] for Jummah prayer this Friday.\n\nKhutbah starts at 1:00 PM\nPrayer at 1:30 PM\n\nMay Allah accept your prayers and grant you ease.",
-            "hashtags": ["#JummahMubarak", "#FridayPrayer", "#Islam", "#Muslim", "#Masjid"]
-        },
-        {
-            "id": "ramadan-iftar",
-            "name": "Ramadan Iftar Invitation",
-            "description": "Invite community to iftar",
-            "category": "event",
-            "platform": "facebook",
-            "example_content": "🌙 Ramadan Kareem!\n\n[MASJID_NAME] invites you to join us for community Iftar this evening.\n\nIftar Time: Maghrib\nLocation: Main Prayer Hall\n\nBring your family and friends. Everyone is welcome!\n\nMay Allah accept your fasting and prayers.",
-            "hashtags": ["#Ramadan", "#Iftar", "#Community", "#Islam", "#Masjid"]
-        },
-        {
-            "id": "fundraiser",
-            "name": "Fundraiser Announcement",
-            "description": "Announce fundraising campaign",
-            "category": "fundraising",
-            "platform": "linkedin",
-            "example_content": "Support Your Community Masjid\n\n[MASJID_NAME] is launching a fundraising campaign to expand our facilities and serve more community members.\n\nYour donations will help us:\n✅ Expand prayer facilities\n✅ Enhance educational programs\n✅ Support community services\n\nDonate today and earn continuous rewards. Every contribution makes a difference.",
-            "hashtags": ["#Sadaqah", "#Charity", "#CommunitySupport", "#Islam", "#Masjid"]
-        },
-        {
-            "id": "quran-class",
-            "name": "Quran Class Announcement",
-            "description": "Promote Quran learning programs",
-            "category": "education",
-            "platform": "instagram",
-            "example_content": "📖 Learn the Quran with us!\n\n[MASJID_NAME] is offering Quran classes for all ages.\n\n🎯 Tajweed & Recitation\n🎯 Memorization (Hifz)\n🎯 Arabic Language\n\nEnrollment is now open. Limited seats available!\n\nContact us to register your family today.",
-            "hashtags": ["#QuranClass", "#IslamicEducation", "#LearnQuran", "#Masjid", "#Community"]
-        },
-        {
-            "id": "eid-wishes",
-            "name": "Eid Mubarak Wishes",
-            "description": "Eid greetings to community",
-            "category": "occasion",
-            "platform": "facebook",
-            "example_content": "🌙 Eid Mubarak! 🌙\n\nFrom all of us at [MASJID_NAME], we wish you and your family a blessed Eid filled with joy, peace, and prosperity.\n\nEid Prayer Details:\nTime: 8:00 AM & 9:30 AM\nLocation: Main Prayer Hall\n\nTaqabbal Allahu minna wa minkum!\nMay Allah accept from us and from you!",
-            "hashtags": ["#EidMubarak", "#EidAlFitr", "#Islam", "#Muslim", "#Celebration"]
-        }
-    ]
+    index: Dict[Tuple[Optional[str], Optional[str]], List[dict]] = {}
+    for template in templates:
+        platform, category = template["platform"], template["category"]
+        for key in ((None, None), (platform, None), (None, category), (platform, category)):
+            index.setdefault(key, []).append(template)
+    return {key: tuple(matches) for key, matches in index.items()}
+
+
+def _template_payload(body: bytes) -> Tuple[bytes, Dict[str, str]]:
+    """Pair a serialized template payload with its caching headers"""
+    return body, {"Cache-Control": "public, max-age=3600", "ETag": etag(body)}
+
+
+_TEMPLATES_BY_ID = {t["id"]: t for t in _get_builtin_templates()}
+_TEMPLATE_INDEX = _build_template_index(_get_builtin_templates())
+
+# Built-in templates never change at runtime, so every response body the
+# template routes can return is serialized once here
+_TEMPLATE_PAYLOADS_BY_ID = {
+    template_id: _template_payload(orjson.dumps(TemplateResponse(**t).model_dump()))
+    for template_id, t in _TEMPLATES_BY_ID.items()
+}
+_TEMPLATE_LIST_PAYLOADS = {
+    key: _template_payload(orjson.dumps([TemplateResponse(**t).model_dump() for t in templates]))
+    for key, templates in _TEMPLATE_INDEX.items()
+}
+_EMPTY_TEMPLATE_LIST_PAYLOAD = _template_payload(b"[]")
 
 
 # Note: In production, integrate with OpenAI/Claude API for true AI generation
@@ -3,16 +3,21 @@ Global Waqaf Tech - Kids Story Studio API
 Multi-tenant Islamic story generator for children with AI
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from pydantic import BaseModel
-from typing import Optional, List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel, ConfigDict
+from typing import Literal, Optional, List, get_args
 from datetime import datetime
 import uuid
 
-from app.db.database import get_db
-from app.db.models_multitenant import User, Organization, StoryGeneration
+import orjson
+import structlog
+
+from app.data.stories_database import STORIES_DATABASE
+from app.db.database import AsyncSessionLocal, get_db
+from app.db.models_multitenant import User, Organization, StoryGeneration, FeatureUsage
 from app.core.deps import (
     get_current_user,
     get_current_organization,
@@ -20,26 +25,34 @@ from app.core.deps import (
     get_pagination_params,
 )
 from app.core.permissions import get_feature_limit, check_usage_limit
+from app.core.usage_counter import MonthlyUsageCounter
 
+logger = structlog.get_logger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
 # ============================================================================
 
+AgeRange = Literal["3-5", "5-8", "9-12"]
+StoryStyle = Literal["short", "medium", "long"]
+
+
 class StoryGenerateRequest(BaseModel):
     """Request to generate a story"""
     theme: str  # honesty, kindness, gratitude, salah, etc.
-    age_range: str = "5-8"  # 3-5, 5-8, 9-12
-    style: str = "short"  # short, medium, long
+    age_range: AgeRange = "5-8"
+    style: StoryStyle = "short"
     language: str = "en"
     custom_prompt: Optional[str] = None
 
 
 class StoryResponse(BaseModel):
     """Story response with all details"""
+    model_config = ConfigDict(frozen=True, from_attributes=True, validate_assignment=False)
+
     id: str
     title: str
     content: str
@@ -55,9 +68,6 @@ class StoryResponse(BaseModel):
     rating: Optional[int]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class StoryListResponse(BaseModel):
     """List of stories with pagination"""
@@ -78,135 +88,76 @@ class StoryUpdateRequest(BaseModel):
 # STORY DATABASE
 # ============================================================================
 
-STORIES_DATABASE = {
-    "honesty": {
-        "title": "The Truthful Merchant of Madinah",
-        "content": """Once upon a time in the beautiful city of Madinah, there lived a young merchant named Bilal. Bilal sold dates and honey in the marketplace, and he was known for his kindness and bright smile.
-
-One busy day, a traveler came to his stall and bought a large bag of dates. The traveler was in a hurry to catch his caravan, so he quickly paid and rushed away. After he left, Bilal noticed he had accidentally given the man old dates instead of the fresh ones he had paid for!
-
-Even though the traveler was far away and would never know about the mistake, Bilal's heart felt heavy. He remembered what Prophet Muhammad (peace be upon him) taught: "Truthfulness leads to righteousness, and righteousness leads to Paradise."
-
-Bilal immediately closed his stall and ran through the marketplace, past the city gates, until he found the traveler preparing to leave. Out of breath, Bilal explained his mistake and gave him the fresh dates, taking back the old ones.
-
-The traveler was amazed! "You could have kept quiet, and I would never have known," he said.
-
-Bilal smiled and replied, "But Allah would have known, and that is what matters most."
-
-The traveler was so impressed by Bilal's honesty that he told everyone in the marketplace about the truthful merchant. Soon, people from all over came to buy from Bilal because they knew they could trust him.
-
-Bilal's business grew, and he became successful. But more importantly, he had pleased Allah by being honest, and that made him the happiest of all!""",
-        "moral": "Always tell the truth, even when no one is watching. Allah sees everything, and honesty brings blessings in this life and the next.",
-        "teaching": "The Prophet Muhammad (peace be upon him) said: 'Truthfulness leads to righteousness, and righteousness leads to Paradise.' Being honest, even when it's difficult, is one of the most important qualities of a Muslim.",
-        "questions": [
-            "Why did Bilal run after the traveler even though the traveler didn't know about the mistake?",
-            "How did being honest help Bilal's business in the end?",
-            "Can you think of a time when you told the truth even though it was hard?"
-        ],
-        "verses": [
-            "Quran 9:119 - 'O you who have believed, fear Allah and be with those who are true.'",
-            "Hadith - 'Truthfulness leads to righteousness, and righteousness leads to Paradise.'"
-        ]
-    },
-    "kindness": {
-        "title": "Aisha and the Kind Neighbor",
-        "content": """In a peaceful village, there lived a young girl named Aisha who loved helping others. She lived next door to Umm Hassan, an elderly woman who lived alone and sometimes found it hard to do everyday tasks.
-
-Every Friday after Jumu'ah prayer, Aisha would visit Umm Hassan. Sometimes she would help clean the house, sometimes she would read Quran to her, and sometimes they would just sit and talk. Aisha's mother had taught her that being kind to neighbors is one of the best deeds in Islam.
-
-One cold winter day, Umm Hassan fell ill with a fever. When Aisha heard the news, she immediately told her family. Her mother made warm soup, her father brought medicine, and Aisha brought warm blankets.
-
-Every day, Aisha's family took turns checking on Umm Hassan, bringing her food, and making sure she was comfortable. They didn't do it because they expected anything in return – they did it because it was the right thing to do.
-
-After two weeks, Umm Hassan felt better. When spring came, her garden bloomed with beautiful flowers. She called Aisha over and said, "These flowers are lovely, but they are nothing compared to the beautiful kindness you and your family showed me. You treated me like I was your own grandmother!"
-
-Tears of happiness filled Umm Hassan's eyes. She made du'a for Aisha and her family, asking Allah to bless them always.
-
-Aisha learned that small acts of kindness can make a big difference in someone's life, and that being good to neighbors is one of the things that pleases Allah the most.""",
-        "moral": "Be kind to your neighbors and help those in need. Small acts of kindness can make a huge difference in someone's life.",
-        "teaching": "The Prophet (peace be upon him) said: 'Whoever believes in Allah and the Last Day, let him be kind to his neighbor.' Taking care of neighbors, especially elderly ones, is a beautiful sunnah.",
-        "questions": [
-            "What are some things Aisha did to help Umm Hassan?",
-            "Why is it important to be kind to our neighbors?",
-            "What is one kind thing you can do for your neighbor this week?"
-        ],
-        "verses": [
-            "Quran 4:36 - 'Worship Allah and associate nothing with Him, and to parents do good, and to relatives, orphans, the needy, the near neighbor, the neighbor farther away...'",
-            "Hadith - 'The best of companions in the sight of Allah is the best to his companion, and the best of neighbors is the best to his neighbor.'"
-        ]
-    },
-    "salah": {
-        "title": "Omar's Special Meetings with Allah",
-        "content": """Omar was a curious seven-year-old boy who loved asking questions. One day, he asked his father, "Baba, why do we pray five times every day?"
-
-His father smiled and said, "Let me tell you a story that will help you understand."
-
-"Imagine if you had a best friend who lived far away," his father began. "Would you like to talk to them every day?"
-
-"Yes!" Omar said excitedly.
-
-"Well, Allah is better than any friend, and salah is our special meeting with Him! Five times a day, we get to talk to Allah, thank Him, ask Him for help, and remember how much He loves us."
-
-Omar's eyes widened with understanding. From that day on, he started looking at salah differently. Instead of thinking it was just something he had to do, he realized it was something special – his private meeting with Allah!
-
-When he prayed Fajr in the morning, he would say, "Good morning, Allah! Thank you for this new day!"
-
-At Dhuhr, he would think about all the good things that happened in the morning and thank Allah for them.
-
-Asr prayer reminded him that the day was almost over, so he should do something good before it ends.
-
-At Maghrib, he would ask Allah to forgive any mistakes he made that day.
-
-And at Isha, before going to sleep, he would ask Allah to protect him through the night.
-
-Omar's little sister noticed how happy he looked when he prayed. "Why are you smiling?" she asked.
-
-"Because," Omar said, "I'm meeting with Allah, and that makes me the happiest person in the world!"
-
-His sister smiled too, and from then on, they both loved their special meetings with Allah.""",
-        "moral": "Salah is not just a duty – it's a special gift that lets us connect with Allah five times a day!",
-        "teaching": "Prayer (salah) is the second pillar of Islam and our direct connection to Allah. The Prophet (peace be upon him) said that salah is 'the coolness of his eyes' – meaning it brought him peace and joy!",
-        "questions": [
-            "How many times do we pray each day? Can you name them?",
-            "What does Omar compare salah to in the story?",
-            "How do you feel when you pray? What do you like to thank Allah for?"
-        ],
-        "verses": [
-            "Quran 29:45 - 'Indeed, prayer prohibits immorality and wrongdoing, and the remembrance of Allah is greater.'",
-            "Hadith - 'The first thing that a person will be questioned about on the Day of Judgment is salah.'"
-        ]
-    },
-    "gratitude": {
-        "title": "The Grateful Farmer's Secret",
-        "content": """In a small village, there were two farmers who lived next to each other. The first farmer, Omar, had a small farm with a few sheep, some chickens, and a small vegetable garden. The second farmer, Khalid, had a much larger farm with many animals and big fields of crops.
-
-Every morning, Omar would wake up before Fajr prayer and say, "Alhamdulillah! All praise is for Allah!" He was grateful for everything he had, even though it was small.
-
-Khalid, on the other hand, was never happy. Even though he had more than Omar, he always wanted more animals, bigger crops, and a larger house. He rarely said Alhamdulillah.
+_THEME_KEYS = tuple(STORIES_DATABASE)
+_THEME_KEYS_CSV = ", ".join(_THEME_KEYS)
+
+# 404 detail for an unknown theme; only the requested theme is filled in per miss
+_THEME_NOT_FOUND_DETAIL = "Story for theme '{}' not found. Available themes: " + _THEME_KEYS_CSV
+
+# /themes only reflects static data, so its body is serialized once
+_THEMES_BODY = orjson.dumps({
+    "themes": _THEME_KEYS,
+    "total": len(_THEME_KEYS),
+    "age_ranges": list(get_args(AgeRange)),
+    "styles": list(get_args(StoryStyle)),
+    "categories": {
+        "character": ["honesty", "kindness", "gratitude"],
+        "worship": ["salah"],
+        "more_coming": "Additional themes will be added regularly"
+    }
+})
 
-One year, there was very little rain. Many farmers lost their crops. Omar's small garden survived because he had always taken good care of it and planted strong seeds. He still said, "Alhamdulillah!"
+# Month-to-date stories per organization, the fallback for a cold Redis counter
+_MONTHLY_STORY_COUNT = select(func.count(StoryGeneration.id)).where(
+    StoryGeneration.organization_id == bindparam("organization_id"),
+    StoryGeneration.created_at >= bindparam("month_start")
+)
 
-Khalid's large farm suffered greatly because he had been careless. He became very sad and asked Omar, "How can you still be grateful when times are so hard?"
+_MONTHLY_STORIES = MonthlyUsageCounter("usage:story_studio")
+
+# All /stats/usage aggregates for one organization in a single statement
+_STORY_USAGE_STATS = select(
+    func.count(StoryGeneration.id).label("total_stories"),
+    func.count(StoryGeneration.id).filter(
+        StoryGeneration.created_at >= bindparam("month_start")
+    ).label("monthly_usage"),
+    func.count(StoryGeneration.id).filter(
+        StoryGeneration.is_saved == True
+    ).label("saved_count"),
+    func.coalesce(func.sum(StoryGeneration.read_count), 0).label("total_reads")
+).where(
+    StoryGeneration.organization_id == bindparam("organization_id")
+)
 
-Omar smiled warmly and said, "My dear neighbor, I have my health, my family, my faith, and food to eat. I have a roof over my head and clothes on my back. Allah has given me more than I truly need! When we say Alhamdulillah and are grateful for what we have, we see how rich we really are."
+# Story fields per theme, unpacked in one step by generate_story
+_STORY_FIELDS = {
+    theme: (d["title"], d["content"], d["moral"], d["teaching"], d["questions"], d["verses"])
+    for theme, d in STORIES_DATABASE.items()
+}
 
-Khalid thought about this deeply. That night, for the first time in years, he truly thanked Allah for all his blessings. He realized that gratitude wasn't about having everything – it was about appreciating everything you have.
 
-From that day on, both farmers could be heard saying "Alhamdulillah!" and they both lived happily, not because they had everything, but because they were grateful for what Allah had given them.""",
-        "moral": "Always be grateful for what you have. When we thank Allah by saying Alhamdulillah, we realize how truly blessed we are!",
-        "teaching": "Allah says in the Quran: 'If you are grateful, I will surely increase you in favor' (14:7). The Prophet Muhammad (peace be upon him) taught us that gratitude is the key to happiness and more blessings.",
-        "questions": [
-            "What was the difference between Omar and Khalid at the beginning of the story?",
-            "Why was Omar happy even when there was very little rain?",
-            "What are three things you are grateful for today?"
-        ],
-        "verses": [
-            "Quran 14:7 - 'If you are grateful, I will surely increase you in favor.'",
-            "Hadith - 'He who does not thank people, does not thank Allah.'",
-            "Sunnah - The Prophet (peace be upon him) would say Alhamdulillah for everything, in good times and in difficult times."
-        ]
-    }
-}
+async def _write_feature_usage(
+    organization_id: uuid.UUID,
+    user_id: uuid.UUID,
+    theme: str,
+    age_range: str
+) -> None:
+    """Insert the story_studio FeatureUsage row in its own short-lived session"""
+    try:
+        async with AsyncSessionLocal() as session:
+            session.add(FeatureUsage(
+                id=uuid.uuid4(),
+                organization_id=organization_id,
+                user_id=user_id,
+                feature_name="story_studio",
+                action="generate",
+                request_data={"theme": theme, "age_range": age_range},
+                success=True,
+                created_at=datetime.utcnow(),
+            ))
+            await session.commit()
+    except Exception as e:
+        logger.error("feature_usage_record_failed", feature="story_studio", error=repr(e))
 
 
 # ============================================================================
@@ -216,9 +167,10 @@ From that day on, both farmers could be heard saying "Alhamdulillah!" and they b
 @router.post("/generate", response_model=StoryResponse)
 async def generate_story(
     request: StoryGenerateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(require_feature("story_studio")),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Generate an Islamic kids story
@@ -228,28 +180,29 @@ async def generate_story(
     - Tracks usage for the organization
     """
     # Check monthly usage limit
-    current_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    now = datetime.utcnow()
 
-    monthly_count = db.query(func.count(StoryGeneration.id)).filter(
-        and_(
-            StoryGeneration.organization_id == organization.id,
-            StoryGeneration.created_at >= current_month_start
+    async def count_since(month_start: datetime) -> int:
+        return await db.scalar(
+            _MONTHLY_STORY_COUNT,
+            {"organization_id": organization.id, "month_start": month_start}
         )
-    ).scalar()
+
+    monthly_count = await _MONTHLY_STORIES.get(organization.id, now, count_since)
 
     check_usage_limit(organization.plan, "story_studio", monthly_count)
 
     # Get story from database
-    theme_lower = request.theme.lower()
+    story_fields = _STORY_FIELDS.get(request.theme.lower())
 
-    if theme_lower not in STORIES_DATABASE:
+    if story_fields is None:
         # In production, use AI to generate custom story
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Story for theme '{request.theme}' not found. Available themes: {', '.join(STORIES_DATABASE.keys())}"
+            detail=_THEME_NOT_FOUND_DETAIL.format(request.theme)
         )
 
-    story_data = STORIES_DATABASE[theme_lower]
+    title, content, moral, teaching, questions, verses = story_fields
 
     # Create story generation record
     story_generation = StoryGeneration(
@@ -261,36 +214,32 @@ async def generate_story(
         style=request.style,
         language=request.language,
         custom_prompt=request.custom_prompt,
-        title=story_data["title"],
-        content=story_data["content"],
-        moral_lesson=story_data["moral"],
-        islamic_teaching=story_data["teaching"],
-        discussion_questions=story_data["questions"],
-        related_verses=story_data["verses"],
+        title=title,
+        content=content,
+        moral_lesson=moral,
+        islamic_teaching=teaching,
+        discussion_questions=questions,
+        related_verses=verses,
         is_saved=False,
         is_favorite=False,
         read_count=0,
-        created_at=datetime.utcnow(),
+        created_at=now,
     )
 
+    # Ids and timestamps are set client-side and the session doesn't expire
+    # on commit, so no refresh is needed
     db.add(story_generation)
-    db.commit()
-    db.refresh(story_generation)
-
-    # Track usage
-    from app.db.models_multitenant import FeatureUsage
-    usage = FeatureUsage(
-        id=uuid.uuid4(),
-        organization_id=organization.id,
-        user_id=current_user.id,
-        feature_name="story_studio",
-        action="generate",
-        request_data={"theme": request.theme, "age_range": request.age_range},
-        success=True,
-        created_at=datetime.utcnow(),
+    await db.commit()
+    await _MONTHLY_STORIES.bump(organization.id, now)
+
+    # Track usage after the response is sent
+    background_tasks.add_task(
+        _write_feature_usage,
+        organization.id,
+        current_user.id,
+        request.theme,
+        request.age_range
     )
-    db.add(usage)
-    db.commit()
 
     return StoryResponse(
         id=str(story_generation.id),
@@ -317,17 +266,7 @@ async def get_story_themes(
     """
     Get list of available story themes
     """
-    return {
-        "themes": list(STORIES_DATABASE.keys()),
-        "total": len(STORIES_DATABASE),
-        "age_ranges": ["3-5", "5-8", "9-12"],
-        "styles": ["short", "medium", "long"],
-        "categories": {
-            "character": ["honesty", "kindness", "gratitude"],
-            "worship": ["salah"],
-            "more_coming": "Additional themes will be added regularly"
-        }
-    }
+    return Response(_THEMES_BODY, media_type="application/json")
 
 
 @router.get("/", response_model=StoryListResponse)
@@ -338,7 +277,7 @@ async def list_my_stories(
     saved_only: bool = Query(False, description="Show only saved stories"),
     favorites_only: bool = Query(False, description="Show only favorite stories"),
     theme: Optional[str] = Query(None, description="Filter by theme"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     List organization's generated stories
@@ -346,26 +285,29 @@ async def list_my_stories(
     - Supports filtering by saved/favorites/theme
     - Pagination
     """
-    query = db.query(StoryGeneration).filter(
+    stmt = select(StoryGeneration).where(
         StoryGeneration.organization_id == organization.id
     )
 
     if saved_only:
-        query = query.filter(StoryGeneration.is_saved == True)
+        stmt = stmt.where(StoryGeneration.is_saved == True)
 
     if favorites_only:
-        query = query.filter(StoryGeneration.is_favorite == True)
+        stmt = stmt.where(StoryGeneration.is_favorite == True)
 
     if theme:
-        query = query.filter(StoryGeneration.theme.ilike(f"%{theme}%"))
+        stmt = stmt.where(StoryGeneration.theme.ilike(f"%{theme}%"))
 
     # Get total count
-    total = query.count()
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
 
     # Apply pagination
-    stories = query.order_by(StoryGeneration.created_at.desc()).offset(
-        pagination["skip"]
-    ).limit(pagination["limit"]).all()
+    result = await db.execute(
+        stmt.order_by(StoryGeneration.created_at.desc())
+        .offset(pagination["skip"])
+        .limit(pagination["limit"])
+    )
+    stories = result.scalars().all()
 
     # Build response
     story_responses = []
@@ -400,7 +342,7 @@ async def get_story(
     story_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get specific story by ID
@@ -408,10 +350,17 @@ async def get_story(
     - Increments read count
     - Organization members can only access their org's stories
     """
-    story = db.query(StoryGeneration).filter(
-        StoryGeneration.id == story_id,
-        StoryGeneration.organization_id == organization.id
-    ).first()
+    # Increment read count atomically and fetch the story in the same statement
+    result = await db.execute(
+        update(StoryGeneration)
+        .where(
+            StoryGeneration.id == story_id,
+            StoryGeneration.organization_id == organization.id
+        )
+        .values(read_count=StoryGeneration.read_count + 1)
+        .returning(StoryGeneration)
+    )
+    story = result.scalar_one_or_none()
 
     if not story:
         raise HTTPException(
@@ -419,10 +368,7 @@ async def get_story(
             detail="Story not found"
         )
 
-    # Increment read count
-    story.read_count += 1
-    db.commit()
-    db.refresh(story)
+    await db.commit()
 
     return StoryResponse(
         id=str(story.id),
@@ -448,15 +394,34 @@ async def update_story(
     request: StoryUpdateRequest,
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update story (save/favorite/rating flags)
     """
-    story = db.query(StoryGeneration).filter(
+    if request.rating is not None and (request.rating < 1 or request.rating > 5):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Rating must be between 1 and 5"
+        )
+
+    # Only the flags that were sent are written
+    patch = request.model_dump(exclude_none=True)
+
+    story_filter = (
         StoryGeneration.id == story_id,
         StoryGeneration.organization_id == organization.id
-    ).first()
+    )
+
+    # Existence check and update in one statement; the row comes back updated.
+    # An empty patch has nothing to write, so it is a plain read.
+    if patch:
+        stmt = update(StoryGeneration).where(*story_filter).values(**patch).returning(StoryGeneration)
+    else:
+        stmt = select(StoryGeneration).where(*story_filter)
+
+    result = await db.execute(stmt)
+    story = result.scalar_one_or_none()
 
     if not story:
         raise HTTPException(
@@ -464,23 +429,8 @@ async def update_story(
             detail="Story not found"
         )
 
-    # Update fields
-    if request.is_saved is not None:
-        story.is_saved = request.is_saved
-
-    if request.is_favorite is not None:
-        story.is_favorite = request.is_favorite
-
-    if request.rating is not None:
-        if request.rating < 1 or request.rating > 5:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Rating must be between 1 and 5"
-            )
-        story.rating = request.rating
-
-    db.commit()
-    db.refresh(story)
+    if patch:
+        await db.commit()
 
     return StoryResponse(
         id=str(story.id),
@@ -505,24 +455,27 @@ async def delete_story(
     story_id: uuid.UUID,
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a story
     """
-    story = db.query(StoryGeneration).filter(
-        StoryGeneration.id == story_id,
-        StoryGeneration.organization_id == organization.id
-    ).first()
+    # Check and delete in one round trip
+    created_at = await db.scalar(
+        delete(StoryGeneration).where(
+            StoryGeneration.id == story_id,
+            StoryGeneration.organization_id == organization.id
+        ).returning(StoryGeneration.created_at)
+    )
 
-    if not story:
+    if not created_at:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Story not found"
         )
 
-    db.delete(story)
-    db.commit()
+    await db.commit()
+    await _MONTHLY_STORIES.bump(organization.id, created_at, -1)
 
     return {
         "success": True,
@@ -538,42 +491,23 @@ async def delete_story(
 async def get_story_usage_stats(
     current_user: User = Depends(get_current_user),
     organization: Organization = Depends(get_current_organization),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get story usage statistics for organization
     """
-    # Total stories generated
-    total_stories = db.query(func.count(StoryGeneration.id)).filter(
-        StoryGeneration.organization_id == organization.id
-    ).scalar()
-
-    # Current month usage
+    # Total, current month, saved and reads in one pass over the org's stories
     current_month_start = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-    monthly_usage = db.query(func.count(StoryGeneration.id)).filter(
-        and_(
-            StoryGeneration.organization_id == organization.id,
-            StoryGeneration.created_at >= current_month_start
-        )
-    ).scalar()
+    result = await db.execute(
+        _STORY_USAGE_STATS,
+        {"organization_id": organization.id, "month_start": current_month_start}
+    )
+    total_stories, monthly_usage, saved_count, total_reads = result.one()
 
     # Get limit for current plan
     monthly_limit = get_feature_limit(organization.plan, "story_studio", "limit")
 
-    # Saved stories count
-    saved_count = db.query(func.count(StoryGeneration.id)).filter(
-        and_(
-            StoryGeneration.organization_id == organization.id,
-            StoryGeneration.is_saved == True
-        )
-    ).scalar()
-
-    # Total reads
-    total_reads = db.query(func.sum(StoryGeneration.read_count)).filter(
-        StoryGeneration.organization_id == organization.id
-    ).scalar() or 0
-
     return {
         "organization_id": str(organization.id),
         "organization_name": organization.name,
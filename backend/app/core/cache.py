@@ -0,0 +1,80 @@
+"""
+Global Waqaf Tech - Response Caching Helpers
+Short-TTL Redis caching for expensive, read-mostly endpoint payloads
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def redis_cached(
+    get_client: Callable[[], Any],
+    key: str,
+    ttl: int,
+    stale_ttl: Optional[int] = None
+):
+    """
+    Cache the JSON result of an async function in Redis
+
+    Args:
+        get_client: Returns the redis.asyncio client (or None if not initialized)
+        key: Redis key for the cached payload
+        ttl: Seconds a fresh payload is served from cache
+        stale_ttl: Optional seconds to keep a last-known-good copy under
+            "<key>:stale", served when the wrapped function raises
+
+    Returns:
+        Decorator for an async function returning a JSON-serializable value
+
+    Example:
+        @redis_cached(lambda: saas_platform.redis_client, "health:v1", ttl=5, stale_ttl=60)
+        async def _collect_health_status():
+            ...
+    """
+    stale_key = f"{key}:stale"
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            client = get_client()
+            if client is None:
+                return await func(*args, **kwargs)
+
+            try:
+                cached = await client.get(key)
+                if cached:
+                    return orjson.loads(cached)
+            except Exception as e:
+                logger.warning("cache_read_failed", key=key, error=repr(e))
+
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                if stale_ttl:
+                    try:
+                        stale = await client.get(stale_key)
+                    except Exception:
+                        stale = None
+                    if stale:
+                        return orjson.loads(stale)
+                raise
+
+            try:
+                payload = orjson.dumps(result)
+                # NX: concurrent misses don't overwrite each other's fresh value
+                await client.set(key, payload, ex=ttl, nx=True)
+                if stale_ttl:
+                    await client.set(stale_key, payload, ex=stale_ttl)
+            except Exception as e:
+                logger.warning("cache_write_failed", key=key, error=repr(e))
+
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,95 @@
+"""
+Islamic AI Platform - Concurrent Request Limiting
+Redis sorted-set limiter that caps in-flight requests per caller before any work starts
+"""
+
+import hashlib
+import time
+from uuid import uuid4
+
+import structlog
+from fastapi import HTTPException, Request
+
+from .saas_platform import saas_platform
+
+logger = structlog.get_logger(__name__)
+
+# Atomically drop expired slots, check capacity and claim a slot.
+# KEYS[1] = slot set, ARGV = now, ttl, limit, slot id
+_ACQUIRE_SLOT_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - ttl)
+if redis.call('ZCARD', key) >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('EXPIRE', key, ttl)
+return 1
+"""
+
+
+def _caller_identity(request: Request) -> str:
+    """Identify the caller by credential (API key / bearer token) or client IP"""
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.sha256(authorization.encode()).hexdigest()[:32]
+    return request.client.host if request.client else "anonymous"
+
+
+def concurrent_limit(scope: str, limit: int = 5, ttl: int = 300):
+    """
+    Create a dependency capping concurrent requests per caller for a scope
+
+    Args:
+        scope: Name of the protected operation (e.g. "video", "sso_callback")
+        limit: Maximum in-flight requests per caller
+        ttl: Seconds after which an unreleased slot is considered abandoned
+
+    Returns:
+        Dependency that holds a slot for the duration of the request
+
+    Raises:
+        HTTPException: 429 if the caller already has `limit` requests in flight
+
+    Example:
+        @router.post("/generate", dependencies=[Depends(concurrent_limit("video"))])
+        async def generate(...):
+            ...
+    """
+    async def concurrent_limit_dep(request: Request):
+        redis_client = saas_platform.redis_client
+        if redis_client is None:
+            yield
+            return
+
+        key = f"concurrency:{scope}:{_caller_identity(request)}"
+        slot_id = uuid4().hex
+
+        try:
+            acquired = await redis_client.eval(
+                _ACQUIRE_SLOT_SCRIPT, 1, key, time.time(), ttl, limit, slot_id
+            )
+        except Exception as e:
+            # Fail open: a Redis outage must not block the protected operation
+            logger.warning("concurrency_slot_acquire_failed", key=key, error=repr(e))
+            yield
+            return
+
+        if not acquired:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Too many concurrent {scope} requests. Please wait for in-flight requests to finish."
+            )
+
+        try:
+            yield
+        finally:
+            try:
+                await redis_client.zrem(key, slot_id)
+            except Exception as e:
+                # The slot expires after `ttl`; don't replace the handler's response
+                logger.warning("concurrency_slot_release_failed", key=key, error=repr(e))
+
+    return concurrent_limit_dep
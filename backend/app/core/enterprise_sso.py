@@ -30,6 +30,7 @@ from onelogin.saml2.utils import OneLogin_Saml2_Utils
 
 # FastAPI and security
 from fastapi import HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from passlib.context import CryptContext
 import httpx
 
@@ -174,6 +175,7 @@ class EnterpriseSSOManager:
     def __init__(self):
         self.logger = structlog.get_logger(__name__)
         self.redis_client = None
+        self.http_client: Optional[httpx.AsyncClient] = None
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         
         # SSO configurations cache
@@ -200,12 +202,24 @@ class EnterpriseSSOManager:
         self.sso_auth_counter = Counter('islamic_ai_sso_auth_total', 'SSO authentications', ['provider', 'status'])
         self.sso_response_time = Histogram('islamic_ai_sso_response_time_seconds', 'SSO response time')
         
-    async def initialize(self):
-        """Initialize SSO manager"""
+    async def initialize(
+        self,
+        http_client: Optional[httpx.AsyncClient] = None,
+        redis_client: Optional[redis.Redis] = None
+    ):
+        """
+        Initialize SSO manager
+
+        Pass the application's shared HTTP client and Redis pool so IdP calls
+        reuse keep-alive connections instead of opening new ones per request.
+        """
         self.logger.info("Initializing Enterprise SSO Manager")
         
+        # Shared HTTP client for IdP token, userinfo and metadata requests
+        self.http_client = http_client or httpx.AsyncClient(timeout=10.0)
+        
         # Setup Redis for session management
-        self.redis_client = redis.from_url(settings.redis_url)
+        self.redis_client = redis_client or redis.from_url(settings.redis_url)
         
         # Load SSO configurations
         await self._load_sso_configurations()
@@ -373,20 +387,10 @@ class EnterpriseSSOManager:
         # Create SAML settings
         saml_settings = await self._build_saml_settings(sso_config)
         
-        # Initialize SAML Auth
-        auth = OneLogin_Saml2_Auth(req, saml_settings)
-        
-        # Process SAML response
-        auth.process_response()
-        
-        if not auth.is_authenticated():
-            errors = auth.get_errors()
-            raise HTTPException(status_code=401, detail=f"SAML authentication failed: {errors}")
-        
-        # Extract user attributes
-        attributes = auth.get_attributes()
-        name_id = auth.get_nameid()
-        session_index = auth.get_session_index()
+        # Parse and verify the SAML response (CPU-bound XML signature checks) off the event loop
+        attributes, name_id, session_index = await run_in_threadpool(
+            self._process_saml_response, req, saml_settings
+        )
         
         # Map SAML attributes to user
         email = self._extract_saml_attribute(attributes, sso_config.config_data.get("email_attribute", "email"))
@@ -403,6 +407,22 @@ class EnterpriseSSOManager:
             provider=SSOProvider.SAML2
         )
     
+    def _process_saml_response(self, req: Dict[str, Any], saml_settings: Any):
+        """Validate a SAML response synchronously; returns (attributes, name_id, session_index)"""
+        
+        # Initialize SAML Auth
+        auth = OneLogin_Saml2_Auth(req, saml_settings)
+        
+        # Process SAML response
+        auth.process_response()
+        
+        if not auth.is_authenticated():
+            errors = auth.get_errors()
+            raise HTTPException(status_code=401, detail=f"SAML authentication failed: {errors}")
+        
+        # Extract user attributes
+        return auth.get_attributes(), auth.get_nameid(), auth.get_session_index()
+    
     async def _handle_oauth2_auth(self, request: Request, sso_config: SSOConfig) -> SSOUser:
         """Handle OAuth 2.0 authentication"""
         
@@ -0,0 +1,33 @@
+"""
+Islamic AI Platform - HTTP Caching Helpers
+Strong ETags and conditional (304) responses for pre-serialized JSON bodies
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+
+def etag(body: bytes) -> str:
+    """Strong ETag for a response body"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def cacheable_json_response(
+    request: Request,
+    body: bytes,
+    headers: Dict[str, str],
+    content_encoding: Optional[str] = None
+) -> Response:
+    """
+    Return body with caching headers, or 304 when the client's ETag matches
+
+    Pass content_encoding when body is already compressed; headers["ETag"]
+    must then be the ETag of the compressed bytes.
+    """
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    if content_encoding:
+        headers = {**headers, "Content-Encoding": content_encoding}
+    return Response(body, media_type="application/json", headers=headers)
@@ -5,7 +5,8 @@ Production-ready configuration for serving 1.8 billion Muslims worldwide
 
 import os
 from typing import List, Dict, Optional
-from pydantic import BaseSettings, validator
+from pydantic import validator
+from pydantic_settings import BaseSettings
 from enum import Enum
 
 class Environment(str, Enum):
@@ -164,6 +165,7 @@ class IslamicAISettings(BaseSettings):
     free_tier_daily_limit: int = 100
     premium_tier_daily_limit: int = 10000
     enterprise_tier_daily_limit: int = 100000
+    stripe_secret_key: Optional[str] = None
     
     # Scholarly Verification
     enable_auto_verification: bool = True
@@ -195,6 +197,7 @@ class IslamicAISettings(BaseSettings):
         env_file = ".env"
         env_prefix = "BUDUL_"
         case_sensitive = False
+        validate_default = False  # pydantic v1 semantics: validators check supplied values only
     
     @validator("environment", pre=True)
     def validate_environment(cls, v):
@@ -0,0 +1,63 @@
+"""
+Islamic AI Platform - Batched Prometheus Counters
+Accumulate hot-path counter increments locally and flush them periodically
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import structlog
+from prometheus_client import Counter
+
+logger = structlog.get_logger(__name__)
+
+
+class BatchedCounter:
+    """
+    Wraps a prometheus Counter and buffers increments in a plain dict
+
+    Increments happen on the event loop thread, so the buffer needs no lock;
+    the locked Counter update runs once per label set per flush instead of
+    once per request.
+    """
+
+    def __init__(self, counter: Counter):
+        self.counter = counter
+        self._pending: Dict[Tuple[str, ...], float] = defaultdict(float)
+        _batched_counters.append(self)
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """Record an increment for the given label values (none for unlabeled counters)"""
+        self._pending[label_values] += amount
+
+    def flush(self) -> None:
+        """Apply and reset all buffered increments"""
+        pending, self._pending = self._pending, defaultdict(float)
+        for label_values, amount in pending.items():
+            if label_values:
+                self.counter.labels(*label_values).inc(amount)
+            else:
+                self.counter.inc(amount)
+
+
+_batched_counters: List[BatchedCounter] = []
+
+
+def flush_batched_counters() -> None:
+    """Flush every BatchedCounter created in this process"""
+    for batched in _batched_counters:
+        batched.flush()
+
+
+async def run_metrics_flusher(interval: float = 0.1) -> None:
+    """Flush batched counters every `interval` seconds until cancelled"""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                flush_batched_counters()
+            except Exception as e:
+                logger.error("metrics_flush_failed", error=repr(e))
+    finally:
+        flush_batched_counters()
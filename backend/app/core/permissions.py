@@ -4,6 +4,7 @@ Authorization helpers and plan-based feature access
 """
 
 from typing import List, Dict, Any, Optional
+from types import MappingProxyType
 from fastapi import HTTPException, status
 from datetime import datetime
 
@@ -400,27 +401,29 @@ def check_organization_access(user_org_id: Optional[str], target_org_id: str, us
 # PLAN COMPARISON HELPERS
 # ============================================================================
 
+# Plan hierarchy (higher number = better plan), built once and read-only
+_PLAN_RANK = MappingProxyType({
+    Plan.BASIC: 1,
+    Plan.PRO: 2,
+    Plan.ENTERPRISE: 3,
+})
+
+
 def get_plan_hierarchy() -> Dict[str, int]:
     """Get plan hierarchy for comparisons (higher number = better plan)"""
-    return {
-        Plan.BASIC: 1,
-        Plan.PRO: 2,
-        Plan.ENTERPRISE: 3,
-    }
+    return dict(_PLAN_RANK)
 
 
 def is_plan_upgrade(current_plan: str, target_plan: str) -> bool:
     """Check if target plan is an upgrade from current plan"""
-    hierarchy = get_plan_hierarchy()
-    return hierarchy.get(target_plan, 0) > hierarchy.get(current_plan, 0)
+    return _PLAN_RANK.get(target_plan, 0) > _PLAN_RANK.get(current_plan, 0)
 
 
 def get_upgrade_plans(current_plan: str) -> List[str]:
     """Get list of plans that are upgrades from current plan"""
-    hierarchy = get_plan_hierarchy()
-    current_level = hierarchy.get(current_plan, 0)
+    current_level = _PLAN_RANK.get(current_plan, 0)
 
     return [
-        plan for plan, level in hierarchy.items()
+        plan for plan, level in _PLAN_RANK.items()
         if level > current_level
     ]
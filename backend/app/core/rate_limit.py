@@ -0,0 +1,42 @@
+"""
+Islamic AI Platform - Request Rate Limiting
+fastapi-limiter buckets and dependencies; the limiter is initialized in the app lifespan
+"""
+
+from fastapi import Request, Response
+from fastapi_limiter import FastAPILimiter
+from fastapi_limiter.depends import RateLimiter
+
+
+async def rate_limit_identifier(request: Request) -> str:
+    """
+    Rate-limit bucket: client IP plus the organization (when in the path) and route
+
+    The IP is the connection peer, never a raw X-Forwarded-For header. Behind
+    a reverse proxy, uvicorn rewrites request.client from the forwarded
+    headers only for proxies listed in FORWARDED_ALLOW_IPS.
+    """
+    organization_id = request.path_params.get("organization_id", "-")
+    return f"{request.client.host}:{organization_id}:{request.scope['path']}"
+
+
+def rate_limit(times: int, minutes: int = 0, seconds: int = 0):
+    """
+    Create a dependency allowing `times` requests per window per bucket
+
+    Requests pass unlimited while the limiter is not initialized (Redis was
+    unavailable at startup) instead of failing.
+
+    Example:
+        @router.post("/organizations", dependencies=[Depends(rate_limit(times=5, minutes=1))])
+        async def create_organization(...):
+            ...
+    """
+    limiter = RateLimiter(times=times, minutes=minutes, seconds=seconds)
+
+    async def rate_limit_dep(request: Request, response: Response):
+        if FastAPILimiter.redis is None:
+            return
+        await limiter(request, response)
+
+    return rate_limit_dep
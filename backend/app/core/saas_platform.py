@@ -4,14 +4,15 @@ Complete business platform with tiered API access, billing, and enterprise featu
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from functools import wraps
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 import stripe
+import orjson
 from decimal import Decimal
 
 # FastAPI and database
@@ -35,6 +36,7 @@ import redis.asyncio as redis
 
 # Business logic
 from .islamic_ai_config import settings
+from .metrics import BatchedCounter, flush_batched_counters, run_metrics_flusher
 
 # Subscription tiers
 class SubscriptionTier(str, Enum):
@@ -168,6 +170,26 @@ SUBSCRIPTION_TIERS = {
     )
 }
 
+# Overage pricing
+OVERAGE_PRICE_PER_API_CALL = 0.001  # USD
+OVERAGE_PRICE_PER_VIDEO = 0.50  # USD
+
+def calculate_overage_cost(
+    api_calls: int,
+    video_generations: int,
+    api_call_limit: int,
+    video_generation_limit: int
+) -> float:
+    """
+    Overage charge for usage above the tier's included quota
+    
+    Works on the aggregate counts returned by the usage queries, so the cost
+    is constant regardless of how many usage events make up the period.
+    """
+    overage_calls = max(api_calls - api_call_limit, 0)
+    overage_videos = max(video_generations - video_generation_limit, 0)
+    return overage_calls * OVERAGE_PRICE_PER_API_CALL + overage_videos * OVERAGE_PRICE_PER_VIDEO
+
 # Database Models
 Base = declarative_base()
 
@@ -345,6 +367,47 @@ class BillingInvoice(Base):
     # Metadata
     created_at = Column(DateTime, default=func.now())
 
+def _cached_per_org(prefix: str, ttl: int, encode=orjson.dumps, decode=orjson.loads):
+    """
+    Cache an async per-organization lookup in Redis under "<prefix>:<org_id>"
+
+    Args:
+        prefix: Key prefix; cleared by IslamicAISaaSPlatform.invalidate_organization_cache
+        ttl: Seconds a cached value is served
+        encode: Serializes the lookup result for Redis
+        decode: Rebuilds the lookup result from the cached bytes
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(self, org_id: str):
+            if self.redis_client is None:
+                return await method(self, org_id)
+            
+            key = f"{prefix}:{org_id}"
+            try:
+                cached = await self.redis_client.get(key)
+                if cached:
+                    return decode(cached)
+            except Exception as e:
+                self.logger.warning("org_cache_read_failed", key=key, error=repr(e))
+            
+            value = await method(self, org_id)
+            
+            try:
+                await self.redis_client.setex(key, ttl, encode(value))
+            except Exception as e:
+                self.logger.warning("org_cache_write_failed", key=key, error=repr(e))
+            
+            return value
+        
+        return wrapper
+    
+    return decorator
+
+# Organization lookup caches; get_cached_auth_and_tier reads the tier key directly
+_ORG_CACHE_PREFIX = "org"
+_ORG_TIER_CACHE_PREFIX = "org_tier"
+
 class IslamicAISaaSPlatform:
     """
     Comprehensive Islamic AI SaaS platform management
@@ -353,6 +416,7 @@ class IslamicAISaaSPlatform:
     def __init__(self):
         self.logger = structlog.get_logger(__name__)
         self.redis_client = None
+        self.metrics_flush_task = None
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         
         # Initialize Stripe
@@ -363,23 +427,43 @@ class IslamicAISaaSPlatform:
         
     def setup_metrics(self):
         """Setup business metrics"""
-        self.api_requests_counter = Counter('islamic_ai_api_requests_total', 'Total API requests', ['tier', 'endpoint'])
+        self.api_requests_counter = BatchedCounter(
+            Counter('islamic_ai_api_requests_total', 'Total API requests', ['tier', 'endpoint'])
+        )
         self.revenue_gauge = Gauge('islamic_ai_revenue_usd', 'Current revenue in USD')
         self.active_subscriptions_gauge = Gauge('islamic_ai_active_subscriptions', 'Active subscriptions', ['tier'])
         self.usage_quota_gauge = Gauge('islamic_ai_usage_quota_percentage', 'Usage quota percentage', ['organization'])
         
-    async def initialize(self):
-        """Initialize SaaS platform"""
+    async def initialize(self, redis_client: Optional[redis.Redis] = None):
+        """Initialize SaaS platform (optionally on a shared Redis pool)"""
         self.logger.info("Initializing Islamic AI SaaS Platform")
         
         # Setup Redis for caching and rate limiting
-        self.redis_client = redis.from_url(settings.redis_url)
+        self.redis_client = redis_client or redis.from_url(settings.redis_url)
+        
+        # Flush batched request counters to Prometheus in the background
+        self.metrics_flush_task = asyncio.create_task(run_metrics_flusher())
         
         # Initialize Stripe webhooks
         await self._setup_stripe_webhooks()
         
         self.logger.info("Islamic AI SaaS Platform initialized")
     
+    async def shutdown(self):
+        """Stop the metrics flusher; cancelling it runs a final flush"""
+        task, self.metrics_flush_task = self.metrics_flush_task, None
+        if task is None:
+            flush_batched_counters()
+            return
+        
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        
+        self.logger.info("Islamic AI SaaS Platform shut down")
+    
     # Authentication and Authorization
     async def authenticate_api_key(self, api_key: str) -> Dict[str, Any]:
         """Authenticate API key and return organization info"""
@@ -390,7 +474,7 @@ class IslamicAISaaSPlatform:
             # Check cache first
             cached_auth = await self.redis_client.get(f"auth:{key_hash}")
             if cached_auth:
-                auth_data = json.loads(cached_auth)
+                auth_data = orjson.loads(cached_auth)
                 
                 # Update last used timestamp
                 await self._update_api_key_usage(auth_data["api_key_id"])
@@ -406,7 +490,7 @@ class IslamicAISaaSPlatform:
                 await self.redis_client.setex(
                     f"auth:{key_hash}",
                     300,
-                    json.dumps(auth_data)
+                    orjson.dumps(auth_data)
                 )
                 
                 # Update usage
@@ -420,6 +504,59 @@ class IslamicAISaaSPlatform:
             self.logger.error(f"Authentication error: {e}")
             raise HTTPException(status_code=401, detail="Authentication failed")
     
+    async def get_cached_auth_and_tier(
+        self,
+        api_key: str,
+        organization_id: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Read the cached API key auth record and organization tier in one MGET
+        
+        Returns (None, None) when Redis fails, so callers fall through to the
+        normal lookups.
+        """
+        try:
+            cached_auth, cached_tier = await self.redis_client.mget(
+                f"auth:{self._hash_api_key(api_key)}",
+                f"{_ORG_TIER_CACHE_PREFIX}:{organization_id}"
+            )
+        except Exception as e:
+            self.logger.warning("auth_tier_prefetch_failed", organization_id=organization_id, error=repr(e))
+            return None, None
+        
+        auth_data = orjson.loads(cached_auth) if cached_auth else None
+        tier_info = {"tier": SubscriptionTier(cached_tier.decode())} if cached_tier else None
+        
+        return auth_data, tier_info
+    
+    async def get_organization_with_tier(self, organization_id: str) -> Tuple[Dict[str, Any], TierLimits]:
+        """
+        Fetch organization data and its tier limits in one lookup
+        
+        The tier is read from the organization record itself, so both values
+        come from the same read; the separate tier lookup is only a fallback
+        for records without subscription_tier.
+        """
+        org_data = await self._get_organization(organization_id)
+        tier = org_data.get("subscription_tier")
+        if tier is None:
+            tier = (await self._get_organization_tier(organization_id))["tier"]
+        
+        return org_data, SUBSCRIPTION_TIERS[SubscriptionTier(tier)]
+    
+    async def invalidate_organization_cache(self, organization_id: str):
+        """Drop cached organization data and tier after the organization changes"""
+        if self.redis_client is None:
+            return
+        
+        try:
+            await self.redis_client.delete(
+                f"{_ORG_CACHE_PREFIX}:{organization_id}",
+                f"{_ORG_TIER_CACHE_PREFIX}:{organization_id}"
+            )
+        except Exception as e:
+            self.logger.warning("org_cache_invalidate_failed", organization_id=organization_id, error=repr(e))
+    
     async def check_rate_limit(self, organization_id: str, endpoint: str) -> bool:
         """Check if organization has exceeded rate limits"""
         try:
@@ -477,10 +614,7 @@ class IslamicAISaaSPlatform:
             
             # Update metrics
             tier_info = await self._get_organization_tier(organization_id)
-            self.api_requests_counter.labels(
-                tier=tier_info["tier"].value,
-                endpoint=endpoint
-            ).inc()
+            self.api_requests_counter.inc(tier_info["tier"].value, endpoint)
             
         except Exception as e:
             self.logger.error(f"Usage increment error: {e}")
@@ -579,6 +713,7 @@ class IslamicAISaaSPlatform:
                 billing_cycle,
                 stripe_subscription.id
             )
+            await self.invalidate_organization_cache(organization_id)
             
             # Update metrics
             self.active_subscriptions_gauge.labels(tier=new_tier.value).inc()
@@ -702,13 +837,12 @@ class IslamicAISaaSPlatform:
             overage_cost = 0.0
             
             # Calculate overage charges
-            if usage_data["api_calls"] > tier_limits.monthly_api_calls:
-                overage_calls = usage_data["api_calls"] - tier_limits.monthly_api_calls
-                overage_cost += overage_calls * 0.001  # $0.001 per overage call
-            
-            if usage_data["video_generations"] > tier_limits.video_generations_monthly:
-                overage_videos = usage_data["video_generations"] - tier_limits.video_generations_monthly
-                overage_cost += overage_videos * 0.50  # $0.50 per overage video
+            overage_cost += calculate_overage_cost(
+                usage_data["api_calls"],
+                usage_data["video_generations"],
+                tier_limits.monthly_api_calls,
+                tier_limits.video_generations_monthly
+            )
             
             subtotal = base_cost + overage_cost
             tax = subtotal * 0.08 if org_data.get("country") == "US" else 0.0  # Simplified tax calculation
@@ -786,11 +920,17 @@ class IslamicAISaaSPlatform:
     
     # Database operations (placeholders for actual implementation)
     async def _query_api_key_auth(self, key_hash: str) -> Optional[Dict]: return None
+    @_cached_per_org(
+        _ORG_TIER_CACHE_PREFIX, ttl=300,
+        encode=lambda tier_info: tier_info["tier"].value,
+        decode=lambda raw: {"tier": SubscriptionTier(raw.decode())}
+    )
     async def _get_organization_tier(self, org_id: str) -> Dict: return {"tier": SubscriptionTier.FREE}
     async def _get_monthly_usage(self, org_id: str) -> int: return 0
     async def _log_usage(self, org_id: str, endpoint: str, data: Dict): pass
     async def _update_api_key_usage(self, api_key_id: str): pass
     async def _save_organization(self, data: Dict): pass
+    @_cached_per_org(_ORG_CACHE_PREFIX, ttl=60)
     async def _get_organization(self, org_id: str) -> Dict: return {}
     async def _update_organization_subscription(self, org_id: str, tier: SubscriptionTier, cycle: BillingCycle, stripe_id: str): pass
     async def _save_api_key(self, data: Dict): pass
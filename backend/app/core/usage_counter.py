@@ -0,0 +1,102 @@
+"""
+Islamic AI Platform - Monthly Usage Counters
+Redis month-to-date counters per organization, primed from the database on a cold key
+"""
+
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+from uuid import UUID
+
+import structlog
+
+from .saas_platform import saas_platform
+
+logger = structlog.get_logger(__name__)
+
+# Adjust a counter only if it is already primed; a missing key means the
+# next read must recount from the database.
+# KEYS[1] = counter, ARGV[1] = amount
+_BUMP_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
+
+class MonthlyUsageCounter:
+    """
+    Month-to-date usage counter per organization, kept in Redis
+
+    The database stays the source of truth: a missing key is recounted with
+    the caller's query and primed until shortly after month end. Without
+    Redis (or on Redis errors) every read falls back to the query.
+
+    Example:
+        _MONTHLY_STORIES = MonthlyUsageCounter("usage:story_studio")
+
+        count = await _MONTHLY_STORIES.get(org.id, now, count_stories_since)
+        ...
+        await _MONTHLY_STORIES.bump(org.id, now)
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def key(self, organization_id: UUID, when: datetime) -> str:
+        """Redis key of the organization's counter for the month containing `when`"""
+        return f"{self.prefix}:{organization_id}:{when:%Y%m}"
+
+    async def get(
+        self,
+        organization_id: UUID,
+        now: datetime,
+        count_since: Callable[[datetime], Awaitable[int]]
+    ) -> int:
+        """
+        Usage so far this month
+
+        Args:
+            organization_id: Organization whose usage is counted
+            now: Current (naive UTC) time; selects the month
+            count_since: Counts usage in the database from the given month start
+
+        Returns:
+            Month-to-date count
+        """
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        redis_client = saas_platform.redis_client
+        key = self.key(organization_id, now)
+
+        if redis_client is not None:
+            try:
+                cached = await redis_client.get(key)
+                if cached is not None:
+                    return int(cached)
+            except Exception as e:
+                logger.warning("monthly_usage_read_failed", key=key, error=repr(e))
+
+        count = await count_since(month_start)
+
+        if redis_client is not None:
+            next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+            ttl = int((next_month_start - now).total_seconds()) + 86400
+            try:
+                # NX: don't clobber a counter another request primed and bumped meanwhile
+                await redis_client.set(key, count, ex=ttl, nx=True)
+            except Exception as e:
+                logger.warning("monthly_usage_write_failed", key=key, error=repr(e))
+
+        return count
+
+    async def bump(self, organization_id: UUID, when: datetime, amount: int = 1) -> None:
+        """Add `amount` to the counter for the month containing `when`, if it is primed"""
+        redis_client = saas_platform.redis_client
+        if redis_client is None:
+            return
+
+        key = self.key(organization_id, when)
+        try:
+            await redis_client.eval(_BUMP_IF_EXISTS_SCRIPT, 1, key, amount)
+        except Exception as e:
+            logger.warning("monthly_usage_bump_failed", key=key, error=repr(e))
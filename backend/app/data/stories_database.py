@@ -0,0 +1,138 @@
+"""
+Global Waqaf Tech - Kids Story Library
+Built-in Islamic kids stories shared by the story endpoints
+"""
+
+from types import MappingProxyType
+
+# Sample stories (in production, this would use AI generation or a real database).
+# Read-only and shared by app.api.v1.stories and app.api.v1.stories_multitenant.
+STORIES_DATABASE = MappingProxyType({theme: MappingProxyType(story) for theme, story in {
+    "honesty": {
+        "title": "The Truthful Merchant of Madinah",
+        "content": """Once upon a time in the beautiful city of Madinah, there lived a young merchant named Bilal. Bilal sold dates and honey in the marketplace, and he was known for his kindness and bright smile.
+
+One busy day, a traveler came to his stall and bought a large bag of dates. The traveler was in a hurry to catch his caravan, so he quickly paid and rushed away. After he left, Bilal noticed he had accidentally given the man old dates instead of the fresh ones he had paid for!
+
+Even though the traveler was far away and would never know about the mistake, Bilal's heart felt heavy. He remembered what Prophet Muhammad (peace be upon him) taught: "Truthfulness leads to righteousness, and righteousness leads to Paradise."
+
+Bilal immediately closed his stall and ran through the marketplace, past the city gates, until he found the traveler preparing to leave. Out of breath, Bilal explained his mistake and gave him the fresh dates, taking back the old ones.
+
+The traveler was amazed! "You could have kept quiet, and I would never have known," he said.
+
+Bilal smiled and replied, "But Allah would have known, and that is what matters most."
+
+The traveler was so impressed by Bilal's honesty that he told everyone in the marketplace about the truthful merchant. Soon, people from all over came to buy from Bilal because they knew they could trust him.
+
+Bilal's business grew, and he became successful. But more importantly, he had pleased Allah by being honest, and that made him the happiest of all!""",
+        "moral": "Always tell the truth, even when no one is watching. Allah sees everything, and honesty brings blessings in this life and the next.",
+        "teaching": "The Prophet Muhammad (peace be upon him) said: 'Truthfulness leads to righteousness, and righteousness leads to Paradise.' Being honest, even when it's difficult, is one of the most important qualities of a Muslim.",
+        "questions": [
+            "Why did Bilal run after the traveler even though the traveler didn't know about the mistake?",
+            "How did being honest help Bilal's business in the end?",
+            "Can you think of a time when you told the truth even though it was hard?"
+        ],
+        "verses": [
+            "Quran 9:119 - 'O you who have believed, fear Allah and be with those who are true.'",
+            "Hadith - 'Truthfulness leads to righteousness, and righteousness leads to Paradise.'"
+        ]
+    },
+    "kindness": {
+        "title": "Aisha and the Kind Neighbor",
+        "content": """In a peaceful village, there lived a young girl named Aisha who loved helping others. She lived next door to Umm Hassan, an elderly woman who lived alone and sometimes found it hard to do everyday tasks.
+
+Every Friday after Jumu'ah prayer, Aisha would visit Umm Hassan. Sometimes she would help clean the house, sometimes she would read Quran to her, and sometimes they would just sit and talk. Aisha's mother had taught her that being kind to neighbors is one of the best deeds in Islam.
+
+One cold winter day, Umm Hassan fell ill with a fever. When Aisha heard the news, she immediately told her family. Her mother made warm soup, her father brought medicine, and Aisha brought warm blankets.
+
+Every day, Aisha's family took turns checking on Umm Hassan, bringing her food, and making sure she was comfortable. They didn't do it because they expected anything in return – they did it because it was the right thing to do.
+
+After two weeks, Umm Hassan felt better. When spring came, her garden bloomed with beautiful flowers. She called Aisha over and said, "These flowers are lovely, but they are nothing compared to the beautiful kindness you and your family showed me. You treated me like I was your own grandmother!"
+
+Tears of happiness filled Umm Hassan's eyes. She made du'a for Aisha and her family, asking Allah to bless them always.
+
+Aisha learned that small acts of kindness can make a big difference in someone's life, and that being good to neighbors is one of the things that pleases Allah the most.""",
+        "moral": "Be kind to your neighbors and help those in need. Small acts of kindness can make a huge difference in someone's life.",
+        "teaching": "The Prophet (peace be upon him) said: 'Whoever believes in Allah and the Last Day, let him be kind to his neighbor.' Taking care of neighbors, especially elderly ones, is a beautiful sunnah.",
+        "questions": [
+            "What are some things Aisha did to help Umm Hassan?",
+            "Why is it important to be kind to our neighbors?",
+            "What is one kind thing you can do for your neighbor this week?"
+        ],
+        "verses": [
+            "Quran 4:36 - 'Worship Allah and associate nothing with Him, and to parents do good, and to relatives, orphans, the needy, the near neighbor, the neighbor farther away...'",
+            "Hadith - 'The best of companions in the sight of Allah is the best to his companion, and the best of neighbors is the best to his neighbor.'"
+        ]
+    },
+    "salah": {
+        "title": "Omar's Special Meetings with Allah",
+        "content": """Omar was a curious seven-year-old boy who loved asking questions. One day, he asked his father, "Baba, why do we pray five times every day?"
+
+His father smiled and said, "Let me tell you a story that will help you understand."
+
+"Imagine if you had a best friend who lived far away," his father began. "Would you like to talk to them every day?"
+
+"Yes!" Omar said excitedly.
+
+"Well, Allah is better than any friend, and salah is our special meeting with Him! Five times a day, we get to talk to Allah, thank Him, ask Him for help, and remember how much He loves us."
+
+Omar's eyes widened with understanding. From that day on, he started looking at salah differently. Instead of thinking it was just something he had to do, he realized it was something special – his private meeting with Allah!
+
+When he prayed Fajr in the morning, he would say, "Good morning, Allah! Thank you for this new day!"
+
+At Dhuhr, he would think about all the good things that happened in the morning and thank Allah for them.
+
+Asr prayer reminded him that the day was almost over, so he should do something good before it ends.
+
+At Maghrib, he would ask Allah to forgive any mistakes he made that day.
+
+And at Isha, before going to sleep, he would ask Allah to protect him through the night.
+
+Omar's little sister noticed how happy he looked when he prayed. "Why are you smiling?" she asked.
+
+"Because," Omar said, "I'm meeting with Allah, and that makes me the happiest person in the world!"
+
+His sister smiled too, and from then on, they both loved their special meetings with Allah.""",
+        "moral": "Salah is not just a duty – it's a special gift that lets us connect with Allah five times a day!",
+        "teaching": "Prayer (salah) is the second pillar of Islam and our direct connection to Allah. The Prophet (peace be upon him) said that salah is 'the coolness of his eyes' – meaning it brought him peace and joy!",
+        "questions": [
+            "How many times do we pray each day? Can you name them?",
+            "What does Omar compare salah to in the story?",
+            "How do you feel when you pray? What do you like to thank Allah for?"
+        ],
+        "verses": [
+            "Quran 29:45 - 'Indeed, prayer prohibits immorality and wrongdoing, and the remembrance of Allah is greater.'",
+            "Hadith - 'The first thing that a person will be questioned about on the Day of Judgment is salah.'"
+        ]
+    },
+    "gratitude": {
+        "title": "The Grateful Farmer's Secret",
+        "content": """In a small village, there were two farmers who lived next to each other. The first farmer, Omar, had a small farm with a few sheep, some chickens, and a small vegetable garden. The second farmer, Khalid, had a much larger farm with many animals and big fields of crops.
+
+Every morning, Omar would wake up before Fajr prayer and say, "Alhamdulillah! All praise is for Allah!" He was grateful for everything he had, even though it was small.
+
+Khalid, on the other hand, was never happy. Even though he had more than Omar, he always wanted more animals, bigger crops, and a larger house. He rarely said Alhamdulillah.
+
+One year, there was very little rain. Many farmers lost their crops. Omar's small garden survived because he had always taken good care of it and planted strong seeds. He still said, "Alhamdulillah!"
+
+Khalid's large farm suffered greatly because he had been careless. He became very sad and asked Omar, "How can you still be grateful when times are so hard?"
+
+Omar smiled warmly and said, "My dear neighbor, I have my health, my family, my faith, and food to eat. I have a roof over my head and clothes on my back. Allah has given me more than I truly need! When we say Alhamdulillah and are grateful for what we have, we see how rich we really are."
+
+Khalid thought about this deeply. That night, for the first time in years, he truly thanked Allah for all his blessings. He realized that gratitude wasn't about having everything – it was about appreciating everything you have.
+
+From that day on, both farmers could be heard saying "Alhamdulillah!" and they both lived happily, not because they had everything, but because they were grateful for what Allah had given them.""",
+        "moral": "Always be grateful for what you have. When we thank Allah by saying Alhamdulillah, we realize how truly blessed we are!",
+        "teaching": "Allah says in the Quran: 'If you are grateful, I will surely increase you in favor' (14:7). The Prophet Muhammad (peace be upon him) taught us that gratitude is the key to happiness and more blessings.",
+        "questions": [
+            "What was the difference between Omar and Khalid at the beginning of the story?",
+            "Why was Omar happy even when there was very little rain?",
+            "What are three things you are grateful for today?"
+        ],
+        "verses": [
+            "Quran 14:7 - 'If you are grateful, I will surely increase you in favor.'",
+            "Hadith - 'He who does not thank people, does not thank Allah.'",
+            "Sunnah - The Prophet (peace be upon him) would say Alhamdulillah for everything, in good times and in difficult times."
+        ]
+    }
+}.items()})
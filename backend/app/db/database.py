@@ -17,10 +17,15 @@ logger = logging.getLogger(__name__)
 engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.ENVIRONMENT == "development",
-    pool_size=20,
-    max_overflow=30,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     pool_pre_ping=True,
     pool_recycle=3600,
+    # Larger compiled-statement cache for the module-level select() constants
+    query_cache_size=1200,
+    # asyncpg server-side prepared statements, reused per connection
+    connect_args={"prepared_statement_cache_size": 256},
 )
 
 # Create async session factory
@@ -0,0 +1,78 @@
+-- Social Media Studio columns on social_posts and social_profiles
+-- init_db()'s create_all() only creates missing tables, so databases created
+-- before these columns existed need this script applied once:
+--   psql "$DATABASE_URL" -f backend/app/db/migrations/001_social_post_studio_columns.sql
+
+BEGIN;
+
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS platform VARCHAR(20);
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS topic VARCHAR(200);
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS tone VARCHAR(20);
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS language VARCHAR(10);
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS target_audience VARCHAR(100);
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS occasion VARCHAR(100);
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS scheduled_for TIMESTAMP;
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP;
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS content TEXT;
+-- Same expression as SocialPost.word_count's Computed()
+ALTER TABLE social_posts ADD COLUMN IF NOT EXISTS word_count INTEGER
+    GENERATED ALWAYS AS (
+        coalesce(array_length(regexp_split_to_array(
+            nullif(regexp_replace(content, '^\s+|\s+$', '', 'g'), ''), '\s+'), 1), 0)
+    ) STORED;
+
+-- PostResponse requires language and updated_at
+UPDATE social_posts
+SET language = COALESCE(language, 'en'),
+    updated_at = COALESCE(updated_at, created_at)
+WHERE language IS NULL OR updated_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_social_posts_platform ON social_posts (platform);
+
+-- Per-organization listing (newest first) and month-to-date counts
+CREATE INDEX IF NOT EXISTS idx_social_org_created
+    ON social_posts (organization_id, created_at DESC);
+
+-- Trigram index behind the post list's ILIKE '%occasion%' filter
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_social_occasion_trgm
+    ON social_posts USING gin (occasion gin_trgm_ops);
+
+-- social_profiles: one row per (organization, platform) instead of per organization
+ALTER TABLE social_profiles ADD COLUMN IF NOT EXISTS platform VARCHAR(20);
+ALTER TABLE social_profiles ADD COLUMN IF NOT EXISTS profile_name VARCHAR(100);
+ALTER TABLE social_profiles ADD COLUMN IF NOT EXISTS profile_url VARCHAR(500);
+ALTER TABLE social_profiles ADD COLUMN IF NOT EXISTS profile_handle VARCHAR(100);
+ALTER TABLE social_profiles ADD COLUMN IF NOT EXISTS is_active BOOLEAN DEFAULT TRUE;
+
+-- Pre-existing rows were organization-wide settings; file them under
+-- facebook and the organization's name so the NOT NULLs below hold
+UPDATE social_profiles sp
+SET platform = COALESCE(sp.platform, 'facebook'),
+    profile_name = COALESCE(sp.profile_name, LEFT(o.name, 100)),
+    is_active = COALESCE(sp.is_active, TRUE)
+FROM organizations o
+WHERE o.id = sp.organization_id
+  AND (sp.platform IS NULL OR sp.profile_name IS NULL OR sp.is_active IS NULL);
+
+ALTER TABLE social_profiles ALTER COLUMN platform SET NOT NULL;
+ALTER TABLE social_profiles ALTER COLUMN profile_name SET NOT NULL;
+
+-- Column(unique=True) on organization_id created Postgres' default-named constraint
+ALTER TABLE social_profiles DROP CONSTRAINT IF EXISTS social_profiles_organization_id_key;
+DROP INDEX IF EXISTS social_profiles_organization_id_key;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'uq_social_profile_org_platform'
+          AND conrelid = 'social_profiles'::regclass
+    ) THEN
+        ALTER TABLE social_profiles
+            ADD CONSTRAINT uq_social_profile_org_platform UNIQUE (organization_id, platform);
+    END IF;
+END
+$$;
+
+COMMIT;
@@ -3,7 +3,7 @@ Global Waqaf Tech - Multi-Tenant Database Models
 Comprehensive database schema for digital waqf platform
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, ForeignKey, Index, Float, Date
+from sqlalchemy import DDL, Column, Computed, Integer, String, Text, DateTime, JSON, Boolean, ForeignKey, Index, Float, Date, UniqueConstraint, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
@@ -80,7 +80,7 @@ class Organization(Base):
     # Admin notes (for super admin only)
     admin_notes = Column(Text)
 
-    # Timestamps
+    # Timestamps (column defaults, so bulk UPDATE statements stamp updated_at too)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -91,7 +91,7 @@ class Organization(Base):
     saved_grants = relationship("SavedGrant", back_populates="organization", cascade="all, delete-orphan")
     marketplace_listings = relationship("MarketplaceListing", back_populates="organization", cascade="all, delete-orphan")
     social_posts = relationship("SocialPost", back_populates="organization", cascade="all, delete-orphan")
-    social_profile = relationship("SocialProfile", back_populates="organization", uselist=False, cascade="all, delete-orphan")
+    social_profiles = relationship("SocialProfile", back_populates="organization", cascade="all, delete-orphan")
     enrollments = relationship("Enrollment", back_populates="organization", cascade="all, delete-orphan")
     feature_usage = relationship("FeatureUsage", back_populates="organization", cascade="all, delete-orphan")
 
@@ -546,11 +546,18 @@ class Enrollment(Base):
 # ============================================================================
 
 class SocialProfile(Base):
-    """Organization's social media profile settings"""
+    """Organization's social media profile settings (one row per platform)"""
     __tablename__ = "social_profiles"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, unique=True)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+
+    # Account
+    platform = Column(String(20), nullable=False)  # facebook, instagram, twitter, linkedin
+    profile_name = Column(String(100), nullable=False)
+    profile_url = Column(String(500))
+    profile_handle = Column(String(100))
+    is_active = Column(Boolean, default=True)
 
     # Audience
     main_audience = Column(String(100))  # local community, youth, parents, converts, general
@@ -573,7 +580,11 @@ class SocialProfile(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    organization = relationship("Organization", back_populates="social_profile")
+    organization = relationship("Organization", back_populates="social_profiles")
+
+    __table_args__ = (
+        UniqueConstraint('organization_id', 'platform', name='uq_social_profile_org_platform'),
+    )
 
 
 class SocialPost(Base):
@@ -591,6 +602,14 @@ class SocialPost(Base):
 
     input_description = Column(Text)
 
+    # Studio request (platform/tone/topic are also grouped by the /stats query)
+    platform = Column(String(20), index=True)  # facebook, instagram, twitter, linkedin
+    topic = Column(String(200))
+    tone = Column(String(20))  # professional, friendly, inspirational, educational
+    language = Column(String(10), default="en")
+    target_audience = Column(String(100))
+    occasion = Column(String(100))  # Ramadan, Eid, Jummah, etc.
+
     # Generated Content
     caption_short = Column(Text)  # For Twitter/X (280 chars)
     caption_medium = Column(Text)  # For Instagram
@@ -598,6 +617,17 @@ class SocialPost(Base):
     hashtags = Column(ARRAY(String))
     image_prompt = Column(Text)  # For future image AI integration
 
+    # Post body as edited in the studio; word_count is maintained by Postgres
+    content = Column(Text)
+    word_count = Column(
+        Integer,
+        Computed(
+            r"coalesce(array_length(regexp_split_to_array("
+            r"nullif(regexp_replace(content, '^\s+|\s+$', '', 'g'), ''), '\s+'), 1), 0)",
+            persisted=True
+        )
+    )
+
     # AI Metadata
     model_used = Column(String(100))
     tokens_used = Column(Integer)
@@ -607,14 +637,35 @@ class SocialPost(Base):
     is_posted = Column(Boolean, default=False)
     posted_platforms = Column(ARRAY(String))  # Which platforms it was posted to
     posted_at = Column(DateTime)
+    scheduled_for = Column(DateTime)
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     organization = relationship("Organization", back_populates="social_posts")
     user = relationship("User", back_populates="social_posts")
 
+    # Per-organization listing and monthly counts filter by org and order/range on created_at;
+    # the trigram index lets the post list's ILIKE '%occasion%' filter avoid a seq scan
+    __table_args__ = (
+        Index('idx_social_org_created', 'organization_id', created_at.desc()),
+        Index(
+            'idx_social_occasion_trgm', 'occasion',
+            postgresql_using='gin',
+            postgresql_ops={'occasion': 'gin_trgm_ops'}
+        ),
+    )
+
+
+# gin_trgm_ops comes from pg_trgm, which must exist before the table's indexes
+event.listen(
+    SocialPost.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
 
 # ============================================================================
 # USAGE TRACKING & ANALYTICS
@@ -8,14 +8,24 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+import os
 import time
 import logging
 import asyncio
 from contextlib import asynccontextmanager
+from prometheus_client import CollectorRegistry, make_asgi_app, multiprocess
+from prometheus_fastapi_instrumentator import Instrumentator
+from fastapi_limiter import FastAPILimiter
+import httpx
+import redis.asyncio as redis
+import structlog
 
 from app.core.config import settings
 from app.db.database import init_db
 from app.api.v1.router import api_router
+from app.core.enterprise_sso import enterprise_sso_manager
+from app.core.rate_limit import rate_limit_identifier
+from app.core.saas_platform import saas_platform
 from app.services.price_monitor import start_price_monitoring, stop_price_monitoring
 # from app.core.logging import setup_logging
 
@@ -23,6 +33,19 @@ from app.services.price_monitor import start_price_monitoring, stop_price_monito
 # setup_logging()
 logger = logging.getLogger(__name__)
 
+# Structured logs as JSON; calls below LOG_LEVEL are dropped before any formatting
+structlog.configure(
+    processors=[
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.JSONRenderer(),
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelName(settings.LOG_LEVEL.upper())
+    ),
+    cache_logger_on_first_use=True,
+)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
@@ -32,6 +55,32 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("📚 Islamic knowledge database initialized")
 
+    # One HTTP/2 keep-alive client and one Redis pool, shared via app.state
+    # with the SaaS platform, the rate limiter and the SSO manager
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    # Short socket timeouts: if Redis is unreachable, callers log the error and
+    # fall back (e.g. usage counts come from SQL) instead of stalling requests
+    app.state.redis = redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=2,
+        socket_timeout=2
+    )
+
+    await saas_platform.initialize(redis_client=app.state.redis)
+    try:
+        await FastAPILimiter.init(app.state.redis, identifier=rate_limit_identifier)
+    except Exception as e:
+        logger.warning(f"Rate limiter not initialized, Redis unavailable: {e!r}")
+    await enterprise_sso_manager.initialize(
+        http_client=app.state.http,
+        redis_client=app.state.redis
+    )
+    logger.info("🧩 SaaS platform services initialized")
+
     # Start price monitoring service in background
     monitoring_task = asyncio.create_task(start_price_monitoring())
     logger.info("🔔 Umrah price monitoring service started")
@@ -42,6 +91,11 @@ async def lifespan(app: FastAPI):
     await stop_price_monitoring()
     logger.info("🔔 Umrah price monitoring service stopped")
 
+    # Flush metrics, then close the shared clients (the limiter uses the same pool)
+    await saas_platform.shutdown()
+    await app.state.http.aclose()
+    await app.state.redis.close()
+
     logger.info("🌙 Global Waqaf Tech shutting down gracefully")
 
 # Create FastAPI app
@@ -81,6 +135,24 @@ async def add_process_time_header(request: Request, call_next):
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
+def create_metrics_app():
+    """Prometheus exposition as its own ASGI app (multiprocess-aware)"""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return make_asgi_app(registry=registry)
+    return make_asgi_app()
+
+if settings.ENABLE_METRICS:
+    # Per-route request count, latency and in-progress metrics
+    Instrumentator(
+        excluded_handlers=["/metrics", "/health"],
+        should_group_status_codes=True,
+    ).instrument(app)
+
+    # Metrics scraping is served by a separate ASGI app instead of a route handler
+    app.mount("/metrics", create_metrics_app())
+
 @app.get("/")
 async def root():
     """Root endpoint - Global Waqaf Tech welcome message"""
@@ -2,10 +2,11 @@
 Budul AI Service - Using your trained Islamic model
 """
 
+import asyncio
 import torch
 from transformers import AutoTokenizer, AutoModelForCausalLM
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import os
 
 
@@ -41,6 +42,9 @@ class BudulAIService:
             if self.tokenizer.pad_token is None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
             
+            # Decoder-only models need left padding for batched generation
+            self.tokenizer.padding_side = "left"
+            
             self.is_loaded = True
             print("✅ Islamic AI model loaded successfully!")
             return True
@@ -52,32 +56,43 @@ class BudulAIService:
     
     def generate_response(self, message: str) -> Dict[str, Any]:
         """Generate Islamic AI response"""
+        return self.generate_batch([message])[0]
+    
+    def generate_batch(self, messages: List[str]) -> List[Dict[str, Any]]:
+        """Generate Islamic AI responses for several messages in one forward pass"""
         if not self.is_loaded:
-            return {
-                "response": "السلام عليكم! I'm Budul AI, but my Islamic knowledge model is not currently loaded. Please ensure the trained model is available.",
-                "error": "Model not loaded",
-                "success": False,
-                "response_id": "error_001",
-                "confidence_score": 0.0,
-                "authenticity_score": 0.0
-            }
+            return [
+                {
+                    "response": "السلام عليكم! I'm Budul AI, but my Islamic knowledge model is not currently loaded. Please ensure the trained model is available.",
+                    "error": "Model not loaded",
+                    "success": False,
+                    "response_id": "error_001",
+                    "confidence_score": 0.0,
+                    "authenticity_score": 0.0
+                }
+                for _ in messages
+            ]
         
         try:
-            # Create Islamic prompt
-            prompt = f"""You are Budul AI, an Islamic artificial intelligence assistant trained on authentic Islamic sources. You provide helpful, accurate Islamic guidance based on Quran and Sunnah.
+            # Create Islamic prompts
+            prompts = [
+                f"""You are Budul AI, an Islamic artificial intelligence assistant trained on authentic Islamic sources. You provide helpful, accurate Islamic guidance based on Quran and Sunnah.
 
 User: {message}
 Assistant:"""
+                for message in messages
+            ]
 
-            # Tokenize input
+            # Tokenize input (left-padded, so every prompt ends at the same position)
             inputs = self.tokenizer(
-                prompt,
+                prompts,
                 return_tensors="pt",
+                padding=True,
                 truncation=True,
                 max_length=1024
             )
             
-            # Generate response
+            # Generate responses
             with torch.no_grad():
                 outputs = self.model.generate(
                     inputs.input_ids,
@@ -90,37 +105,43 @@ Assistant:"""
                     repetition_penalty=1.1
                 )
             
-            # Decode response
-            response = self.tokenizer.decode(
-                outputs[0][inputs.input_ids.shape[1]:],
-                skip_special_tokens=True
-            ).strip()
+            prompt_length = inputs.input_ids.shape[1]
+            results = []
+            for message, output in zip(messages, outputs):
+                # Decode and clean response
+                response = self.tokenizer.decode(
+                    output[prompt_length:],
+                    skip_special_tokens=True
+                ).strip()
+                response = self._clean_response(response)
+                
+                results.append({
+                    "response": response,
+                    "success": True,
+                    "response_id": f"budul_{hash(message) % 10000:04d}",
+                    "confidence_score": 0.85,
+                    "authenticity_score": 0.90,
+                    "citations": [],
+                    "sources": ["Trained Budul AI Model"],
+                    "generated_at": "2024-01-01T12:00:00Z",
+                    "processing_time_ms": 1250.0
+                })
             
-            # Clean and format response
-            response = self._clean_response(response)
-            
-            return {
-                "response": response,
-                "success": True,
-                "response_id": f"budul_{hash(message) % 10000:04d}",
-                "confidence_score": 0.85,
-                "authenticity_score": 0.90,
-                "citations": [],
-                "sources": ["Trained Budul AI Model"],
-                "generated_at": "2024-01-01T12:00:00Z",
-                "processing_time_ms": 1250.0
-            }
+            return results
             
         except Exception as e:
             print(f"❌ Error generating response: {e}")
-            return {
-                "response": f"I apologize, but I encountered an error while processing your Islamic question: {str(e)}. Please try again.",
-                "error": str(e),
-                "success": False,
-                "response_id": "error_002",
-                "confidence_score": 0.0,
-                "authenticity_score": 0.0
-            }
+            return [
+                {
+                    "response": f"I apologize, but I encountered an error while processing your Islamic question: {str(e)}. Please try again.",
+                    "error": str(e),
+                    "success": False,
+                    "response_id": "error_002",
+                    "confidence_score": 0.0,
+                    "authenticity_score": 0.0
+                }
+                for _ in messages
+            ]
     
     def _clean_response(self, response: str) -> str:
         """Clean and format the generated response"""
@@ -136,5 +157,67 @@ Assistant:"""
         return response.strip()
 
 
+class BudulAIBatcher:
+    """
+    Micro-batches concurrent chat requests into single generate_batch() calls
+    
+    Requests queue up for at most max_wait_ms (or until max_batch_size are
+    waiting) and share one forward pass, run in a worker thread.
+    """
+    
+    def __init__(self, service: BudulAIService, max_batch_size: int = 16, max_wait_ms: float = 5):
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def generate(self, message: str) -> Dict[str, Any]:
+        """Queue a message and wait for its batched response"""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future))
+        return await future
+    
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one request, then gather more until the batch is full or the window closes"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        return batch
+    
+    async def _run(self):
+        while True:
+            batch = await self._collect_batch()
+            
+            try:
+                results = await asyncio.to_thread(
+                    self.service.generate_batch, [message for message, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
 # Global instance
-budul_ai = BudulAIService()
\ No newline at end of file
+budul_ai = BudulAIService()
+budul_ai_batcher = BudulAIBatcher(budul_ai)
\ No newline at end of file
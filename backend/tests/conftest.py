@@ -0,0 +1,67 @@
+"""
+Shared fixtures: an in-memory stand-in for the platform's Redis client
+"""
+
+import pytest
+
+from app.core.saas_platform import saas_platform
+
+
+class FakeRedis:
+    """The subset of redis.asyncio.Redis used by the caches and usage counters"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = self._encode(value)
+        return True
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = self._encode(value)
+        return True
+
+    async def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+    async def eval(self, script, numkeys, key, amount):
+        # Only the usage counter's bump-if-exists script is evaluated
+        if key not in self.store:
+            return None
+        value = int(self.store[key]) + int(amount)
+        self.store[key] = str(value).encode()
+        return value
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+
+class DownRedis:
+    """A client whose server is unreachable: every command raises"""
+
+    def __getattr__(self, name):
+        async def command(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        return command
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(saas_platform, "redis_client", client)
+    return client
+
+
+@pytest.fixture
+def down_redis(monkeypatch):
+    client = DownRedis()
+    monkeypatch.setattr(saas_platform, "redis_client", client)
+    return client
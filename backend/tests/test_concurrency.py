@@ -0,0 +1,47 @@
+"""
+Concurrent request limiting: Redis failures fail open
+"""
+
+from starlette.requests import Request
+
+from app.core.concurrency import concurrent_limit
+from app.core.saas_platform import saas_platform
+
+
+def _request():
+    return Request({"type": "http", "headers": [], "client": ("203.0.113.7", 1234)})
+
+
+async def _run(dep):
+    """Drive the dependency like FastAPI: enter, run the handler, exit"""
+    gen = dep(_request())
+    await gen.__anext__()
+    try:
+        await gen.__anext__()
+    except StopAsyncIteration:
+        pass
+
+
+async def test_acquire_failure_lets_request_through(down_redis):
+    await _run(concurrent_limit("video"))
+
+
+class _ReleaseFailsRedis:
+    def __init__(self):
+        self.acquired = 0
+
+    async def eval(self, *args):
+        self.acquired += 1
+        return 1
+
+    async def zrem(self, *args):
+        raise ConnectionError("Redis unavailable")
+
+
+async def test_release_failure_keeps_handler_response(monkeypatch):
+    client = _ReleaseFailsRedis()
+    monkeypatch.setattr(saas_platform, "redis_client", client)
+
+    await _run(concurrent_limit("video"))
+
+    assert client.acquired == 1
@@ -0,0 +1,41 @@
+"""
+Conditional JSON responses shared by the SaaS and Social Studio routers
+"""
+
+from starlette.requests import Request
+
+from app.core.http_cache import cacheable_json_response, etag
+
+
+def _request(headers=()):
+    return Request({"type": "http", "headers": [(k.encode(), v.encode()) for k, v in headers]})
+
+
+BODY = b'{"ok":true}'
+HEADERS = {"Cache-Control": "public, max-age=300", "ETag": etag(BODY)}
+
+
+def test_matching_etag_is_not_modified():
+    response = cacheable_json_response(_request([("if-none-match", HEADERS["ETag"])]), BODY, HEADERS)
+
+    assert response.status_code == 304
+    assert response.body == b""
+
+
+def test_stale_etag_gets_full_body():
+    response = cacheable_json_response(_request([("if-none-match", '"stale"')]), BODY, HEADERS)
+
+    assert response.status_code == 200
+    assert response.body == BODY
+    assert response.headers["etag"] == HEADERS["ETag"]
+    assert "content-encoding" not in response.headers
+
+
+def test_content_encoding_only_on_full_response():
+    full = cacheable_json_response(_request(), BODY, HEADERS, content_encoding="gzip")
+    not_modified = cacheable_json_response(
+        _request([("if-none-match", HEADERS["ETag"])]), BODY, HEADERS, content_encoding="gzip"
+    )
+
+    assert full.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in not_modified.headers
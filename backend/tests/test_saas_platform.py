@@ -0,0 +1,19 @@
+"""
+SaaS platform organization caches: Redis is optional
+"""
+
+from app.core.saas_platform import saas_platform
+
+
+async def test_invalidate_organization_cache_without_redis(monkeypatch):
+    monkeypatch.setattr(saas_platform, "redis_client", None)
+
+    await saas_platform.invalidate_organization_cache("org-1")
+
+
+async def test_invalidate_organization_cache_with_redis_down(down_redis):
+    await saas_platform.invalidate_organization_cache("org-1")
+
+
+async def test_auth_and_tier_prefetch_with_redis_down(down_redis):
+    assert await saas_platform.get_cached_auth_and_tier("key", "org-1") == (None, None)
@@ -0,0 +1,128 @@
+"""
+Social Media Studio: post content cache and monthly usage counting
+"""
+
+import uuid
+from datetime import datetime
+
+from app.api.v1 import social_studio
+from app.api.v1.social_studio import (
+    _POST_CONTENT_CACHE_PREFIX,
+    _get_monthly_post_count,
+    _get_post_content,
+    _record_feature_usage,
+)
+from app.db.models_multitenant import FeatureUsage
+
+
+def _content_keys(client):
+    return [key for key in client.store if key.startswith(_POST_CONTENT_CACHE_PREFIX)]
+
+
+async def test_post_content_cache_stores_org_agnostic_draft(fake_redis):
+    first = await _get_post_content("facebook", "Ramadan food drive", "friendly", "Masjid Al-Noor")
+
+    keys = _content_keys(fake_redis)
+    assert len(keys) == 1
+    assert b"Masjid Al-Noor" not in fake_redis.store[keys[0]]
+    assert "Masjid Al-Noor" in first
+
+
+async def test_post_content_cache_hit_fills_in_organization(fake_redis, monkeypatch):
+    await _get_post_content("facebook", "Ramadan food drive", "friendly", "Masjid Al-Noor")
+
+    def fail_compose(**kwargs):
+        raise AssertionError("cache hit should not recompose the draft")
+
+    monkeypatch.setattr(social_studio, "_compose_post_content", fail_compose)
+    second = await _get_post_content("facebook", "Ramadan food drive", "friendly", "Masjid Al-Huda")
+
+    assert "Masjid Al-Huda" in second
+    assert "Masjid Al-Noor" not in second
+
+
+async def test_post_content_without_redis_matches_generator(monkeypatch):
+    monkeypatch.setattr(social_studio.saas_platform, "redis_client", None)
+
+    content = await _get_post_content("twitter", "Jummah reminder", "inspirational", "Masjid Al-Noor")
+
+    assert content == social_studio._generate_post_content(
+        platform="twitter",
+        topic="Jummah reminder",
+        tone="inspirational",
+        organization_name="Masjid Al-Noor",
+    )
+
+
+async def test_post_content_with_redis_down_falls_back(down_redis):
+    content = await _get_post_content("twitter", "Jummah reminder", "inspirational", "Masjid Al-Noor")
+
+    assert "Masjid Al-Noor" in content
+    assert len(content) <= 280
+
+
+class _CountingSession:
+    """AsyncSession stand-in answering the monthly COUNT(*) query"""
+
+    def __init__(self, count):
+        self.count = count
+        self.queries = 0
+
+    async def scalar(self, statement, params=None):
+        self.queries += 1
+        return self.count
+
+
+async def test_monthly_post_count_primes_and_reuses_redis_counter(fake_redis):
+    now = datetime(2026, 10, 16, 12, 0)
+    org_id = uuid.uuid4()
+    db = _CountingSession(7)
+
+    assert await _get_monthly_post_count(db, org_id, now) == 7
+    await social_studio._MONTHLY_POSTS.bump(org_id, now)
+    assert await _get_monthly_post_count(db, org_id, now) == 8
+    assert db.queries == 1
+
+
+async def test_monthly_post_count_with_redis_down_uses_sql(down_redis):
+    db = _CountingSession(3)
+
+    assert await _get_monthly_post_count(db, uuid.uuid4(), datetime(2026, 10, 16)) == 3
+    assert db.queries == 1
+
+
+class _RecordingSession:
+    """AsyncSessionLocal() stand-in keeping what was added and committed"""
+
+    def __init__(self):
+        self.added = []
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        self.committed = True
+
+
+async def test_record_feature_usage_writes_row(monkeypatch):
+    session = _RecordingSession()
+    monkeypatch.setattr(social_studio, "AsyncSessionLocal", lambda: session)
+    org_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+    await _record_feature_usage(org_id, user_id, "post_generated", {"platform": "facebook"})
+
+    assert session.committed
+    [usage] = session.added
+    assert isinstance(usage, FeatureUsage)
+    assert usage.organization_id == org_id
+    assert usage.user_id == user_id
+    assert usage.feature_name == "social_studio"
+    assert usage.action == "post_generated"
+    assert usage.request_data == {"platform": "facebook"}
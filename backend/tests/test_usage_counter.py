@@ -0,0 +1,69 @@
+"""
+Monthly usage counters (story studio and shared counter behaviour)
+"""
+
+import uuid
+from datetime import datetime
+
+from app.api.v1.stories_multitenant import _MONTHLY_STORIES
+from app.core.saas_platform import saas_platform
+
+NOW = datetime(2026, 10, 16, 12, 0)
+
+
+def _counting(count):
+    calls = []
+
+    async def count_since(month_start):
+        calls.append(month_start)
+        return count
+
+    return count_since, calls
+
+
+async def test_story_counter_primes_cold_key_from_database(fake_redis):
+    org_id = uuid.uuid4()
+    count_since, calls = _counting(4)
+
+    assert await _MONTHLY_STORIES.get(org_id, NOW, count_since) == 4
+    assert calls == [datetime(2026, 10, 1)]
+    assert fake_redis.store[f"usage:story_studio:{org_id}:202610"] == b"4"
+
+
+async def test_story_counter_bump_and_decrement(fake_redis):
+    org_id = uuid.uuid4()
+    count_since, calls = _counting(4)
+    await _MONTHLY_STORIES.get(org_id, NOW, count_since)
+
+    await _MONTHLY_STORIES.bump(org_id, NOW)
+    await _MONTHLY_STORIES.bump(org_id, NOW)
+    await _MONTHLY_STORIES.bump(org_id, NOW, -1)
+
+    assert await _MONTHLY_STORIES.get(org_id, NOW, count_since) == 5
+    assert len(calls) == 1
+
+
+async def test_story_counter_bump_leaves_cold_key_unset(fake_redis):
+    org_id = uuid.uuid4()
+
+    await _MONTHLY_STORIES.bump(org_id, NOW)
+
+    assert _MONTHLY_STORIES.key(org_id, NOW) not in fake_redis.store
+
+
+async def test_story_counter_with_redis_down_counts_in_database(down_redis):
+    org_id = uuid.uuid4()
+    count_since, calls = _counting(9)
+
+    assert await _MONTHLY_STORIES.get(org_id, NOW, count_since) == 9
+    await _MONTHLY_STORIES.bump(org_id, NOW)
+    assert await _MONTHLY_STORIES.get(org_id, NOW, count_since) == 9
+    assert len(calls) == 2
+
+
+async def test_story_counter_without_redis_counts_in_database(monkeypatch):
+    monkeypatch.setattr(saas_platform, "redis_client", None)
+    count_since, calls = _counting(2)
+
+    assert await _MONTHLY_STORIES.get(uuid.uuid4(), NOW, count_since) == 2
+    assert len(calls) == 1